@@ -0,0 +1,132 @@
+"""HTTP client for the Alpha Vantage quote API.
+
+One pooled session is shared by the process so calls reuse keep-alive
+connections, every call is bounded by connect/read timeouts, and
+transient failures are retried a bounded number of times with
+exponential backoff.  Throttle responses ("Note"/"Information") are
+not retried here; they raise ThrottledError so the caller can wait for
+its call budget instead.
+"""
+
+import datetime
+import os
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from metrics import span
+
+
+class QuoteError(Exception):
+    """Alpha Vantage did not return a usable quote."""
+
+
+class ThrottledError(QuoteError):
+    """Alpha Vantage refused the call because the call budget is spent."""
+
+
+class QuoteClient:
+
+    def __init__(self, base_url=None, api_key=None, connect_timeout=None,
+                 read_timeout=None, retries=None, backoff=0.5, pool_size=4,
+                 sleep=time.sleep):
+        self.base_url = base_url or os.environ.get(
+            'API_BASE_URL', 'https://www.alphavantage.co/query')
+        self.api_key = api_key or os.environ.get('API_KEY')
+        self.timeout = (
+            connect_timeout or float(os.environ.get('API_CONNECT_TIMEOUT', 3.05)),
+            read_timeout or float(os.environ.get('API_READ_TIMEOUT', 10)),
+        )
+        if retries is None:
+            retries = int(os.environ.get('API_RETRIES', 2))
+        self.retries = retries
+        self.backoff = backoff
+        self.sleep = sleep
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+    def _get(self, **params):
+        params['apikey'] = self.api_key
+        error = None
+        for attempt in range(self.retries + 1):
+            if attempt:
+                self.sleep(self.backoff * 2 ** (attempt - 1))
+            try:
+                with span('quote_api'):
+                    r = self.session.get(self.base_url, params=params,
+                                         timeout=self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                error = e
+                continue
+            if r.status_code >= 500:
+                error = QuoteError(f"Alpha Vantage returned {r.status_code}")
+                continue
+            if r.status_code != 200:
+                raise QuoteError(f"Alpha Vantage returned {r.status_code}")
+            try:
+                data = r.json()
+            except ValueError as e:
+                error = e
+                continue
+            return self._check(data)
+        raise QuoteError(f"Alpha Vantage unavailable: {error}") from error
+
+    @staticmethod
+    def _check(data):
+        for key in ("Note", "Information"):
+            if key in data:
+                raise ThrottledError(data[key])
+        if "Error Message" in data:
+            raise QuoteError(data["Error Message"])
+        return data
+
+    def global_quote(self, symbol):
+        """Return (price, trading day) for the latest close of `symbol`.
+
+        The day is the quote's own "latest trading day", so a fetch just
+        after midnight or over a weekend is dated by the session it closed.
+        """
+
+        data = self._get(function='GLOBAL_QUOTE', symbol=symbol)
+        gq = data.get("Global Quote") or {}
+        if "05. price" not in gq:
+            raise QuoteError(f"No quote for {symbol}")
+        try:
+            day = datetime.date.fromisoformat(gq["07. latest trading day"])
+        except (KeyError, ValueError):
+            raise QuoteError(f"No trading day in the quote for {symbol}")
+        return float(gq["05. price"]), day
+
+    def daily_series(self, symbol, full=True):
+        """Return [(date, close)] for `symbol`, oldest first.
+
+        `full` asks for the whole history instead of the last 100 days.
+        """
+
+        data = self._get(function='TIME_SERIES_DAILY', symbol=symbol,
+                         outputsize='full' if full else 'compact')
+        series = data.get("Time Series (Daily)")
+        if not series:
+            raise QuoteError(f"No daily series for {symbol}")
+        return sorted(
+            (datetime.date.fromisoformat(day), float(values["4. close"]))
+            for day, values in series.items())
+
+    def close(self):
+        self.session.close()
+
+
+_client = None
+
+
+def get_client():
+    """Return the process-wide QuoteClient, creating it on first use."""
+
+    global _client
+    if _client is None:
+        _client = QuoteClient()
+    return _client
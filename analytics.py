@@ -0,0 +1,176 @@
+"""Batched risk and return statistics for every portfolio.
+
+Current holdings are loaded as a portfolio x symbol quantity matrix and
+daily closes as a symbol x day price matrix, so each portfolio's value
+over the window is one matrix product: cash + quantities @ prices.
+Daily returns, annualised volatility, maximum drawdown and Sharpe ratio
+are then computed for a whole block of portfolios at once and stored in
+portfolio_stats, where the leaderboard reads its alternative orderings.
+"""
+
+import datetime
+import os
+
+import numpy as np
+
+from models import db, Portfolio, Stock, Quote, PriceHistory, PortfolioStats
+
+TRADING_DAYS = 252
+
+
+def forward_fill(prices):
+    """Fill NaN gaps in each row with the last close before them.
+
+    Leading gaps take the first close, so a symbol listed mid-window is
+    flat until its first day.  Rows with no closes at all stay NaN.
+    """
+
+    missing = np.isnan(prices)
+    if not missing.any():
+        return prices
+    days = np.arange(prices.shape[1])
+    last = np.where(missing, 0, days)
+    np.maximum.accumulate(last, axis=1, out=last)
+    filled = prices[np.arange(prices.shape[0])[:, None], last]
+    first = np.argmax(~missing, axis=1)
+    leading = days[None, :] < first[:, None]
+    filled[leading] = np.broadcast_to(
+        prices[np.arange(prices.shape[0]), first][:, None],
+        prices.shape)[leading]
+    return filled
+
+
+def risk_stats(values, risk_free=0.0):
+    """Per-row stats for a portfolio x day matrix of values.
+
+    Returns a dict of arrays: total_return, volatility and sharpe
+    (annualised from daily returns) and max_drawdown as a fraction of
+    the running peak.  Undefined entries, such as Sharpe for a portfolio
+    that never moves, are NaN.
+    """
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        returns = values[:, 1:] / values[:, :-1] - 1
+        mean = returns.mean(axis=1)
+        std = returns.std(axis=1, ddof=1)
+        sharpe = np.where(
+            std > 0,
+            (mean - risk_free / TRADING_DAYS) / std * np.sqrt(TRADING_DAYS),
+            np.nan)
+        peak = np.maximum.accumulate(values, axis=1)
+        drawdown = np.nanmax(1 - values / peak, axis=1)
+        total = values[:, -1] / values[:, 0] - 1
+    return {
+        'total_return': total,
+        'volatility': std * np.sqrt(TRADING_DAYS),
+        'max_drawdown': drawdown,
+        'sharpe': sharpe,
+    }
+
+
+class PortfolioAnalytics:
+    """Recompute portfolio_stats for every portfolio in batched passes."""
+
+    def __init__(self, days=None, risk_free=None, block=None):
+        if days is None:
+            days = int(os.environ.get('ANALYTICS_DAYS', 365))
+        if risk_free is None:
+            risk_free = float(os.environ.get('ANALYTICS_RISK_FREE', 0.0))
+        if block is None:
+            block = int(os.environ.get('ANALYTICS_BLOCK', 4096))
+        self.days = days
+        self.risk_free = risk_free
+        self.block = block
+
+    def price_matrix(self, symbols, start):
+        """(days, symbol x day closes) from one range scan of price_history.
+
+        Symbols without any history in the window are held flat at their
+        latest quote.
+        """
+
+        position = {symbol: i for i, symbol in enumerate(symbols)}
+        rows = db.session.execute(
+            db.select(PriceHistory.symbol, PriceHistory.day,
+                      PriceHistory.close)
+            .where(PriceHistory.symbol.in_(symbols),
+                   PriceHistory.day >= start)).all()
+        days = sorted({day for _, day, _ in rows})
+        column = {day: i for i, day in enumerate(days)}
+        prices = np.full((len(symbols), max(len(days), 1)), np.nan)
+        if rows:
+            prices[[position[symbol] for symbol, _, _ in rows],
+                   [column[day] for _, day, _ in rows]] = [
+                close for _, _, close in rows]
+        prices = forward_fill(prices)
+
+        unpriced = np.isnan(prices[:, 0])
+        if unpriced.any():
+            latest = dict(db.session.execute(
+                db.select(Quote.symbol, Quote.price)
+                .where(Quote.symbol.in_(
+                    [symbols[i] for i in np.flatnonzero(unpriced)]))).all())
+            for i in np.flatnonzero(unpriced):
+                prices[i] = latest.get(symbols[i]) or 0.0
+        return days, prices
+
+    def load(self):
+        """(portfolio ids, cash, holdings rows) with holdings as index arrays."""
+
+        portfolios = db.session.execute(
+            db.select(Portfolio.id, Portfolio.cash)
+            .order_by(Portfolio.id)).all()
+        ids = np.array([port_id for port_id, _ in portfolios], dtype=np.int64)
+        cash = np.array([cash for _, cash in portfolios], dtype=float)
+
+        holdings = db.session.execute(
+            db.select(Stock.portfolio_id, Stock.symbol,
+                      db.func.sum(Stock.quantity))
+            .group_by(Stock.portfolio_id, Stock.symbol)
+            .having(db.func.sum(Stock.quantity) != 0)).all()
+        symbols = sorted({symbol for _, symbol, _ in holdings})
+        position = {symbol: i for i, symbol in enumerate(symbols)}
+        rows = np.searchsorted(ids, [port_id for port_id, _, _ in holdings])
+        cols = np.array([position[symbol] for _, symbol, _ in holdings],
+                        dtype=np.int64)
+        quantities = np.array([quantity for _, _, quantity in holdings],
+                              dtype=float)
+        order = np.argsort(rows, kind='stable')
+        return ids, cash, symbols, rows[order], cols[order], quantities[order]
+
+    def compute(self, today=None):
+        """Stats arrays for every portfolio, computed a block at a time."""
+
+        today = today or datetime.date.today()
+        ids, cash, symbols, rows, cols, quantities = self.load()
+        days, prices = self.price_matrix(
+            symbols, today - datetime.timedelta(days=self.days))
+
+        stats = {name: np.full(len(ids), np.nan) for name in
+                 ('total_return', 'volatility', 'max_drawdown', 'sharpe')}
+        for start in range(0, len(ids), self.block):
+            stop = min(start + self.block, len(ids))
+            lo, hi = np.searchsorted(rows, [start, stop])
+            weights = np.zeros((stop - start, len(symbols)))
+            np.add.at(weights, (rows[lo:hi] - start, cols[lo:hi]),
+                      quantities[lo:hi])
+            values = cash[start:stop, None] + weights @ prices
+            if values.shape[1] < 2:
+                continue
+            for name, column in risk_stats(values, self.risk_free).items():
+                stats[name][start:stop] = column
+        return ids, len(days), stats
+
+    def run(self, today=None):
+        ids, days, stats = self.compute(today)
+        now = datetime.datetime.now()
+        names = list(stats)
+        rows = [{'portfolio_id': int(port_id), 'days': days,
+                 'computed_at': now,
+                 **{name: None if np.isnan(value) else round(float(value), 6)
+                    for name, value in zip(names, values)}}
+                for port_id, *values in zip(ids, *(stats[name]
+                                                   for name in names))]
+        written = PortfolioStats.replace_all(rows)
+        print(f"Portfolio analytics: {written} portfolios over {days} days")
+        return written
@@ -1,58 +1,167 @@
 import os
 import datetime
-import time
 
-from flask import Flask, render_template, redirect, session, g, flash, request
+import click
+from flask import (Flask, Response, render_template, redirect, session, g,
+                   flash, request, jsonify)
 from sqlalchemy.exc import IntegrityError
-from flask_apscheduler import APScheduler
+from werkzeug.middleware.proxy_fix import ProxyFix
 
-from models import connect_db, User, db, Portfolio, Stock
+from alphavantage import QuoteError, ThrottledError
+from models import (connect_db, User, db, Portfolio, Stock, Quote,
+                    ChangeEvent, PortfolioSnapshot, PortfolioStats, Trade,
+                    DataVersion)
 from forms import NewUserForm, LoginForm, EditUserForm
+from migrations import upgrade
+from passwords import HashingBusy, allow_login
+from refresh import QuoteRefresher, HistoryBackfill
+from analytics import PortfolioAnalytics
+from fragment_cache import fragment_cache
+from broadcaster import broadcaster, StreamsFull
+from leaderboard import board
+from user_cache import user_cache
+import metrics
 
 CURR_USER_KEY = "curr_user"
 
-class Config:
-    SCHEDULER_API_ENABLED = True
-
 app = Flask(__name__)
-app.config.from_object(Config())
-scheduler = APScheduler()
+metrics.init_app(app)
+
+# Behind a load balancer remote_addr is the proxy's, which would make the
+# per-IP login limit a site-wide one; trust X-Forwarded-For from this many
+# proxies.  Only set it when every request really comes through them.
+app.config['PROXY_HOPS'] = int(os.environ.get('PROXY_HOPS', 0))
+if app.config['PROXY_HOPS']:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config['PROXY_HOPS'],
+                            x_proto=app.config['PROXY_HOPS'])
 
 app.config['SQLALCHEMY_DATABASE_URI'] = (
     os.environ.get('DATABASE_URI'))
-scheduler.init_app(app)
-scheduler.start()
 
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['SQLALCHEMY_ECHO'] = False
 app.config['DEBUG_TB_INTERCEPT_REDIRECTS'] = False
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY')
+if not (app.config['SQLALCHEMY_DATABASE_URI'] or '').startswith('sqlite'):
+    # Every thread (or greenlet) that queries needs a connection, so the pool
+    # must cover WEB_THREADS plus the leaderboard rebuild and the SSE poller.
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 10)),
+        'pool_timeout': float(os.environ.get('DB_POOL_TIMEOUT', 10)),
+    }
+# Where pages open their event streams: the gevent `stream` process, routed
+# by the proxy or given as its own origin.  Unset, pages open no streams.
+app.config['STREAM_URL'] = os.environ.get('STREAM_URL')
+app.config['STREAM_ALLOW_ORIGIN'] = os.environ.get('STREAM_ALLOW_ORIGIN')
 
 with app.app_context():
     connect_db(app)
-    db.create_all()
+    upgrade()
+
+
+@app.cli.command('migrate')
+def migrate():
+    """Apply pending schema migrations."""
+
+    upgrade()
+
+
+@app.cli.command('worker')
+def worker():
+    """Run the background job scheduler; see worker.py."""
+
+    from worker import main
+    main()
+
+
+@app.cli.command('refresh-quotes')
+def refresh_quotes():
+    """Refresh stale quotes now, resuming today's run if it was cut short."""
+
+    QuoteRefresher().run()
 
-@scheduler.task('cron', id='scheduled_task', hour=0, minute=1)
-def scheduled_task():
-    print("The scheduled task is running")
-    with app.app_context():
-        results = Stock.update_all()
-        if results != -1:
-            for result in results:
-                time.sleep(60)
-                scheduled_task()
+
+@app.cli.command('backfill-history')
+@click.argument('symbols', nargs=-1)
+@click.option('--compact', is_flag=True,
+              help="Only the last 100 days instead of the full series.")
+def backfill_history(symbols, compact):
+    """Load daily closes for SYMBOLS (default: every quoted symbol)."""
+
+    HistoryBackfill(full=not compact).run(list(symbols))
+
+
+@app.cli.command('compute-stats')
+def compute_stats():
+    """Recompute return, volatility, drawdown and Sharpe for every portfolio."""
+
+    PortfolioAnalytics().run()
+
+
+@app.cli.command('audit-ledger')
+def audit_ledger():
+    """Check each traded portfolio's cash and holdings against its ledger."""
+
+    mismatched = 0
+    for portfolio in Portfolio.with_holdings():
+        replayed = Trade.replay(portfolio.id)
+        if replayed is None:
+            continue
+        stored = {}
+        for stock in portfolio.stocks:
+            stored[stock.symbol] = stored.get(stock.symbol, 0) + stock.quantity
+        stored = {symbol: quantity for symbol, quantity in stored.items()
+                  if quantity}
+        if replayed != (round(float(portfolio.cash), 2), stored):
+            mismatched += 1
+            print(f"Portfolio {portfolio.id}: ledger {replayed}, "
+                  f"stored {(portfolio.cash, stored)}")
+    print(f"{mismatched} portfolios differ from their ledger")
 
 
 ##############################################################################
 # User signup/login/logout
 
 
+class CurrentUser:
+    """Snapshot of the logged-in user.
+
+    Views and templates mostly need only the id and username: the id comes
+    from the signed session and the username from user_cache.  Any other
+    attribute loads the full User row on first use, once per request.
+    """
+
+    def __init__(self, id, username):
+        self.id = id
+        self.username = username
+        self._user = None
+
+    def load(self):
+        if self._user is None:
+            self._user = db.session.get(User, self.id)
+        return self._user
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        user = self.load()
+        if user is None:
+            raise AttributeError(name)
+        return getattr(user, name)
+
+
 @app.before_request
 def add_user_to_g():
     """If we're logged in, add curr user to Flask global."""
 
     if CURR_USER_KEY in session:
-        g.user = User.query.get(session[CURR_USER_KEY])
+        username = user_cache.username(session[CURR_USER_KEY])
+        if username is None:
+            forget_user()
+            g.user = None
+            return
+        g.user = CurrentUser(session[CURR_USER_KEY], username)
 
     else:
         g.user = None
@@ -64,12 +173,17 @@ def do_login(user):
     session[CURR_USER_KEY] = user.id
 
 
+def forget_user():
+    """Log the user out of this session."""
+
+    session.pop(CURR_USER_KEY, None)
+
+
 @app.route('/logout')
 def do_logout():
     """Logout user."""
 
-    if CURR_USER_KEY in session:
-        del session[CURR_USER_KEY]
+    forget_user()
     return redirect('/')
 
 
@@ -79,8 +193,16 @@ def login():
     form = LoginForm()
 
     if form.validate_on_submit():
-        user = User.authenticate(form.username.data,
-                                 form.password.data)
+        if not allow_login(form.username.data, request.remote_addr):
+            flash("Too many login attempts. Try again in a minute.", 'danger')
+            return render_template('users/login.html', form=form), 429
+
+        try:
+            user = User.authenticate(form.username.data,
+                                     form.password.data)
+        except HashingBusy:
+            flash("The site is busy. Please try again.", 'danger')
+            return render_template('users/login.html', form=form), 503
 
         if user:
             do_login(user)
@@ -114,6 +236,10 @@ def signup():
             flash("Username already taken")
             return render_template('users/signup.html')
 
+        except HashingBusy:
+            flash("The site is busy. Please try again.", 'danger')
+            return render_template('users/signup.html', form=form), 503
+
     else:
         return render_template('users/signup.html', form=form)
 
@@ -142,7 +268,7 @@ def user_profile(user_id):
         return redirect("/")
 
     user = User.query.get_or_404(user_id)
-    portfolios = Portfolio.query.filter(Portfolio.user_id == user_id)
+    portfolios = Portfolio.for_user(user_id)
     return render_template('/users/profile.html', user=user, portfolios=portfolios)
 
 
@@ -159,14 +285,26 @@ def edit_profile(user_id):
     form = EditUserForm(obj=user)
 
     if form.validate_on_submit():
+        try:
+            authorized = user.check_password(form.password.data)
+        except HashingBusy:
+            flash("The site is busy. Please try again.", 'danger')
+            return render_template('users/edit.html', form=form, user=user), 503
+        if not authorized:
+            flash("Invalid password.", 'danger')
+            return render_template('users/edit.html', form=form, user=user)
+
+        if user.username != form.username.data:
+            ChangeEvent.touched([portfolio.id for portfolio in
+                                 Portfolio.for_user(user_id)])
         user.id = user_id
         user.email = form.email.data
         user.username = form.username.data
         user.image_url = form.image_url.data
         user.bio = form.bio.data
         try:
-            User.authenticate(form.username.data, form.password.data)
             db.session.commit()
+            user_cache.evict(user_id)
             return redirect(f'/user/{user_id}')
 
         except IntegrityError:
@@ -177,17 +315,25 @@ def edit_profile(user_id):
         return render_template('users/edit.html', form=form, user=user)
 
 
-@app.route('/search', methods=["POST"])
+@app.route('/search', methods=["GET", "POST"])
 def search_users():
 
-    search = request.form['query']
+    search = request.values.get('query', '').strip()
+    page = max(request.args.get('page', 1, type=int), 1)
+    users, has_next = User.search(search, page)
 
-    if not search:
-        users = User.query.limit(10)
-    else:
-        users = User.query.filter(User.username.like(f"%{search}%")).all()
+    return render_template('users/search.html', users=users, query=search,
+                           page=page, has_next=has_next)
 
-    return render_template('users/search.html', users=users)
+
+@app.route('/search/autocomplete')
+def autocomplete_users():
+
+    search = request.args.get('q', '').strip()
+    if not search:
+        return jsonify([])
+    return jsonify([{'id': user_id, 'username': username}
+                    for user_id, username in User.autocomplete(search)])
 
 
 @app.route('/user/<int:user_id>/delete')
@@ -198,12 +344,13 @@ def delete_user(user_id):
         return redirect("/")
 
     user = User.query.get_or_404(user_id)
-    for portfolio in user.portfolios:
-        for stock in portfolio.stocks:
-            db.session.delete(stock)
-        db.session.delete(portfolio)
+    Portfolio.delete_many([portfolio.id for portfolio in
+                           Portfolio.for_user(user_id)])
     db.session.delete(user)
     db.session.commit()
+    user_cache.evict(user_id)
+    if user_id == g.user.id:
+        forget_user()
     return redirect('/')
 
 ###############################################################################################################
@@ -225,6 +372,9 @@ def new_portfolio():
         user_id=userId
     )
     db.session.add(portfolio)
+    db.session.flush()
+    ChangeEvent.net_worths([(portfolio.id, portfolio.net_worth)])
+    DataVersion.bump('portfolios')
     db.session.commit()
 
     return redirect(f"/user/{userId}")
@@ -233,10 +383,30 @@ def new_portfolio():
 @app.route('/portfolios/<int:port_id>')
 def portfolio(port_id):
 
-    portfolio = Portfolio.query.get_or_404(port_id)
-    net_worth = portfolio.update_net_worth()
-    portfolio.net_worth = net_worth
-    return render_template('/portfolios/portfolio.html', portfolio=portfolio)
+    def render():
+        portfolio = Portfolio.with_holdings().filter_by(
+            id=port_id).first_or_404()
+        prices, net_worth = portfolio.valuation()
+        return render_template('/portfolios/holdings.html',
+                               portfolio=portfolio, prices=prices,
+                               net_worth=net_worth)
+
+    key = fragment_cache.portfolio_key(port_id, DataVersion.get('quotes'))
+    holdings = fragment_cache.fetch(key, render)
+    board.sync()
+    rank = board.rank_of(port_id)
+    return render_template('/portfolios/portfolio.html', port_id=port_id,
+                           holdings=holdings, rank=rank, ranked=len(board))
+
+
+@app.route('/portfolios/<int:port_id>/history')
+def portfolio_history(port_id):
+
+    days = request.args.get('days', 365, type=int)
+    start = datetime.date.today() - datetime.timedelta(days=days)
+    dates, net_worths = PortfolioSnapshot.history(port_id, start)
+    return jsonify(days=[day.isoformat() for day in dates],
+                   net_worth=net_worths)
 
 
 @app.route('/portfolios/<int:port_id>/edit', methods=["GET", "POST"])
@@ -247,27 +417,23 @@ def edit_portfolio(port_id):
             flash("Access unauthorized.", "danger")
             return redirect("/")
 
-        portfolio = Portfolio.query.get_or_404(port_id)
-
-        portfolio.cash = request.form["cash"]
+        portfolio = Portfolio.with_holdings().filter_by(
+            id=port_id).first_or_404()
 
-        for stock in portfolio.stocks:
-            quantity = request.form[f"{stock.symbol}"]
-            quantity = int(quantity)
-            if quantity == 0:
-                db.session.delete(stock)
-            else:
-                stock.quantity = quantity
-
-        portfolio.update_net_worth()
-        db.session.commit()
+        quantities = {stock.symbol: request.form.get(stock.symbol, type=int)
+                      for stock in portfolio.stocks
+                      if stock.symbol in request.form}
+        try:
+            portfolio.apply_holdings(quantities)
+        except ValueError as e:
+            db.session.rollback()
+            flash(str(e), "danger")
         return redirect(f'/portfolios/{portfolio.id}/edit')
 
     else:
-        portfolio = Portfolio.query.get_or_404(port_id)
-        for stock in portfolio.stocks:
-            stock.update()
-        stocks = Stock.updated_stocks()
+        portfolio = Portfolio.with_holdings().filter_by(
+            id=port_id).first_or_404()
+        stocks = Quote.available_today()
         return render_template('/portfolios/edit.html', portfolio=portfolio, stocks=stocks)
 
 
@@ -280,35 +446,127 @@ def get_stock():
 
     symbol = request.form['stock-search']
     port_id = request.form['portfolio-id']
-    stock = Stock(
-        symbol=symbol,
-        portfolio_id=port_id,
-    )
-    db.session.add(stock)
-    db.session.commit()
-    try:
-        simStock = Stock.query.filter_by(symbol=symbol).first()
-        today = datetime.date.today()
-        if simStock.update_date == today:
-            stock.price = simStock.price
-            stock.update_date = today
+    quantity = request.form.get('quantity', 0, type=int)
+    portfolio = Portfolio.query.get_or_404(port_id)
+    quote = Quote.for_symbol(symbol)
+    throttled = False
+    if quote.update_date is None:
+        # A symbol nobody has priced yet; everything else is left to the
+        # worker's refresh.
+        try:
+            quote.fetch()
+        except ThrottledError:
+            throttled = True
+        except QuoteError:
+            pass
+        db.session.commit()
+        if quote.update_date is not None and quote.holdings:
+            Portfolio.revalue_holders(symbol)
+    if quote.update_date is None:
+        if not quote.holdings:
+            db.session.delete(quote)
             db.session.commit()
+        if throttled:
+            flash("Quotes are busy. Please try again shortly.", "danger")
         else:
-            stock.update()
-        return redirect(f'/portfolios/{port_id}/edit')
-    except:
-        stock.update()
-        return redirect(f'/portfolios/{port_id}/edit')
-    finally:
-        flash("stock symbol does not exist")
+            flash("stock symbol does not exist")
         return redirect(f'/portfolios/{port_id}/edit')
 
+    if not any(stock.symbol == symbol for stock in portfolio.stocks):
+        db.session.add(Stock(symbol=symbol, portfolio_id=portfolio.id))
+        ChangeEvent.touched([portfolio.id])
+        DataVersion.bump('portfolios')
+        db.session.commit()
+    if quantity:
+        try:
+            portfolio.apply_holdings({}, bought={symbol: quantity})
+        except ValueError as e:
+            db.session.rollback()
+            flash(str(e), "danger")
+    return redirect(f'/portfolios/{port_id}/edit')
+
 
 @app.route("/portfolios/leaderboard")
 def leaderboard():
-    portfolios = Portfolio.query.order_by(
-        Portfolio.net_worth.desc()).limit(10)
-    return render_template('/portfolios/leaders.html', portfolios=portfolios)
+    page = max(request.args.get('page', 1, type=int), 1)
+    order = request.args.get('order', 'net_worth')
+    if order not in PortfolioStats.ORDERINGS:
+        order = 'net_worth'
+    per_page = 10
+
+    def render():
+        if order == 'net_worth':
+            board.sync()
+            ranks = board.page(page, per_page)
+            ranked = len(board)
+        else:
+            ranks = PortfolioStats.page(order, page, per_page)
+            ranked = PortfolioStats.count()
+        ids = [port_id for _, port_id, _ in ranks]
+        portfolios = {portfolio.id: portfolio for portfolio in
+                      Portfolio.query.filter(Portfolio.id.in_(ids))}
+        leaders = [(rank, portfolios[port_id], value)
+                   for rank, port_id, value in ranks if port_id in portfolios]
+        has_next = page * per_page < ranked
+        return render_template('/portfolios/leaders_table.html',
+                               leaders=leaders, page=page, has_next=has_next,
+                               order=order)
+
+    key = f"leaders:{order}:{page}:p{DataVersion.get('portfolios')}"
+    table = fragment_cache.fetch(key, render)
+    return render_template('/portfolios/leaders.html', table=table)
+
+
+@app.route("/fragments/cache")
+def fragment_cache_stats():
+    return jsonify(fragment_cache.stats())
+
+
+@app.route("/stream")
+def stream():
+    """Server-sent quote and net-worth updates for the symbols and portfolios
+    a page is showing: /stream?symbols=AAPL,MSFT&portfolios=3,7"""
+
+    symbols = {symbol.strip() for symbol in
+               request.args.get('symbols', '').split(',') if symbol.strip()}
+    portfolios = {port_id.strip() for port_id in
+                  request.args.get('portfolios', '').split(',')
+                  if port_id.strip().isdigit()}
+    topics = ({('quote', symbol) for symbol in symbols}
+              | {('net_worth', port_id) for port_id in portfolios})
+    if not topics or len(topics) > 200:
+        return jsonify(error="Give between 1 and 200 symbols and portfolios"), 400
+
+    headers = {'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    if app.config['STREAM_ALLOW_ORIGIN']:
+        headers['Access-Control-Allow-Origin'] = app.config['STREAM_ALLOW_ORIGIN']
+    try:
+        subscription = broadcaster.subscribe(
+            topics, app, request.headers.get('Last-Event-ID', type=int))
+    except StreamsFull:
+        # The page keeps working, just without live prices.
+        headers['Retry-After'] = '30'
+        return Response("Too many open streams", 503, headers=headers,
+                        mimetype='text/plain')
+    return Response(broadcaster.stream(subscription),
+                    mimetype='text/event-stream', headers=headers)
+
+
+@app.route("/stream/stats")
+def stream_stats():
+    return jsonify(broadcaster.stats())
+
+
+metrics.registry.collector('investor_fragment_cache', fragment_cache.stats)
+metrics.registry.collector('investor_sse', broadcaster.stats)
+
+
+@app.route("/metrics")
+def metrics_endpoint():
+    """Request, SQL, quote API, hashing and job metrics for Prometheus."""
+
+    return Response(metrics.registry.render(),
+                    mimetype='text/plain; version=0.0.4')
 
 
 @app.route("/portfolios/<int:port_id>/delete")
@@ -318,11 +576,106 @@ def delete_portfolio(port_id):
         flash("Access unauthorized.", "danger")
         return redirect("/")
 
-    portfolio = Portfolio.query.get_or_404(port_id)
-
-    for stock in portfolio.stocks:
-        db.session.delete(stock)
-
-    db.session.delete(portfolio)
+    Portfolio.query.get_or_404(port_id)
+    Portfolio.delete_many([port_id])
     db.session.commit()
     return redirect(f"/user/{g.user.id}")
+
+
+###############################################################################################################
+# JSON API
+#
+# Responses carry a strong ETag built from the DataVersion counters they
+# depend on, and are built only from the database, so the same versions
+# always mean the same body.  A matching If-None-Match costs one query
+# and returns 304 without touching portfolios or quotes.
+
+
+def versioned_json(names, build):
+    """JSON from build(), or 304 if the client already has these versions."""
+
+    etag = 'v1-' + '-'.join(f"{name}{version}" for name, version
+                            in zip(names, DataVersion.many(names)))
+    if etag in request.if_none_match:
+        response = app.response_class(status=304)
+    else:
+        response = jsonify(build())
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+
+def portfolio_json(portfolio):
+    return {
+        'id': portfolio.id,
+        'name': portfolio.name,
+        'user_id': portfolio.user_id,
+        'created_at': portfolio.created_at.isoformat(),
+        'cash': portfolio.cash,
+        'net_worth': portfolio.net_worth,
+    }
+
+
+@app.route('/api/v1/leaderboard')
+def api_leaderboard():
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = min(max(request.args.get('per_page', 10, type=int), 1), 100)
+    order = request.args.get('order', 'net_worth')
+    if order != 'net_worth' and order not in PortfolioStats.ORDERINGS:
+        return jsonify(error=f"Unknown order {order!r}"), 400
+
+    def build():
+        if order == 'net_worth':
+            portfolios = Portfolio.query.order_by(
+                Portfolio.net_worth.desc(), Portfolio.id).offset(
+                (page - 1) * per_page).limit(per_page + 1).all()
+            ranks = [(rank, portfolio.id, portfolio.net_worth) for rank,
+                     portfolio in enumerate(portfolios, (page - 1) * per_page + 1)]
+        else:
+            ranks = PortfolioStats.page(order, page, per_page + 1)
+            portfolios = Portfolio.query.filter(
+                Portfolio.id.in_([port_id for _, port_id, _ in ranks])).all()
+        by_id = {portfolio.id: portfolio for portfolio in portfolios}
+        leaders = [dict(portfolio_json(by_id[port_id]), rank=rank, value=value)
+                   for rank, port_id, value in ranks[:per_page]
+                   if port_id in by_id]
+        return {'order': order, 'page': page, 'per_page': per_page,
+                'has_next': len(ranks) > per_page, 'leaders': leaders}
+
+    return versioned_json(['portfolios'], build)
+
+
+@app.route('/api/v1/portfolios/<int:port_id>')
+def api_portfolio(port_id):
+
+    def build():
+        portfolio = Portfolio.with_holdings().filter_by(
+            id=port_id).first_or_404()
+        holdings = [{
+            'symbol': stock.symbol,
+            'quantity': stock.quantity,
+            'price': stock.price,
+            'update_date': stock.update_date and stock.update_date.isoformat(),
+            'value': round(stock.quantity * (stock.price or 0), 2),
+        } for stock in sorted(portfolio.stocks, key=lambda stock: stock.id)]
+        return dict(portfolio_json(portfolio), holdings=holdings)
+
+    return versioned_json(['portfolios', 'quotes'], build)
+
+
+@app.route('/api/v1/quotes')
+def api_quotes():
+    symbols = [symbol.strip() for symbol in
+               request.args.get('symbols', '').split(',') if symbol.strip()]
+
+    def build():
+        query = Quote.query.order_by(Quote.symbol)
+        if symbols:
+            query = query.filter(Quote.symbol.in_(symbols))
+        return {'quotes': [{
+            'symbol': quote.symbol,
+            'price': quote.price,
+            'update_date': quote.update_date and quote.update_date.isoformat(),
+        } for quote in query]}
+
+    return versioned_json(['quotes'], build)
@@ -0,0 +1,128 @@
+"""Benchmark rebuilding a portfolio's holdings from its trade ledger.
+
+Writes a ledger of TRADES trades for one portfolio through Trade.record,
+so snapshots land every LEDGER_SNAPSHOT_EVERY trades just as they do in
+the app, then times Trade.replay (latest snapshot plus the tail) against
+replaying the whole ledger from the opening snapshot.
+
+    python -m bench.ledger_replay --trades 50000
+
+Uses a throwaway SQLite file unless --database is given.  Prints JSON.
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import time
+
+from flask import Flask
+
+from models import (connect_db, db, Portfolio, Trade, LedgerSnapshot,
+                    LEDGER_SNAPSHOT_EVERY)
+
+SYMBOLS = [f"SYM{i}" for i in range(25)]
+
+
+def build_ledger(portfolio_id, trades, per_edit, seed):
+    """Record `trades` random trades in edits of `per_edit` changes."""
+
+    rng = random.Random(seed)
+    cash, holdings = 1e9, {}
+    written = 0
+    while written < trades:
+        opening = (cash, dict(holdings))
+        changes = []
+        for symbol in rng.sample(SYMBOLS, min(per_edit, trades - written)):
+            old = holdings.get(symbol, 0)
+            new = max(old + rng.randint(-old, 50), 0)
+            if new == old:
+                new = old + 1
+            price = round(rng.uniform(5, 500), 2)
+            cash = Trade.settle(cash, old - new, price)
+            holdings[symbol] = new
+            changes.append((symbol, old, new, price))
+        Trade.record(portfolio_id, changes, opening)
+        written += len(changes)
+    db.session.commit()
+    return cash, {symbol: quantity for symbol, quantity in holdings.items()
+                  if quantity}
+
+
+def best_of(repeat, fn):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        timings.append(time.perf_counter() - start)
+        db.session.rollback()
+    return min(timings), result
+
+
+def full_replay(portfolio_id):
+    opening = LedgerSnapshot.query.filter_by(
+        portfolio_id=portfolio_id, trade_id=0).one()
+    return Trade.apply(opening.cash, opening.holdings, db.session.execute(
+        db.select(Trade.side, Trade.symbol, Trade.quantity, Trade.price)
+        .where(Trade.portfolio_id == portfolio_id).order_by(Trade.id)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--trades', type=int, default=50000)
+    parser.add_argument('--per-edit', type=int, default=5)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--database', help="SQLAlchemy URI (default: temp SQLite)")
+    args = parser.parse_args()
+
+    tmpdir = None
+    uri = args.database
+    if uri is None:
+        tmpdir = tempfile.mkdtemp()
+        uri = f"sqlite:///{os.path.join(tmpdir, 'ledger.db')}"
+
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = uri
+    connect_db(app)
+    with app.app_context():
+        db.create_all()
+        portfolio = Portfolio(name=f"bench-ledger-{time.time_ns()}", cash=1e9)
+        db.session.add(portfolio)
+        db.session.commit()
+
+        start = time.perf_counter()
+        expected = build_ledger(portfolio.id, args.trades, args.per_edit,
+                                args.seed)
+        build = time.perf_counter() - start
+
+        tail, replayed = best_of(args.repeat,
+                                 lambda: Trade.replay(portfolio.id))
+        full, rebuilt = best_of(args.repeat,
+                                lambda: full_replay(portfolio.id))
+        snapshots = LedgerSnapshot.query.filter_by(
+            portfolio_id=portfolio.id).count()
+
+        print(json.dumps({
+            'trades': args.trades,
+            'snapshot_every': LEDGER_SNAPSHOT_EVERY,
+            'snapshots': snapshots,
+            'build_seconds': round(build, 3),
+            'replay_tail_ms': round(tail * 1000, 3),
+            'replay_full_ms': round(full * 1000, 3),
+            'speedup': round(full / tail, 1) if tail else None,
+            'consistent': replayed == expected == rebuilt,
+        }, indent=2))
+
+        if args.database:
+            Portfolio.delete_many([portfolio.id])
+            db.session.execute(db.delete(Trade).where(
+                Trade.portfolio_id == portfolio.id))
+            db.session.execute(db.delete(LedgerSnapshot).where(
+                LedgerSnapshot.portfolio_id == portfolio.id))
+            db.session.commit()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,302 @@
+"""End-to-end benchmark of the main routes against a stub Alpha Vantage.
+
+Seeds a throwaway database with seed.generate, starts the stub quote
+server and the app on local threaded HTTP servers, then drives each flow
+at each concurrency level and prints one JSON document:
+
+    python -m bench.routes --concurrency 1 4 16 --requests 300 > before.json
+    python -m bench.routes --concurrency 1 4 16 --requests 300 --compare before.json
+
+For every (flow, concurrency) cell it records throughput, latency
+percentiles, the SQL statements per request and the quote API calls the
+cell made.  --compare adds throughput and p90 ratios against an earlier
+run.
+
+Flows: leaderboard, portfolio, edit (view the edit page, then save it),
+search and login.  CSRF is switched
+off and the per-IP login allowance raised so the load generator is not
+refused; everything else runs as configured by the usual env vars.
+"""
+
+import argparse
+import contextlib
+import datetime
+import json
+import logging
+import os
+import queue
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+FLOWS = ['leaderboard', 'portfolio', 'edit', 'search', 'login']
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument('--flows', nargs='+', default=FLOWS, choices=FLOWS)
+    parser.add_argument('--concurrency', nargs='+', type=int,
+                        default=[1, 4, 16])
+    parser.add_argument('--requests', type=int, default=200,
+                        help="requests per flow and concurrency level")
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--portfolios', type=int, default=5000)
+    parser.add_argument('--holdings', type=int, default=50000)
+    parser.add_argument('--symbols', type=int, default=200)
+    parser.add_argument('--history-days', type=int, default=0)
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help="stub Alpha Vantage latency in seconds")
+    parser.add_argument('--stale-quotes', action='store_true',
+                        help="date seeded quotes yesterday so routes refresh them")
+    parser.add_argument('--bcrypt-rounds', type=int, default=None)
+    parser.add_argument('--database', help="SQLAlchemy URI; DROPPED and reseeded "
+                                           "(default: temp SQLite)")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help="write JSON here instead of stdout")
+    parser.add_argument('--compare', help="earlier JSON output to compare with")
+    return parser.parse_args()
+
+
+def configure(args, stub_url):
+    """Environment for the app; must run before the app is imported."""
+
+    database = args.database
+    if database is None:
+        database = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    os.environ['DATABASE_URI'] = database
+    os.environ['API_BASE_URL'] = stub_url
+    os.environ.setdefault('API_KEY', 'bench')
+    os.environ.setdefault('SECRET_KEY', 'bench')
+    os.environ.setdefault('LOGIN_ATTEMPTS_PER_IP', '1000000000')
+    if args.bcrypt_rounds is not None:
+        os.environ['BCRYPT_ROUNDS'] = str(args.bcrypt_rounds)
+
+
+class SQLCounter:
+    """Statements executed per route, counted inside the app process."""
+
+    def __init__(self, app, engine):
+        from flask import g, has_request_context, request
+        from sqlalchemy import event
+
+        self.lock = threading.Lock()
+        self.counts = {}
+
+        @event.listens_for(engine, 'before_cursor_execute')
+        def count(*_):
+            if has_request_context():
+                g.bench_sql = g.get('bench_sql', 0) + 1
+
+        @app.after_request
+        def record(response):
+            rule = request.url_rule.rule if request.url_rule else request.path
+            with self.lock:
+                self.counts.setdefault(rule, []).append(g.get('bench_sql', 0))
+            return response
+
+    def take(self):
+        with self.lock:
+            counts, self.counts = self.counts, {}
+        return {rule: round(statistics.mean(values), 2)
+                for rule, values in counts.items()}
+
+
+def login_sessions(base, count, users, password, rng):
+    """`count` logged-in HTTP sessions, made before any timing starts."""
+
+    sessions = queue.Queue()
+    for _ in range(count):
+        session = requests.Session()
+        session.post(f"{base}/login", allow_redirects=False, data={
+            'username': f"user{rng.randint(1, users)}", 'password': password})
+        sessions.put(session)
+    return sessions
+
+
+def make_flows(base, data, users, password):
+    portfolio_ids = list(data)
+
+    def leaderboard(session, rng):
+        return session.get(f"{base}/portfolios/leaderboard",
+                           params={'page': rng.randint(1, 20)})
+
+    def portfolio(session, rng):
+        return session.get(f"{base}/portfolios/{rng.choice(portfolio_ids)}")
+
+    def edit(session, rng):
+        port_id = rng.choice(portfolio_ids)
+        session.get(f"{base}/portfolios/{port_id}/edit")
+        holdings = data[port_id]
+        form = {}
+        if holdings:
+            symbol, quantity = rng.choice(holdings)
+            form[symbol] = max(quantity + rng.choice((-1, 1)), 0)
+        return session.post(f"{base}/portfolios/{port_id}/edit", data=form,
+                            allow_redirects=False)
+
+    def search(session, rng):
+        return session.get(f"{base}/search",
+                           params={'query': f"user{rng.randint(1, 99)}"})
+
+    def login(session, rng):
+        return requests.post(f"{base}/login", allow_redirects=False, data={
+            'username': f"user{rng.randint(1, users)}", 'password': password})
+
+    return {'leaderboard': leaderboard, 'portfolio': portfolio, 'edit': edit,
+            'search': search, 'login': login}
+
+
+def percentile(values, fraction):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+
+def run_cell(flow, concurrency, count, seed, sessions):
+    latencies = []
+    errors = 0
+    lock = threading.Lock()
+
+    def one(i):
+        nonlocal errors
+        rng = random.Random(seed * 1000003 + i)
+        session = sessions.get()
+        start = time.perf_counter()
+        try:
+            response = flow(session, rng)
+            failed = response.status_code >= 400
+        except requests.RequestException:
+            failed = True
+        elapsed = time.perf_counter() - start
+        sessions.put(session)
+        with lock:
+            latencies.append(elapsed)
+            errors += failed
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        list(pool.map(one, range(count)))
+    seconds = time.perf_counter() - start
+    return {
+        'requests': count,
+        'errors': errors,
+        'seconds': round(seconds, 3),
+        'rps': round(count / seconds, 1),
+        'p50_ms': round(percentile(latencies, 0.50) * 1000, 2),
+        'p90_ms': round(percentile(latencies, 0.90) * 1000, 2),
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 2),
+        'max_ms': round(max(latencies) * 1000, 2),
+    }
+
+
+def compare(results, baseline):
+    """{flow: {concurrency: {rps_ratio, p90_ratio}}} against a baseline run."""
+
+    out = {}
+    for flow, levels in results.items():
+        for level, cell in levels.items():
+            before = baseline.get('results', {}).get(flow, {}).get(level)
+            if not before:
+                continue
+            out.setdefault(flow, {})[level] = {
+                'rps_ratio': round(cell['rps'] / before['rps'], 2),
+                'p90_ratio': round(cell['p90_ms'] / before['p90_ms'], 2),
+            }
+    return out
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                              capture_output=True, text=True).stdout.strip()
+    except OSError:
+        return None
+
+
+def main():
+    args = parse_args()
+
+    from stub_alphavantage import serve
+    stub, stub_state = serve(latency=args.latency)
+    configure(args, f"http://127.0.0.1:{stub.server_port}/query")
+
+    # Migrations and the seeder report progress on stdout, which is
+    # reserved for the JSON report.
+    with contextlib.redirect_stdout(sys.stderr):
+        from werkzeug.serving import make_server
+        from app import app
+        from migrations import upgrade
+        from models import db, Quote, Stock
+        from seed import generate
+
+        password = 'benchmark'
+        app.config['WTF_CSRF_ENABLED'] = False
+        with app.app_context():
+            db.drop_all()
+            upgrade()
+            generate(args.users, args.portfolios, args.holdings, args.symbols,
+                     1.1, args.history_days, password, args.seed)
+            if args.stale_quotes:
+                db.session.execute(db.update(Quote).values(
+                    update_date=datetime.date.today()
+                    - datetime.timedelta(days=1)))
+                db.session.commit()
+            data = {}
+            for port_id, symbol, quantity in db.session.execute(
+                    db.select(Stock.portfolio_id, Stock.symbol,
+                              Stock.quantity)):
+                data.setdefault(port_id, []).append((symbol, quantity))
+            for port_id in range(1, args.portfolios + 1):
+                data.setdefault(port_id, [])
+            counter = SQLCounter(app, db.engine)
+
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_port}"
+    flows = make_flows(base, data, args.users, password)
+    sessions = login_sessions(base, max(args.concurrency), args.users,
+                              password, random.Random(args.seed))
+
+    results = {}
+    for name in args.flows:
+        for level in args.concurrency:
+            print(f"{name} x{level}...", file=sys.stderr)
+            counter.take()
+            calls = stub_state.stats()['calls']
+            cell = run_cell(flows[name], level, args.requests, args.seed,
+                            sessions)
+            cell['sql_per_request'] = counter.take()
+            cell['quote_api_calls'] = stub_state.stats()['calls'] - calls
+            results.setdefault(name, {})[str(level)] = cell
+
+    report = {
+        'commit': git_commit(),
+        'created_at': datetime.datetime.now().isoformat(timespec='seconds'),
+        'config': {key: value for key, value in vars(args).items()
+                   if key not in ('output', 'compare')},
+        'results': results,
+    }
+    if args.compare:
+        with open(args.compare) as f:
+            report['compared_to'] = args.compare
+            report['ratios'] = compare(results, json.load(f))
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    server.shutdown()
+    stub.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,192 @@
+"""Fan-out of change events to server-sent event streams.
+
+Each process runs one poller thread that tails change_events while anyone
+is subscribed, and hands every event to the subscribers of its topic, a
+(kind, key) pair such as ('quote', 'AAPL') or ('net_worth', '12').  An
+idle stream costs a queue and whatever is waiting on it: a whole thread
+under gthread, a greenlet under the Procfile's gevent `stream` process.
+Streams hold no database connection; the database is polled once per
+process however many pages are open.  At most SSE_MAX_STREAMS streams are
+open per process, so streams can never take every web thread.
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+
+from change_feed import FeedCursor
+from models import db, ChangeEvent
+
+
+class StreamsFull(Exception):
+    """The process already has max_streams streams open."""
+
+
+class Subscription:
+
+    def __init__(self, topics, maxsize):
+        self.topics = topics
+        self.queue = queue.Queue(maxsize)
+        self.dropped = 0
+
+
+class Broadcaster:
+
+    def __init__(self, poll_seconds=None, queue_size=None, keepalive=None,
+                 max_seconds=None, max_streams=None, gap_seconds=None):
+        if poll_seconds is None:
+            poll_seconds = float(os.environ.get('SSE_POLL_SECONDS', 1))
+        if queue_size is None:
+            queue_size = int(os.environ.get('SSE_QUEUE_SIZE', 256))
+        if keepalive is None:
+            keepalive = float(os.environ.get('SSE_KEEPALIVE_SECONDS', 15))
+        if max_seconds is None:
+            max_seconds = float(os.environ.get('SSE_MAX_SECONDS', 300))
+        if max_streams is None:
+            max_streams = int(os.environ.get('SSE_MAX_STREAMS', 4))
+        if gap_seconds is None:
+            gap_seconds = float(os.environ.get('SSE_GAP_SECONDS', 60))
+        self.poll_seconds = poll_seconds
+        self.queue_size = queue_size
+        self.keepalive = keepalive
+        self.max_seconds = max_seconds
+        self.max_streams = max_streams
+        self.gap_seconds = gap_seconds
+        self.lock = threading.Lock()
+        self.topics = {}
+        self.subscribers = 0
+        self.cursor = None
+        self.thread = None
+        self.published = 0
+        self.delivered = 0
+        self.dropped = 0
+        self.refused = 0
+
+    def subscribe(self, topics, app, last_id=None):
+        """Register for `topics`, replaying events after `last_id` if given."""
+
+        subscription = Subscription(frozenset(topics), self.queue_size)
+        with self.lock:
+            if self.subscribers >= self.max_streams:
+                self.refused += 1
+                raise StreamsFull()
+            for topic in subscription.topics:
+                self.topics.setdefault(topic, set()).add(subscription)
+            self.subscribers += 1
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(
+                    target=self.poll, args=(app,), daemon=True,
+                    name='sse-broadcaster')
+                self.thread.start()
+        if last_id is not None:
+            try:
+                for event in ChangeEvent.since(last_id):
+                    if (event.kind, event.key) in subscription.topics:
+                        self.deliver(subscription, event)
+            except Exception:
+                self.unsubscribe(subscription)
+                raise
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self.lock:
+            for topic in subscription.topics:
+                subscribers = self.topics.get(topic)
+                if subscribers is not None:
+                    subscribers.discard(subscription)
+                    if not subscribers:
+                        del self.topics[topic]
+            self.subscribers -= 1
+
+    def deliver(self, subscription, event):
+        try:
+            subscription.queue.put_nowait(event)
+        except queue.Full:
+            subscription.dropped += 1
+            with self.lock:
+                self.dropped += 1
+        else:
+            with self.lock:
+                self.delivered += 1
+
+    def publish(self, event):
+        """Hand one event to every subscriber of its topic."""
+
+        with self.lock:
+            subscribers = list(self.topics.get((event.kind, event.key), ()))
+            self.published += 1
+        for subscription in subscribers:
+            self.deliver(subscription, event)
+
+    def poll(self, app):
+        while True:
+            time.sleep(self.poll_seconds)
+            with self.lock:
+                if not self.subscribers:
+                    # Start from the head again once someone subscribes;
+                    # reconnecting pages replay what they missed.
+                    self.cursor = None
+                    continue
+            try:
+                with app.app_context():
+                    if self.cursor is None:
+                        self.cursor = FeedCursor(
+                            seen=db.session.execute(db.select(db.func.coalesce(
+                                db.func.max(ChangeEvent.id), 0))).scalar(),
+                            gap_seconds=self.gap_seconds)
+                        continue
+                    # Late commits (a revaluation behind a later edit) are
+                    # pushed when they land, not skipped over.
+                    events, overflowed = self.cursor.advance(self.cursor.read())
+                    for event in events:
+                        self.publish(event)
+                    if overflowed:
+                        app.logger.warning(
+                            "SSE skipped more than %d uncommitted events; "
+                            "their updates are not pushed",
+                            self.cursor.max_gaps)
+            except Exception as e:
+                app.logger.warning("SSE poll failed: %s", e)
+
+    def stream(self, subscription):
+        """Yield the text/event-stream body for one subscription.
+
+        The stream ends after max_seconds so the worker thread is freed;
+        the browser reconnects with Last-Event-ID and catches up.
+        """
+
+        deadline = time.monotonic() + self.max_seconds
+        try:
+            yield "retry: 3000\n\n"
+            while time.monotonic() < deadline:
+                try:
+                    event = subscription.queue.get(timeout=self.keepalive)
+                except queue.Empty:
+                    yield ": keep-alive\n\n"
+                    continue
+                if event.kind == 'quote':
+                    data = {'symbol': event.key, 'price': event.value}
+                else:
+                    data = {'portfolio': int(event.key),
+                            'net_worth': event.value}
+                yield (f"id: {event.id}\nevent: {event.kind}\n"
+                       f"data: {json.dumps(data)}\n\n")
+        finally:
+            self.unsubscribe(subscription)
+
+    def stats(self):
+        with self.lock:
+            return {
+                'subscribers': self.subscribers,
+                'max_streams': self.max_streams,
+                'refused': self.refused,
+                'topics': len(self.topics),
+                'published': self.published,
+                'delivered': self.delivered,
+                'dropped': self.dropped,
+            }
+
+
+broadcaster = Broadcaster()
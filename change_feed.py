@@ -0,0 +1,71 @@
+"""Reading the change_events feed in commit order rather than id order.
+
+Ids are handed out when a transaction inserts its events, not when it
+commits, so a large revaluation can commit after an edit that took a
+later id.  A FeedCursor remembers the ids it skipped over and asks for
+them again for `gap_seconds`; after that their transaction is taken to
+have rolled back.  Both the leaderboard and the SSE broadcaster tail the
+feed through one.
+"""
+
+import time
+
+from models import ChangeEvent
+
+# Most skipped ids a cursor tracks one by one.
+MAX_GAPS = 1000
+
+
+class FeedCursor:
+
+    def __init__(self, seen=0, gap_seconds=60, max_gaps=MAX_GAPS,
+                 clock=time.monotonic):
+        self.seen = seen
+        self.gap_seconds = gap_seconds
+        self.max_gaps = max_gaps
+        self.clock = clock
+        self.missing = {}
+
+    def position(self):
+        """(last id read, skipped ids still awaited), for ChangeEvent.since."""
+
+        return self.seen, list(self.missing)
+
+    def read(self):
+        return ChangeEvent.since(*self.position())
+
+    def advance(self, events):
+        """Take the events read from position().
+
+        Returns (new events, overflowed).  New events are those not taken
+        before, in id order.  `overflowed` is True when more than max_gaps
+        ids would be awaited; they are then not tracked at all, and the
+        reader must recover some other way, e.g. by rebuilding from the
+        tables.
+        """
+
+        now = self.clock()
+        fresh = []
+        for event in events:
+            event_id = event[0]
+            if event_id <= self.seen and event_id not in self.missing:
+                continue
+            self.missing.pop(event_id, None)
+            fresh.append(event)
+
+        overflowed = False
+        last = events[-1][0] if events else self.seen
+        if last > self.seen:
+            returned = {event[0] for event in fresh if event[0] > self.seen}
+            skipped = last - self.seen - len(returned)
+            if len(self.missing) + skipped > self.max_gaps:
+                overflowed = True
+            else:
+                for event_id in range(self.seen + 1, last):
+                    if event_id not in returned:
+                        self.missing[event_id] = now
+            self.seen = last
+        for event_id, noticed in list(self.missing.items()):
+            if now - noticed > self.gap_seconds:
+                del self.missing[event_id]
+        return fresh, overflowed
@@ -0,0 +1,145 @@
+"""Cache of rendered page fragments, keyed by the data they were built from.
+
+Keys carry the versions a fragment depends on, so a change makes new keys
+and old entries simply age out.  The leaderboard table is keyed by the
+'portfolios' data version.  A portfolio's holdings table is keyed by the
+'quotes' version and by the id of the last change event about that
+portfolio, read with one indexed lookup, so an edit, a new holding or a
+revaluation in any process invalidates exactly the portfolios it changed.
+
+Fragments live in process memory by default.  Set FRAGMENT_CACHE_URL to a
+redis:// URL to share them between processes through any Redis-compatible
+server (needs the optional `redis` package).
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from models import ChangeEvent
+
+# Change event kinds that alter what a portfolio page shows.
+PORTFOLIO_EVENTS = ('net_worth', 'portfolio')
+
+
+class MemoryBackend:
+    """LRU dict of (value, expires_at) guarded by a lock."""
+
+    def __init__(self, maxsize=2048, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.clock = clock
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if self.clock() >= expires_at:
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        with self.lock:
+            self.entries[key] = (value, self.clock() + ttl)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class RedisBackend:
+    """Fragments in a Redis-compatible server, expired by the server."""
+
+    def __init__(self, url, prefix='investor:fragment:'):
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError(
+                "FRAGMENT_CACHE_URL needs the redis package (pip install redis)")
+        self.client = redis.Redis.from_url(url, decode_responses=True)
+        self.prefix = prefix
+
+    def get(self, key):
+        return self.client.get(self.prefix + key)
+
+    def set(self, key, value, ttl):
+        self.client.set(self.prefix + key, value, ex=max(int(ttl), 1))
+
+
+class FragmentCache:
+
+    def __init__(self, backend, ttl=300):
+        self.backend = backend
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.render_seconds = 0.0
+        self.saved_seconds = 0.0
+
+    def fetch(self, key, render):
+        """Cached fragment for `key`, rendering and storing it on a miss.
+
+        Each entry remembers how long it took to render, so every hit
+        adds that much to the render time saved.
+        """
+
+        cached = self.backend.get(key)
+        if cached is not None:
+            seconds, html = cached.split('\n', 1)
+            with self.lock:
+                self.hits += 1
+                self.saved_seconds += float(seconds)
+            return html
+
+        start = time.perf_counter()
+        html = render()
+        seconds = time.perf_counter() - start
+        self.backend.set(key, f"{seconds:.6f}\n{html}", self.ttl)
+        with self.lock:
+            self.misses += 1
+            self.render_seconds += seconds
+        return html
+
+    def portfolio_key(self, port_id, quotes_version):
+        last_event = ChangeEvent.last_for(PORTFOLIO_EVENTS, port_id)
+        return f"portfolio:{port_id}:e{last_event}:q{quotes_version}"
+
+    def stats(self):
+        with self.lock:
+            lookups = self.hits + self.misses
+            stats = {
+                'backend': type(self.backend).__name__,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else None,
+                'render_seconds': round(self.render_seconds, 6),
+                'render_seconds_saved': round(self.saved_seconds, 6),
+            }
+        if isinstance(self.backend, MemoryBackend):
+            stats['size'] = len(self.backend)
+            stats['maxsize'] = self.backend.maxsize
+            stats['evictions'] = self.backend.evictions
+        return stats
+
+
+def make_backend():
+    url = os.environ.get('FRAGMENT_CACHE_URL')
+    if url:
+        return RedisBackend(url)
+    return MemoryBackend(int(os.environ.get('FRAGMENT_CACHE_SIZE', 2048)))
+
+
+fragment_cache = FragmentCache(
+    make_backend(), ttl=float(os.environ.get('FRAGMENT_CACHE_TTL', 300)))
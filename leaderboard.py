@@ -0,0 +1,298 @@
+"""Materialized leaderboard ranked by net worth.
+
+Each process keeps every portfolio's net worth in an indexable skip list,
+so the top N, any page of ranks and a single portfolio's rank are all
+O(log n).  The board is built once from the portfolios table and then
+kept current by tailing the change_events feed, which the refresh job and
+the portfolio routes append to whenever a net worth changes.  It is
+rebuilt from scratch every LEADERBOARD_REBUILD_SECONDS in a background
+thread.
+"""
+
+import math
+import os
+import random
+import threading
+import time
+
+from flask import current_app
+
+from change_feed import FeedCursor
+from models import db, Portfolio, ChangeEvent
+
+_END = (math.inf, math.inf)
+
+
+class _Node:
+    __slots__ = ('key', 'next', 'width')
+
+    def __init__(self, key, levels):
+        self.key = key
+        self.next = [None] * levels
+        self.width = [1] * levels
+
+
+class RankIndex:
+    """Sorted keys with O(log n) insert, remove, rank and positional lookup.
+
+    An indexable skip list: each link records how many positions it spans,
+    so a key's rank is the sum of the widths walked to reach it.
+    """
+
+    LEVELS = 32
+
+    def __init__(self):
+        self.tail = _Node(_END, 0)
+        self.head = _Node(None, self.LEVELS)
+        self.head.next = [self.tail] * self.LEVELS
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    @classmethod
+    def from_sorted(cls, keys):
+        """Build an index from keys already in order, in linear time."""
+
+        index = cls()
+        last = [index.head] * cls.LEVELS
+        last_position = [-1] * cls.LEVELS
+        position = -1
+        for position, key in enumerate(keys):
+            node = _Node(key, index._levels())
+            for level in range(len(node.next)):
+                last[level].next[level] = node
+                last[level].width[level] = position - last_position[level]
+                last[level] = node
+                last_position[level] = position
+        index.size = position + 1
+        for level in range(cls.LEVELS):
+            last[level].next[level] = index.tail
+            last[level].width[level] = index.size - last_position[level]
+        return index
+
+    def _levels(self):
+        # One more than the number of trailing one bits: geometric, p = 1/2.
+        bits = random.getrandbits(self.LEVELS - 1)
+        return (bits ^ (bits + 1)).bit_length()
+
+    def _chain(self, key):
+        chain = [None] * self.LEVELS
+        steps = [0] * self.LEVELS
+        node = self.head
+        for level in reversed(range(self.LEVELS)):
+            while node.next[level].key < key:
+                steps[level] += node.width[level]
+                node = node.next[level]
+            chain[level] = node
+        return chain, steps
+
+    def insert(self, key):
+        chain, steps_at_level = self._chain(key)
+        levels = self._levels()
+        node = _Node(key, levels)
+        steps = 0
+        for level in range(levels):
+            prev = chain[level]
+            node.next[level] = prev.next[level]
+            prev.next[level] = node
+            node.width[level] = prev.width[level] - steps
+            prev.width[level] = steps + 1
+            steps += steps_at_level[level]
+        for level in range(levels, self.LEVELS):
+            chain[level].width[level] += 1
+        self.size += 1
+
+    def remove(self, key):
+        chain, _ = self._chain(key)
+        node = chain[0].next[0]
+        if node.key != key:
+            raise KeyError(key)
+        for level in range(len(node.next)):
+            prev = chain[level]
+            prev.width[level] += node.width[level] - 1
+            prev.next[level] = node.next[level]
+        for level in range(len(node.next), self.LEVELS):
+            chain[level].width[level] -= 1
+        self.size -= 1
+
+    def rank(self, key):
+        """Zero-based position of `key`."""
+
+        _, steps = self._chain(key)
+        return sum(steps)
+
+    def _node_at(self, position):
+        node = self.head
+        position += 1
+        for level in reversed(range(self.LEVELS)):
+            while node.width[level] <= position:
+                position -= node.width[level]
+                node = node.next[level]
+        return node
+
+    def __getitem__(self, position):
+        if not 0 <= position < self.size:
+            raise IndexError(position)
+        return self._node_at(position).key
+
+    def slice(self, start, stop):
+        """Keys from position `start` up to `stop`, walking the bottom level."""
+
+        stop = min(stop, self.size)
+        if start >= stop:
+            return []
+        node = self._node_at(start)
+        keys = []
+        for _ in range(stop - start):
+            keys.append(node.key)
+            node = node.next[0]
+        return keys
+
+
+class Leaderboard:
+
+    def __init__(self, rebuild_seconds=None, gap_seconds=None):
+        if rebuild_seconds is None:
+            rebuild_seconds = float(
+                os.environ.get('LEADERBOARD_REBUILD_SECONDS', 3600))
+        if gap_seconds is None:
+            gap_seconds = float(os.environ.get('LEADERBOARD_GAP_SECONDS', 60))
+        self.rebuild_seconds = rebuild_seconds
+        self.gap_seconds = gap_seconds
+        self.lock = threading.Lock()
+        self.build_lock = threading.Lock()
+        self.index = None
+        self.worth = {}
+        self.applied = {}
+        self.cursor = FeedCursor(gap_seconds=gap_seconds)
+        self.built_at = None
+        self.overflow_at = None
+        self.rebuild_at = None
+
+    @staticmethod
+    def _key(port_id, net_worth):
+        return (-net_worth, port_id)
+
+    def _set(self, port_id, net_worth):
+        old = self.worth.pop(port_id, None)
+        if old is not None:
+            self.index.remove(self._key(port_id, old))
+        if net_worth is not None:
+            self.worth[port_id] = net_worth
+            self.index.insert(self._key(port_id, net_worth))
+
+    def rebuild(self):
+        """Load every net worth into a new index, then swap it in.
+
+        The build runs without the lock, so pages keep reading the old
+        index meanwhile; events written during the build are applied to
+        the new one by the next sync.
+        """
+
+        started = time.monotonic()
+        seen = db.session.query(
+            db.func.coalesce(db.func.max(ChangeEvent.id), 0)).scalar()
+        worth = {port_id: net_worth for port_id, net_worth in
+                 db.session.execute(db.select(Portfolio.id, Portfolio.net_worth))
+                 if net_worth is not None}
+        index = RankIndex.from_sorted(sorted(
+            self._key(port_id, net_worth) for port_id, net_worth in worth.items()))
+        with self.lock:
+            self.index = index
+            self.worth = worth
+            # Events past `seen` may be missing from the rows just read, so
+            # they must be applied again; skipped ids are still awaited.
+            self.applied = {port_id: event_id for port_id, event_id
+                            in self.applied.items() if event_id <= seen}
+            self.cursor.seen = seen
+            self.built_at = time.monotonic()
+            if self.rebuild_at is not None and self.rebuild_at <= started:
+                # Overflowing gaps were not tracked, and their transactions
+                # may still have been open when this build read; build once
+                # more after they must have ended.
+                if started - self.overflow_at < self.gap_seconds:
+                    self.rebuild_at = self.overflow_at + self.gap_seconds
+                else:
+                    self.rebuild_at = None
+
+    def _rebuild_in_background(self):
+        if not self.build_lock.acquire(blocking=False):
+            return
+        app = current_app._get_current_object()
+
+        def run():
+            try:
+                with app.app_context():
+                    self.rebuild()
+            except Exception as e:
+                app.logger.warning("Leaderboard rebuild failed: %s", e)
+            finally:
+                self.build_lock.release()
+
+        threading.Thread(target=run, daemon=True,
+                         name='leaderboard-rebuild').start()
+
+    def sync(self):
+        """Apply change events written since the last sync, by any process.
+
+        The feed is read through a FeedCursor, so events committed out of id
+        order are still applied.  When too many ids are skipped to track (a
+        large revaluation committing behind a later edit) the board is
+        rebuilt from the table instead.
+        Events are applied per portfolio in id order, so overlapping syncs
+        and late arrivals never put an older net worth back.
+        """
+
+        if self.index is None:
+            with self.build_lock:
+                if self.index is None:
+                    self.rebuild()
+        elif (time.monotonic() - self.built_at > self.rebuild_seconds
+              or (self.rebuild_at is not None
+                  and time.monotonic() >= self.rebuild_at)):
+            self._rebuild_in_background()
+
+        with self.lock:
+            index, position = self.index, self.cursor.position()
+        events = ChangeEvent.since(*position)
+        with self.lock:
+            if self.index is not index:
+                # Rebuilt meanwhile; the next sync reads from its watermark.
+                return
+            fresh, overflowed = self.cursor.advance(events)
+            for event_id, kind, key, value in fresh:
+                if kind == 'net_worth':
+                    port_id = int(key)
+                    if event_id > self.applied.get(port_id, 0):
+                        self.applied[port_id] = event_id
+                        self._set(port_id, value)
+            if overflowed:
+                self.overflow_at = self.rebuild_at = time.monotonic()
+
+    def __len__(self):
+        return len(self.worth)
+
+    def page(self, page=1, per_page=10):
+        """[(rank, portfolio_id, net_worth)] for one page, ranks starting at 1."""
+
+        start = (page - 1) * per_page
+        with self.lock:
+            keys = self.index.slice(start, start + per_page)
+        return [(start + i + 1, port_id, -worth)
+                for i, (worth, port_id) in enumerate(keys)]
+
+    def top(self, n=10):
+        return self.page(1, n)
+
+    def rank_of(self, port_id):
+        """One-based rank of a portfolio, or None if it is not on the board."""
+
+        with self.lock:
+            net_worth = self.worth.get(port_id)
+            if net_worth is None:
+                return None
+            return self.index.rank(self._key(port_id, net_worth)) + 1
+
+
+board = Leaderboard()
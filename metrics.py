@@ -0,0 +1,257 @@
+"""Request spans, Prometheus-text metrics and a slow-request log.
+
+Every request keeps a small trace of where its time went: SQL statements,
+outbound quote calls, password hashing and template rendering, each as a
+count and a total time.  Spans also feed process-wide histograms, and a
+request slower than SLOW_REQUEST_SECONDS is logged with its breakdown.
+/metrics serves everything in the Prometheus text format.
+
+Recording is a perf_counter() pair and a short lock per observation, so
+it stays on in production.  Metrics are per process: with several
+gunicorn workers each one reports its own.
+"""
+
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+from flask import (g, has_request_context, request, before_render_template,
+                   template_rendered)
+
+SLOW_REQUEST_SECONDS = float(os.environ.get('SLOW_REQUEST_SECONDS', 1.0))
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1, 2.5, 5, 10)
+
+
+def _labels(names, values):
+    if not names:
+        return ''
+    pairs = ','.join(f'{name}="{value}"' for name, value in zip(names, values))
+    return '{' + pairs + '}'
+
+
+class Counter:
+
+    kind = 'counter'
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.lock = threading.Lock()
+        self.values = {}
+
+    def inc(self, *labels, amount=1):
+        with self.lock:
+            self.values[labels] = self.values.get(labels, 0) + amount
+
+    def samples(self):
+        with self.lock:
+            return [(self.name + _labels(self.labels, key), value)
+                    for key, value in sorted(self.values.items())]
+
+
+class Gauge(Counter):
+
+    kind = 'gauge'
+
+    def set(self, *labels, value):
+        with self.lock:
+            self.values[labels] = value
+
+
+class Histogram:
+
+    kind = 'histogram'
+
+    def __init__(self, name, help, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self.lock = threading.Lock()
+        self.values = {}
+
+    def observe(self, value, *labels):
+        index = bisect_left(self.buckets, value)
+        with self.lock:
+            series = self.values.get(labels)
+            if series is None:
+                series = self.values[labels] = [[0] * len(self.buckets), 0, 0.0]
+            if index < len(self.buckets):
+                series[0][index] += 1
+            series[1] += 1
+            series[2] += value
+
+    def samples(self):
+        names = self.labels + ('le',)
+        out = []
+        with self.lock:
+            for key, (counts, count, total) in sorted(self.values.items()):
+                cumulative = 0
+                for bound, bucket in zip(self.buckets, counts):
+                    cumulative += bucket
+                    out.append((f"{self.name}_bucket"
+                                + _labels(names, key + (bound,)), cumulative))
+                out.append((f"{self.name}_bucket"
+                            + _labels(names, key + ('+Inf',)), count))
+                out.append((f"{self.name}_count"
+                            + _labels(self.labels, key), count))
+                out.append((f"{self.name}_sum"
+                            + _labels(self.labels, key), round(total, 6)))
+        return out
+
+
+class Registry:
+
+    def __init__(self):
+        self.metrics = []
+        self.collectors = []
+
+    def add(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def collector(self, prefix, stats):
+        """Export the numbers in stats() as gauges named prefix_<key>."""
+
+        self.collectors.append((prefix, stats))
+
+    def render(self):
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(f"{name} {value}" for name, value in metric.samples())
+        for prefix, stats in self.collectors:
+            for key, value in stats().items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    lines.append(f"# TYPE {prefix}_{key} gauge")
+                    lines.append(f"{prefix}_{key} {value}")
+        return '\n'.join(lines) + '\n'
+
+
+registry = Registry()
+
+REQUESTS = registry.add(Counter(
+    'investor_requests_total', "Requests served.",
+    ['endpoint', 'method', 'status']))
+REQUEST_SECONDS = registry.add(Histogram(
+    'investor_request_seconds', "Request latency.", ['endpoint', 'method']))
+REQUEST_SQL = registry.add(Histogram(
+    'investor_request_sql_statements', "SQL statements per request.",
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100)))
+SPAN_SECONDS = registry.add(Histogram(
+    'investor_span_seconds',
+    "Time in SQL statements, quote API calls, password hashing and rendering.",
+    ['span']))
+SLOW_REQUESTS = registry.add(Counter(
+    'investor_slow_requests_total',
+    "Requests slower than SLOW_REQUEST_SECONDS.", ['endpoint']))
+JOB_SECONDS = registry.add(Histogram(
+    'investor_job_seconds', "Scheduled job duration.", ['job'],
+    buckets=(1, 5, 15, 60, 300, 900, 1800, 3600, 7200)))
+JOB_FAILURES = registry.add(Counter(
+    'investor_job_failures_total', "Scheduled jobs that raised.", ['job']))
+JOB_LAST_SUCCESS = registry.add(Gauge(
+    'investor_job_last_success_timestamp_seconds',
+    "Unix time a job last finished without raising.", ['job']))
+
+
+def record(name, seconds):
+    """Add one span to the histograms and to the current request's trace."""
+
+    SPAN_SECONDS.observe(seconds, name)
+    if has_request_context():
+        trace = g.setdefault('trace', {})
+        count, total = trace.get(name, (0, 0.0))
+        trace[name] = (count + 1, total + seconds)
+
+
+@contextmanager
+def span(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start)
+
+
+@contextmanager
+def job(name):
+    """Time a scheduled job and record whether it finished."""
+
+    start = time.perf_counter()
+    try:
+        yield
+    except Exception:
+        JOB_FAILURES.inc(name)
+        raise
+    else:
+        JOB_LAST_SUCCESS.set(name, value=round(time.time(), 3))
+    finally:
+        JOB_SECONDS.observe(time.perf_counter() - start, name)
+
+
+def breakdown(trace):
+    return ', '.join(f"{name} {count}x {total:.3f}s"
+                     for name, (count, total) in sorted(trace.items()))
+
+
+def init_app(app):
+    """Hook request timing, SQL statements and rendering into `app`.
+
+    Call before other before_request hooks are registered, so their
+    queries are counted too.
+    """
+
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    @event.listens_for(Engine, 'before_cursor_execute')
+    def sql_start(conn, cursor, statement, parameters, context, executemany):
+        context._metrics_start = time.perf_counter()
+
+    @event.listens_for(Engine, 'after_cursor_execute')
+    def sql_end(conn, cursor, statement, parameters, context, executemany):
+        record('sql', time.perf_counter() - context._metrics_start)
+
+    def render_start(sender, template, context, **extra):
+        if has_request_context():
+            g.setdefault('render_starts', []).append(time.perf_counter())
+
+    def render_end(sender, template, context, **extra):
+        if has_request_context() and g.get('render_starts'):
+            record('render', time.perf_counter() - g.render_starts.pop())
+
+    before_render_template.connect(render_start, app, weak=False)
+    template_rendered.connect(render_end, app, weak=False)
+
+    @app.before_request
+    def start_request():
+        g.request_start = time.perf_counter()
+
+    @app.after_request
+    def note_status(response):
+        g.status = response.status_code
+        return response
+
+    @app.teardown_request
+    def finish_request(error=None):
+        if 'request_start' not in g:
+            return
+        seconds = time.perf_counter() - g.request_start
+        endpoint = request.endpoint or 'none'
+        trace = g.get('trace', {})
+        status = g.get('status', 500)
+        REQUESTS.inc(endpoint, request.method, status)
+        REQUEST_SECONDS.observe(seconds, endpoint, request.method)
+        REQUEST_SQL.observe(trace.get('sql', (0, 0.0))[0])
+        if seconds >= SLOW_REQUEST_SECONDS:
+            SLOW_REQUESTS.inc(endpoint)
+            app.logger.warning("Slow request %s %s %d in %.3fs: %s",
+                               request.method, request.full_path.rstrip('?'),
+                               status, seconds, breakdown(trace) or "no spans")
@@ -0,0 +1,141 @@
+"""Versioned, in-place schema migrations.
+
+db.create_all() creates missing tables but never alters one that already
+exists.  Each migration below runs once, in order, in its own transaction,
+and its version is recorded in schema_version.  Migrations must also be
+safe on a database that create_all() has just built at the current
+schema, so a fresh install runs them as no-ops and records them.
+
+New tables only need a model; new columns and indexes on existing tables
+need a migration here.
+"""
+
+from sqlalchemy import inspect, text
+
+from models import db
+
+schema_version = db.Table(
+    'schema_version',
+    db.Column('version', db.Integer, primary_key=True),
+    db.Column('description', db.Text, nullable=False),
+    db.Column('applied_at', db.DateTime, nullable=False,
+              server_default=db.func.current_timestamp()),
+)
+
+MIGRATIONS = []
+
+# Arbitrary key for the Postgres advisory lock held while migrating, so
+# several gunicorn workers starting at once do not race each other.
+LOCK_KEY = 7428301
+
+
+def migration(version, description):
+    def register(fn):
+        MIGRATIONS.append((version, description, fn))
+        return fn
+    return register
+
+
+def columns(conn, table):
+    return {column['name'] for column in inspect(conn).get_columns(table)}
+
+
+@migration(1, "move quote prices from stocks into quotes")
+def split_quotes(conn):
+    if 'price' not in columns(conn, 'stocks'):
+        return
+    conn.execute(text(
+        "INSERT INTO quotes (symbol, price, update_date) "
+        "SELECT symbol, MAX(price), MAX(update_date) FROM stocks "
+        "WHERE symbol IS NOT NULL "
+        "AND symbol NOT IN (SELECT symbol FROM quotes) "
+        "GROUP BY symbol"))
+    conn.execute(text("ALTER TABLE stocks DROP COLUMN price"))
+    conn.execute(text("ALTER TABLE stocks DROP COLUMN update_date"))
+    if conn.dialect.name == 'postgresql':
+        conn.execute(text(
+            "ALTER TABLE stocks ADD CONSTRAINT stocks_symbol_fkey "
+            "FOREIGN KEY (symbol) REFERENCES quotes (symbol)"))
+
+
+@migration(2, "index hot lookup columns")
+def index_lookups(conn):
+    for name, table, column in [
+        ('ix_stocks_symbol', 'stocks', 'symbol'),
+        ('ix_stocks_portfolio_id', 'stocks', 'portfolio_id'),
+        ('ix_quotes_update_date', 'quotes', 'update_date'),
+        ('ix_portfolios_user_id', 'portfolios', 'user_id'),
+    ]:
+        conn.execute(text(
+            f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({column})"))
+
+    include = ""
+    if conn.dialect.name == 'postgresql':
+        include = " INCLUDE (name, created_at)"
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_portfolios_net_worth_desc "
+        f"ON portfolios (net_worth DESC, id){include}"))
+
+
+@migration(3, "seed the quotes data version")
+def seed_data_versions(conn):
+    conn.execute(text(
+        "INSERT INTO data_versions (name, version) SELECT 'quotes', 0 "
+        "WHERE NOT EXISTS (SELECT 1 FROM data_versions WHERE name = 'quotes')"))
+
+
+@migration(4, "index lower(username) for prefix search")
+def index_username_prefix(conn):
+    # Built in the C collation on Postgres so the same index serves both
+    # the LIKE 'prefix%' filter and the ORDER BY of User.search.
+    collate = ' COLLATE "C"' if conn.dialect.name == 'postgresql' else ''
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_users_username_prefix "
+        f"ON users ((lower(username){collate}))"))
+
+
+@migration(5, "seed the portfolios data version")
+def seed_portfolios_version(conn):
+    conn.execute(text(
+        "INSERT INTO data_versions (name, version) SELECT 'portfolios', 0 "
+        "WHERE NOT EXISTS "
+        "(SELECT 1 FROM data_versions WHERE name = 'portfolios')"))
+
+
+@migration(6, "index change events by key")
+def index_change_event_keys(conn):
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_change_events_key_id "
+        "ON change_events (key, id)"))
+
+
+def current_versions(conn):
+    return {version for (version,) in conn.execute(
+        db.select(schema_version.c.version))}
+
+
+def upgrade():
+    """Create missing tables, then apply every pending migration."""
+
+    with db.engine.connect() as conn:
+        if conn.dialect.name == 'postgresql':
+            conn.execute(text("SELECT pg_advisory_lock(:key)"),
+                         {'key': LOCK_KEY})
+            conn.commit()
+        try:
+            with conn.begin():
+                db.metadata.create_all(conn)
+                applied = current_versions(conn)
+            for version, description, fn in sorted(MIGRATIONS):
+                if version in applied:
+                    continue
+                with conn.begin():
+                    fn(conn)
+                    conn.execute(db.insert(schema_version).values(
+                        version=version, description=description))
+                print(f"Applied migration {version}: {description}")
+        finally:
+            if conn.dialect.name == 'postgresql':
+                conn.execute(text("SELECT pg_advisory_unlock(:key)"),
+                             {'key': LOCK_KEY})
+                conn.commit()
@@ -1,109 +1,449 @@
 import dotenv
 import os
 import datetime
-import requests
-from flask_bcrypt import Bcrypt
+import math
+from array import array
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy.exc import IntegrityError
+
+from alphavantage import get_client
+from passwords import hash_password, check_password, needs_rehash
 
 
-bcrypt = Bcrypt()
 db = SQLAlchemy()
 dotenv.load_dotenv()
 
+_available_today = {}
 
+# Relationship loading, tunable per deployment.  Relationships default to
+# lazy loads so pages that never touch holdings do not pay for them; the
+# query helpers below load what their routes render in a fixed number of
+# statements using HOLDINGS_LOADING ('selectin' or 'joined').
+USER_PORTFOLIOS_LAZY = os.environ.get('USER_PORTFOLIOS_LAZY', 'select')
+PORTFOLIO_STOCKS_LAZY = os.environ.get('PORTFOLIO_STOCKS_LAZY', 'select')
+HOLDINGS_LOADING = os.environ.get('HOLDINGS_LOADING', 'selectin')
 
+LOADERS = {
+    'selectin': db.selectinload,
+    'joined': db.joinedload,
+}
 
-class Stock(db.Model):
+# Trades between ledger snapshots; replaying a portfolio reads at most this
+# many trades past its latest snapshot.
+LEDGER_SNAPSHOT_EVERY = int(os.environ.get('LEDGER_SNAPSHOT_EVERY', 200))
 
-    __tablename__ = 'stocks'
 
-    id = db.Column(db.Integer, primary_key=True)
+
+
+class DataVersion(db.Model):
+    """Counter bumped whenever a class of data changes, for cache keys"""
+
+    __tablename__ = 'data_versions'
+
+    name = db.Column(
+        db.Text,
+        primary_key=True
+    )
+    version = db.Column(
+        db.Integer,
+        nullable=False,
+        default=0
+    )
+
+    @classmethod
+    def bump(cls, name):
+        updated = db.session.execute(
+            db.update(cls).where(cls.name == name)
+            .values(version=cls.version + 1)).rowcount
+        if not updated:
+            db.session.add(cls(name=name, version=1))
+
+    @classmethod
+    def get(cls, name):
+        return db.session.execute(
+            db.select(cls.version).where(cls.name == name)).scalar() or 0
+
+    @classmethod
+    def many(cls, names):
+        """Versions for `names`, in order, with one query."""
+
+        versions = dict(db.session.execute(
+            db.select(cls.name, cls.version).where(cls.name.in_(names))).all())
+        return [versions.get(name, 0) for name in names]
+
+
+class Quote(db.Model):
+    """Latest market price for a symbol, shared by every holding of it"""
+
+    __tablename__ = 'quotes'
+
     symbol = db.Column(
-        db.Text
+        db.Text,
+        primary_key=True
     )
     price = db.Column(
         db.Float,
         nullable=False,
         default=0.00
     )
+    update_date = db.Column(
+        db.Date,
+        nullable=True,
+        index=True
+    )
+
+    holdings = db.relationship(
+        'Stock', backref=db.backref('quote', lazy='joined'))
+
+    @classmethod
+    def for_symbol(cls, symbol):
+        quote = cls.query.get(symbol)
+        if quote is None:
+            quote = cls(symbol=symbol)
+            db.session.add(quote)
+        return quote
+
+    def fetch(self):
+        """Fetch the latest close from Alpha Vantage, raising QuoteError.
+
+        update_date records when the quote was fetched; the close goes into
+        the price history under the trading day it belongs to.
+        """
+
+        self.price, trading_day = get_client().global_quote(self.symbol)
+        self.update_date = datetime.date.today()
+        PriceHistory.record(self.symbol, trading_day, self.price)
+        ChangeEvent.quotes([(self.symbol, self.price)])
+        DataVersion.bump('quotes')
+        return self.price
+
+    @classmethod
+    def available_today(cls):
+        """Today's (symbol, price) rows, cached until a quote changes."""
+
+        key = (datetime.date.today(), DataVersion.get('quotes'))
+        if _available_today.get('key') != key:
+            rows = db.session.execute(
+                db.select(cls.symbol, cls.price)
+                .where(cls.update_date == key[0]).order_by(cls.symbol)).all()
+            _available_today.update(key=key, rows=rows)
+        return _available_today['rows']
+
+
+class PriceHistory(db.Model):
+    """Daily closing price per symbol, keyed (symbol, day)"""
+
+    __tablename__ = 'price_history'
+
+    symbol = db.Column(
+        db.Text,
+        primary_key=True
+    )
+    day = db.Column(
+        db.Date,
+        primary_key=True
+    )
+    close = db.Column(
+        db.Float,
+        nullable=False
+    )
+
+    @classmethod
+    def record(cls, symbol, day, close):
+        db.session.merge(cls(symbol=symbol, day=day, close=close))
+
+    @classmethod
+    def latest_day(cls):
+        """The most recent trading day with a close, or None."""
+
+        return db.session.execute(db.select(db.func.max(cls.day))).scalar()
+
+    @classmethod
+    def add_missing(cls, symbol, series):
+        """Bulk insert the (day, close) pairs not already stored for `symbol`."""
+
+        have = {day for (day,) in db.session.execute(
+            db.select(cls.day).where(cls.symbol == symbol))}
+        rows = [{'symbol': symbol, 'day': day, 'close': close}
+                for day, close in series if day not in have]
+        if rows:
+            db.session.execute(db.insert(cls), rows)
+        return len(rows)
+
+    @classmethod
+    def series(cls, symbol, start=None, end=None):
+        """(days, closes) for one symbol, a single primary-key range scan.
+
+        Closes come back as a compact array('d') of floats.
+        """
+
+        query = db.select(cls.day, cls.close).where(cls.symbol == symbol)
+        if start is not None:
+            query = query.where(cls.day >= start)
+        if end is not None:
+            query = query.where(cls.day <= end)
+        days = []
+        closes = array('d')
+        for day, close in db.session.execute(query.order_by(cls.day)):
+            days.append(day)
+            closes.append(close)
+        return days, closes
+
+    @classmethod
+    def matrix(cls, symbols, start=None, end=None):
+        """Columnar export: (days, {symbol: array('d')}) on a shared day axis.
+
+        Days a symbol has no close for are NaN.
+        """
+
+        columns = {symbol: cls.series(symbol, start, end)
+                   for symbol in symbols}
+        days = sorted({day for symbol_days, _ in columns.values()
+                       for day in symbol_days})
+        position = {day: i for i, day in enumerate(days)}
+        out = {}
+        for symbol, (symbol_days, closes) in columns.items():
+            column = array('d', [math.nan]) * len(days)
+            for day, close in zip(symbol_days, closes):
+                column[position[day]] = close
+            out[symbol] = column
+        return days, out
+
+
+class Stock(db.Model):
+    """A portfolio's holding of a symbol"""
+
+    __tablename__ = 'stocks'
+
+    id = db.Column(db.Integer, primary_key=True)
+    symbol = db.Column(
+        db.Text,
+        db.ForeignKey('quotes.symbol'),
+        index=True
+    )
     quantity = db.Column(
         db.Integer,
         nullable=False,
         default=0
     )
-    update_date = db.Column(
+
+    portfolio_id = db.Column(
+        db.Integer,
+        db.ForeignKey('portfolios.id', ondelete='cascade'),
+        index=True
+    )
+
+    @property
+    def price(self):
+        if self.quote is None:
+            return 0.00
+        return self.quote.price
+
+    @property
+    def update_date(self):
+        if self.quote is None:
+            return None
+        return self.quote.update_date
+
+
+class RefreshRun(db.Model):
+    """Progress of a quote refresh, checkpointed so it can resume"""
+
+    __tablename__ = 'refresh_runs'
+
+    id = db.Column(db.Integer, primary_key=True)
+    run_date = db.Column(
         db.Date,
+        nullable=False
+    )
+    started_at = db.Column(
+        db.DateTime,
+        nullable=False,
+        default=datetime.datetime.now
+    )
+    finished_at = db.Column(
+        db.DateTime,
         nullable=True
     )
-
-    portfolio_id = db.Column(
+    total = db.Column(
         db.Integer,
-        db.ForeignKey('portfolios.id', ondelete='cascade')
-    )
-
-    def update(self):
-        today = datetime.date.today()
-        if self.update_date == today:
-            return self.price
-        api_url = os.environ.get('API_URL')
-        symbol = self.symbol
-        api_query = "&interval=5min&apikey="
-        api_key = os.environ.get('API_KEY')
-        url = api_url + symbol + api_query + api_key
-        try:
-            r = requests.get(url)
-            data = r.json()
-            gq = data["Global Quote"]
-            price = gq["05. price"]
-            update_date = today
-        except:
-            pricer_stock = Stock.query.filter_by(symbol=symbol).first()
-            price = pricer_stock.price
-            update_date = None
-        finally:
-            stocks = Stock.query.filter_by(symbol=symbol)
-            for stock in stocks:
-                stock.price = price
-                stock.update_date = update_date
-            db.session.commit()
-            return price
+        nullable=False,
+        default=0
+    )
+    refreshed = db.Column(
+        db.Integer,
+        nullable=False,
+        default=0
+    )
+    failed = db.Column(
+        db.Integer,
+        nullable=False,
+        default=0
+    )
+    last_symbol = db.Column(
+        db.Text,
+        nullable=True
+    )
+
+    @classmethod
+    def unfinished(cls, run_date):
+        return cls.query.filter_by(
+            run_date=run_date, finished_at=None).order_by(cls.id.desc()).first()
+
+    def summary(self):
+        return (f"{self.refreshed}/{self.total} quotes refreshed, "
+                f"{self.failed} failed")
+
+
+class JobLease(db.Model):
+    """Which worker may run a background job, until the lease expires"""
+
+    __tablename__ = 'job_leases'
+
+    name = db.Column(
+        db.Text,
+        primary_key=True
+    )
+    owner = db.Column(
+        db.Text,
+        nullable=False
+    )
+    expires_at = db.Column(
+        db.DateTime,
+        nullable=False
+    )
 
     @classmethod
-    def updated_stocks(cls):
-        today = datetime.date.today()
-        stocks = cls.query.filter_by(update_date=today)
-        symbols = []
-        for stock in stocks:
-            symbols.append(stock.symbol)
-        symbols = set(symbols)
-        updated_stocks = []
-        for symbol in symbols:
-            stock = cls.query.filter_by(symbol=symbol).limit(1)
-            updated_stocks.append(stock[0])
-        print(updated_stocks)
-        return updated_stocks
+    def acquire(cls, name, owner, seconds):
+        """Take or renew the lease on `name` for `seconds`.
+
+        Succeeds if nobody holds the lease, it has expired or `owner`
+        already holds it; the conditional UPDATE (or the primary key on
+        the first INSERT) makes this atomic across processes.  Times come
+        from the database's clock, so skew between worker hosts cannot
+        hand out a lease that is still held.
+        """
+
+        now = cls.now()
+        expires_at = now + datetime.timedelta(seconds=seconds)
+        taken = db.session.execute(
+            db.update(cls).where(
+                cls.name == name,
+                db.or_(cls.owner == owner, cls.expires_at <= now))
+            .values(owner=owner, expires_at=expires_at)).rowcount
+        if not taken:
+            try:
+                with db.session.begin_nested():
+                    db.session.add(cls(name=name, owner=owner,
+                                       expires_at=expires_at))
+                taken = 1
+            except IntegrityError:
+                taken = 0
+        db.session.commit()
+        return bool(taken)
 
     @classmethod
-    def update_all(cls):
-        today = datetime.date.today()
+    def release(cls, name, owner):
+        db.session.execute(
+            db.update(cls).where(cls.name == name, cls.owner == owner)
+            .values(expires_at=cls.now()))
+        db.session.commit()
+
+    @staticmethod
+    def now():
+        return db.session.execute(db.select(db.func.now())).scalar()
 
-        # Query stocks that haven't been updated today
-        non_updated_stocks = cls.query.filter(cls.update_date != today).all()
 
-        if(len(non_updated_stocks) == 0):
-            return -1
+class ChangeEvent(db.Model):
+    """Append-only feed of portfolio changes, tailed by each process"""
 
-        stocks_to_update = set(non_updated_stocks)
+    __tablename__ = 'change_events'
 
-        # Update the stocks (modify this part according to your actual update logic)
-        for stock in stocks_to_update:
-            stock.update()
+    id = db.Column(db.Integer, primary_key=True)
+    kind = db.Column(
+        db.Text,
+        nullable=False
+    )
+    key = db.Column(
+        db.Text,
+        nullable=False
+    )
+    value = db.Column(
+        db.Float,
+        nullable=True
+    )
+    created_at = db.Column(
+        db.DateTime,
+        nullable=False,
+        default=datetime.datetime.now
+    )
 
-        # Commit the changes to the database
+    __table_args__ = (
+        db.Index('ix_change_events_key_id', key, id),
+    )
+
+    @classmethod
+    def net_worths(cls, pairs):
+        """Queue (portfolio_id, net_worth) changes; None removes the portfolio."""
+
+        rows = [{'kind': 'net_worth', 'key': str(port_id), 'value': value}
+                for port_id, value in pairs]
+        if rows:
+            db.session.execute(db.insert(cls), rows)
+
+    @classmethod
+    def quotes(cls, pairs):
+        """Queue (symbol, price) changes for live pages."""
+
+        rows = [{'kind': 'quote', 'key': symbol, 'value': price}
+                for symbol, price in pairs]
+        if rows:
+            db.session.execute(db.insert(cls), rows)
+
+    @classmethod
+    def touched(cls, portfolio_ids):
+        """Queue a change to what portfolio pages show, other than net worth."""
+
+        rows = [{'kind': 'portfolio', 'key': str(port_id), 'value': None}
+                for port_id in portfolio_ids]
+        if rows:
+            db.session.execute(db.insert(cls), rows)
+
+    @classmethod
+    def net_worths_of(cls, portfolio_ids):
+        """Queue the current net worth of every portfolio in a subquery."""
+
+        db.session.execute(db.insert(cls).from_select(
+            ['kind', 'key', 'value', 'created_at'],
+            db.select(db.literal('net_worth'),
+                      db.cast(Portfolio.id, db.Text), Portfolio.net_worth,
+                      db.literal(datetime.datetime.now(), db.DateTime))
+            .where(Portfolio.id.in_(portfolio_ids))))
+
+    @classmethod
+    def last_for(cls, kinds, key):
+        """Id of the latest event of `kinds` about `key`, or 0."""
+
+        return db.session.execute(
+            db.select(db.func.coalesce(db.func.max(cls.id), 0))
+            .where(cls.key == str(key), cls.kind.in_(kinds))).scalar()
+
+    @classmethod
+    def since(cls, last_id, missing=()):
+        """Events after `last_id`, plus the earlier ids in `missing`."""
+
+        condition = cls.id > last_id
+        if missing:
+            condition = db.or_(condition, cls.id.in_(missing))
+        return db.session.execute(
+            db.select(cls.id, cls.kind, cls.key, cls.value)
+            .where(condition).order_by(cls.id)).all()
+
+    @classmethod
+    def prune(cls, before):
+        db.session.execute(db.delete(cls).where(cls.created_at < before))
         db.session.commit()
 
-        return stocks_to_update
-        
 
 class Portfolio(db.Model):
 
@@ -133,22 +473,165 @@ class Portfolio(db.Model):
 
     user_id = db.Column(
         db.Integer,
-        db.ForeignKey('users.id', ondelete='cascade')
+        db.ForeignKey('users.id', ondelete='cascade'),
+        index=True
     )
 
     stocks = db.relationship('Stock', backref='portfolios',
-                             cascade='all, delete-orphan')
-
-    def update_net_worth(self):
-        total = float(self.cash)
-        for stock in self.stocks:
-            stock.update()
-            quantity = stock.quantity
-            price = stock.price
-            total = total + (quantity * price)
-        self.net_worth = round(total, 2)
+                             cascade='all, delete-orphan',
+                             lazy=PORTFOLIO_STOCKS_LAZY)
+
+    __table_args__ = (
+        db.Index('ix_portfolios_net_worth_desc', net_worth.desc(), id,
+                 postgresql_include=['name', 'created_at']),
+    )
+
+    @classmethod
+    def with_holdings(cls):
+        """Query portfolios with holdings, their quotes and owner loaded up front."""
+
+        return cls.query.options(
+            LOADERS[HOLDINGS_LOADING](cls.stocks), db.joinedload(cls.users))
+
+    @classmethod
+    def for_user(cls, user_id):
+        return cls.query.filter_by(user_id=user_id).order_by(cls.id).all()
+
+    @classmethod
+    def delete_many(cls, portfolio_ids):
+        """Delete portfolios and their holdings with two bulk statements."""
+
+        ChangeEvent.net_worths([(port_id, None) for port_id in portfolio_ids])
+        DataVersion.bump('portfolios')
+        db.session.execute(db.delete(Stock).where(
+            Stock.portfolio_id.in_(portfolio_ids)))
+        db.session.execute(db.delete(cls).where(cls.id.in_(portfolio_ids)))
+
+    def valuation(self):
+        """Prices and net worth from the quotes loaded with the holdings.
+
+        Nothing is fetched from Alpha Vantage or committed, so page views
+        stay read-only and persisting net worth is left to revalue_all.
+        """
+
+        prices = {stock.symbol: stock.price for stock in self.stocks}
+        total = float(self.cash) + sum(
+            stock.quantity * prices[stock.symbol] for stock in self.stocks)
+        return prices, round(total, 2)
+
+    def apply_holdings(self, quantities, bought=None):
+        """Set holding quantities in one transaction, settling cash server-side.
+
+        `quantities` maps symbol -> new quantity and `bought` symbol -> a
+        quantity to add; held symbols left out keep their quantity.  The
+        portfolio row is locked first, so concurrent edits queue instead of
+        overwriting each other, and the holdings and their quote prices
+        are read afresh under the lock.  Cash moves by (old - new) * price
+        at those prices, and the edit is refused with ValueError if any
+        quantity is invalid, a traded symbol has no price yet or cash would
+        go negative.  Changes are written with one bulk DELETE and one bulk
+        UPDATE, each one is appended to the trade ledger, and nothing is
+        fetched from Alpha Vantage.  Returns [(symbol, old, new, price)]
+        for the holdings that changed.
+        """
+
+        bought = bought or {}
+        cash = float(db.session.execute(
+            db.select(Portfolio.cash).where(Portfolio.id == self.id)
+            .with_for_update()).scalar())
+        rows = {}
+        prices = {}
+        for stock_id, symbol, quantity, price, update_date in db.session.execute(
+                db.select(Stock.id, Stock.symbol, Stock.quantity, Quote.price,
+                          Quote.update_date)
+                .outerjoin(Quote, Stock.symbol == Quote.symbol)
+                .where(Stock.portfolio_id == self.id).order_by(Stock.id)):
+            rows.setdefault(symbol, []).append((stock_id, quantity))
+            if price is not None and price > 0 and update_date is not None:
+                prices[symbol] = price
+
+        changes = []
+        delete_ids = []
+        updates = []
+        opening = (cash, {symbol: sum(quantity for _, quantity in stocks)
+                          for symbol, stocks in rows.items()})
+        held = 0
+        for symbol, stocks in rows.items():
+            old = sum(quantity for _, quantity in stocks)
+            new = quantities.get(symbol, old)
+            if new is not None:
+                new += bought.get(symbol, 0)
+            if new is None or new < 0:
+                raise ValueError(f"Invalid quantity for {symbol}")
+            if new != old and symbol not in prices:
+                raise ValueError(f"No price for {symbol} yet")
+            held += new * prices.get(symbol, 0)
+            if new == 0:
+                delete_ids.extend(stock_id for stock_id, _ in stocks)
+            elif new != old or len(stocks) > 1:
+                updates.append({'id': stocks[0][0], 'quantity': new})
+                delete_ids.extend(stock_id for stock_id, _ in stocks[1:])
+            if new != old:
+                cash = Trade.settle(cash, old - new, prices[symbol])
+                changes.append((symbol, old, new, prices[symbol]))
+
+        if cash < 0:
+            raise ValueError("Not enough cash for that trade")
+
+        if delete_ids:
+            db.session.execute(db.delete(Stock).where(
+                Stock.id.in_(delete_ids)))
+        if updates:
+            db.session.execute(db.update(Stock), updates)
+        self.cash = cash
+        self.net_worth = round(cash + held, 2)
+        Trade.record(self.id, changes, opening)
+        ChangeEvent.net_worths([(self.id, self.net_worth)])
+        DataVersion.bump('portfolios')
+        db.session.commit()
+        return changes
+
+    @classmethod
+    def revalue_all(cls, portfolio_ids=None):
+        """Set net_worth = cash + SUM(quantity * price) in one UPDATE.
+
+        Revalues every portfolio, or only `portfolio_ids` (a list or a
+        subquery of ids) when given, and returns the number of rows written.
+        """
+
+        result = db.session.execute(cls._revalue(portfolio_ids))
+        DataVersion.bump('portfolios')
         db.session.commit()
-        return round(total, 2)
+        return result.rowcount
+
+    @classmethod
+    def _revalue(cls, portfolio_ids=None):
+        holdings = db.select(
+            db.func.coalesce(db.func.sum(Stock.quantity * Quote.price), 0)
+        ).join(Quote, Stock.symbol == Quote.symbol).where(
+            Stock.portfolio_id == cls.id).scalar_subquery()
+        stmt = db.update(cls).values(net_worth=db.func.round(
+            db.cast(cls.cash + holdings, db.Numeric), 2))
+        if portfolio_ids is not None:
+            stmt = stmt.where(cls.id.in_(portfolio_ids))
+        return stmt
+
+    @classmethod
+    def revalue_holders(cls, symbol):
+        """Revalue only the portfolios holding `symbol` and log their new worth.
+
+        The UPDATE, the change events and the version bump commit together,
+        so nothing can see the new version without the events behind it.
+        """
+
+        holders = db.select(Stock.portfolio_id).where(
+            Stock.symbol == symbol).distinct()
+        revalued = db.session.execute(cls._revalue(holders)).rowcount
+        if revalued:
+            ChangeEvent.net_worths_of(holders)
+            DataVersion.bump('portfolios')
+        db.session.commit()
+        return revalued
 
     def friendly_date(self):
         date = self.created_at
@@ -156,6 +639,301 @@ class Portfolio(db.Model):
         return friendly
 
 
+class PortfolioSnapshot(db.Model):
+    """A portfolio's net worth at the end of a day"""
+
+    __tablename__ = 'portfolio_snapshots'
+
+    portfolio_id = db.Column(
+        db.Integer,
+        db.ForeignKey('portfolios.id', ondelete='cascade'),
+        primary_key=True
+    )
+    day = db.Column(
+        db.Date,
+        primary_key=True
+    )
+    net_worth = db.Column(
+        db.Float,
+        nullable=False
+    )
+
+    @classmethod
+    def take(cls, day):
+        """Snapshot every portfolio's current net worth with one INSERT ... SELECT.
+
+        Re-taking a day replaces it, so a resumed refresh can snapshot again.
+        """
+
+        db.session.execute(db.delete(cls).where(cls.day == day))
+        result = db.session.execute(db.insert(cls).from_select(
+            ['portfolio_id', 'day', 'net_worth'],
+            db.select(Portfolio.id, db.literal(day, db.Date),
+                      Portfolio.net_worth)))
+        db.session.commit()
+        return result.rowcount
+
+    @classmethod
+    def history(cls, portfolio_id, start=None):
+        """(days, net_worths) for one portfolio, oldest first."""
+
+        query = db.select(cls.day, cls.net_worth).where(
+            cls.portfolio_id == portfolio_id)
+        if start is not None:
+            query = query.where(cls.day >= start)
+        rows = db.session.execute(query.order_by(cls.day)).all()
+        return [day for day, _ in rows], [net_worth for _, net_worth in rows]
+
+
+class PortfolioStats(db.Model):
+    """Risk and return over the analytics window, recomputed nightly"""
+
+    __tablename__ = 'portfolio_stats'
+
+    portfolio_id = db.Column(
+        db.Integer,
+        db.ForeignKey('portfolios.id', ondelete='cascade'),
+        primary_key=True
+    )
+    total_return = db.Column(
+        db.Float,
+        nullable=True,
+        index=True
+    )
+    volatility = db.Column(
+        db.Float,
+        nullable=True,
+        index=True
+    )
+    max_drawdown = db.Column(
+        db.Float,
+        nullable=True,
+        index=True
+    )
+    sharpe = db.Column(
+        db.Float,
+        nullable=True,
+        index=True
+    )
+    days = db.Column(
+        db.Integer,
+        nullable=False,
+        default=0
+    )
+    computed_at = db.Column(
+        db.DateTime,
+        nullable=False,
+        default=datetime.datetime.now
+    )
+
+    # Leaderboard orderings: best first, portfolios without a value last.
+    ORDERINGS = {
+        'sharpe': sharpe.desc(),
+        'return': total_return.desc(),
+        'volatility': volatility.asc(),
+        'drawdown': max_drawdown.asc(),
+    }
+    COLUMNS = {
+        'sharpe': sharpe,
+        'return': total_return,
+        'volatility': volatility,
+        'drawdown': max_drawdown,
+    }
+
+    @classmethod
+    def replace_all(cls, rows):
+        """Swap in a freshly computed set of stats rows."""
+
+        db.session.execute(db.delete(cls))
+        if rows:
+            db.session.execute(db.insert(cls), rows)
+        DataVersion.bump('portfolios')
+        db.session.commit()
+        return len(rows)
+
+    @classmethod
+    def page(cls, order, page=1, per_page=10):
+        """[(rank, portfolio_id, value)] for one page of an ordering."""
+
+        column = cls.COLUMNS[order]
+        start = (page - 1) * per_page
+        rows = db.session.execute(
+            db.select(cls.portfolio_id, column)
+            .order_by(cls.ORDERINGS[order].nulls_last(), cls.portfolio_id)
+            .offset(start).limit(per_page)).all()
+        return [(start + i + 1, port_id, value)
+                for i, (port_id, value) in enumerate(rows)]
+
+    @classmethod
+    def count(cls):
+        return db.session.execute(db.select(db.func.count()).select_from(
+            cls)).scalar()
+
+
+class Trade(db.Model):
+    """A buy or sell in a portfolio's append-only ledger"""
+
+    __tablename__ = 'trades'
+
+    id = db.Column(db.Integer, primary_key=True)
+    portfolio_id = db.Column(
+        db.Integer,
+        db.ForeignKey('portfolios.id', ondelete='cascade'),
+        nullable=False
+    )
+    side = db.Column(
+        db.Text,
+        nullable=False
+    )
+    symbol = db.Column(
+        db.Text,
+        nullable=False
+    )
+    quantity = db.Column(
+        db.Integer,
+        nullable=False
+    )
+    price = db.Column(
+        db.Float,
+        nullable=False
+    )
+    created_at = db.Column(
+        db.DateTime,
+        nullable=False,
+        default=datetime.datetime.now
+    )
+
+    __table_args__ = (
+        db.Index('ix_trades_portfolio_id_id', portfolio_id, id),
+    )
+
+    @staticmethod
+    def settle(cash, sold, price):
+        """Cash after selling `sold` shares (buying if negative) at `price`.
+
+        Rounded to cents per trade, so replaying the ledger lands on
+        exactly the cash the edit stored.
+        """
+
+        return round(cash + sold * price, 2)
+
+    @classmethod
+    def record(cls, portfolio_id, changes, opening):
+        """Append [(symbol, old, new, price)] changes to the ledger.
+
+        `opening` is the (cash, {symbol: quantity}) state before the
+        changes.  A portfolio's first trades are preceded by an opening
+        snapshot of it, and a new snapshot is written every
+        LEDGER_SNAPSHOT_EVERY trades so replay stays bounded.  Does not
+        commit.
+        """
+
+        if not changes:
+            return
+        last_id, pending = LedgerSnapshot.latest(portfolio_id)
+        if last_id is None:
+            LedgerSnapshot.write(portfolio_id, 0, *opening)
+            pending = 0
+        now = datetime.datetime.now()
+        db.session.execute(db.insert(cls), [
+            {'portfolio_id': portfolio_id,
+             'side': 'buy' if new > old else 'sell',
+             'symbol': symbol, 'quantity': abs(new - old),
+             'price': price, 'created_at': now}
+            for symbol, old, new, price in changes])
+        if pending + len(changes) >= LEDGER_SNAPSHOT_EVERY:
+            cash, holdings = opening[0], dict(opening[1])
+            for symbol, old, new, price in changes:
+                cash = cls.settle(cash, old - new, price)
+                holdings[symbol] = new
+            last_trade = db.session.execute(
+                db.select(db.func.max(cls.id))
+                .where(cls.portfolio_id == portfolio_id)).scalar()
+            LedgerSnapshot.write(portfolio_id, last_trade, cash, holdings)
+
+    @classmethod
+    def replay(cls, portfolio_id):
+        """(cash, {symbol: quantity}) rebuilt from the ledger.
+
+        Starts from the latest snapshot and applies only the trades after
+        it.  Returns None for a portfolio that has never traded.
+        """
+
+        snapshot = LedgerSnapshot.query.filter_by(
+            portfolio_id=portfolio_id).order_by(
+            LedgerSnapshot.trade_id.desc()).first()
+        if snapshot is None:
+            return None
+        return cls.apply(snapshot.cash, snapshot.holdings, db.session.execute(
+            db.select(cls.side, cls.symbol, cls.quantity, cls.price)
+            .where(cls.portfolio_id == portfolio_id,
+                   cls.id > snapshot.trade_id)
+            .order_by(cls.id)))
+
+    @classmethod
+    def apply(cls, cash, holdings, trades):
+        """Apply (side, symbol, quantity, price) trades to a state."""
+
+        holdings = dict(holdings)
+        for side, symbol, quantity, price in trades:
+            sold = quantity if side == 'sell' else -quantity
+            cash = cls.settle(cash, sold, price)
+            held = holdings.get(symbol, 0) - sold
+            if held:
+                holdings[symbol] = held
+            else:
+                holdings.pop(symbol, None)
+        return cash, holdings
+
+
+class LedgerSnapshot(db.Model):
+    """A portfolio's cash and holdings as of a trade in its ledger"""
+
+    __tablename__ = 'ledger_snapshots'
+
+    portfolio_id = db.Column(
+        db.Integer,
+        db.ForeignKey('portfolios.id', ondelete='cascade'),
+        primary_key=True
+    )
+    trade_id = db.Column(
+        db.Integer,
+        primary_key=True
+    )
+    cash = db.Column(
+        db.Float,
+        nullable=False
+    )
+    holdings = db.Column(
+        db.JSON,
+        nullable=False
+    )
+    created_at = db.Column(
+        db.DateTime,
+        nullable=False,
+        default=datetime.datetime.now
+    )
+
+    @classmethod
+    def write(cls, portfolio_id, trade_id, cash, holdings):
+        db.session.execute(db.insert(cls).values(
+            portfolio_id=portfolio_id, trade_id=trade_id, cash=cash,
+            holdings={symbol: quantity for symbol, quantity
+                      in holdings.items() if quantity}))
+
+    @classmethod
+    def latest(cls, portfolio_id):
+        """(trade_id, trades since) for the newest snapshot, or (None, 0)."""
+
+        last_id = db.select(db.func.max(cls.trade_id)).where(
+            cls.portfolio_id == portfolio_id).scalar_subquery()
+        pending = db.select(db.func.count(Trade.id)).where(
+            Trade.portfolio_id == portfolio_id,
+            Trade.id > last_id).scalar_subquery()
+        row = db.session.execute(db.select(last_id, pending)).one()
+        return row[0], row[1] or 0
+
+
 class User(db.Model):
     """User in the system"""
 
@@ -192,26 +970,99 @@ class User(db.Model):
     )
 
     portfolios = db.relationship(
-        'Portfolio', backref='users', cascade='all, delete-orphan')
+        'Portfolio', backref='users', cascade='all, delete-orphan',
+        lazy=USER_PORTFOLIOS_LAZY)
 
     @staticmethod
     def encrypt_password(password):
-        hashed_pwd = bcrypt.generate_password_hash(password).decode('UTF-8')
-        return hashed_pwd
+        return hash_password(password)
 
     @classmethod
     def authenticate(cls, username, password):
         user = cls.query.filter_by(username=username).first()
 
-        if user:
-            is_auth = bcrypt.check_password_hash(user.password, password)
-            if is_auth:
-                return user
+        if user and user.check_password(password):
+            return user
 
         return False
 
+    def check_password(self, password):
+        """Verify `password`, rehashing it if the work factor has changed."""
+
+        if not check_password(self.password, password):
+            return False
+        if needs_rehash(self.password):
+            self.password = hash_password(password)
+            db.session.commit()
+        return True
+
+    @classmethod
+    def username_key(cls):
+        """lower(username), in the byte-order collation its index is built with."""
+
+        key = db.func.lower(cls.username)
+        if db.engine.dialect.name == 'postgresql':
+            key = db.collate(key, 'C')
+        return key
+
+    @classmethod
+    def search(cls, query, page=1, per_page=12):
+        """Users whose name starts with `query`, case-insensitively.
+
+        Served by a range scan of the lower(username) index in index
+        order, so an exact match ranks first and each page stops after
+        per_page rows. Returns (users, has_next).
+        """
+
+        key = cls.username_key()
+        users = cls.query
+        if query:
+            users = users.filter(key.startswith(query.lower(), autoescape=True))
+        users = users.order_by(key).offset(
+            (page - 1) * per_page).limit(per_page + 1).all()
+        return users[:per_page], len(users) > per_page
+
+    @classmethod
+    def autocomplete(cls, query, limit=10):
+        """(id, username) rows for the first `limit` prefix matches."""
+
+        key = cls.username_key()
+        return db.session.execute(
+            db.select(cls.id, cls.username)
+            .where(key.startswith(query.lower(), autoescape=True))
+            .order_by(key).limit(limit)).all()
+
+
+def _gevent_wait(conn, timeout=None):
+    """psycopg2 wait callback that yields to other greenlets on socket I/O."""
+
+    import psycopg2
+    from gevent.socket import wait_read, wait_write
+
+    while True:
+        state = conn.poll()
+        if state == psycopg2.extensions.POLL_OK:
+            return
+        if state == psycopg2.extensions.POLL_READ:
+            wait_read(conn.fileno(), timeout=timeout)
+        elif state == psycopg2.extensions.POLL_WRITE:
+            wait_write(conn.fileno(), timeout=timeout)
+        else:
+            raise psycopg2.OperationalError(f"Bad poll state: {state!r}")
+
 
 def connect_db(app):
 
+    try:
+        from gevent import monkey
+    except ImportError:
+        monkey = None
+    uri = app.config.get('SQLALCHEMY_DATABASE_URI') or ''
+    if (uri.startswith('postgres') and monkey is not None
+            and monkey.is_module_patched('socket')):
+        # Under the gevent `stream` worker a query must not block the hub.
+        import psycopg2.extensions
+        psycopg2.extensions.set_wait_callback(_gevent_wait)
+
     db.app = app
     db.init_app(app)
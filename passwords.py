@@ -0,0 +1,76 @@
+"""Password hashing off the request path.
+
+bcrypt is deliberately slow, so a burst of logins or signups could pin
+every web worker on CPU.  Hashes run on a small bounded thread pool
+(bcrypt releases the GIL), callers wait at most HASH_QUEUE_TIMEOUT for a
+slot and get HashingBusy beyond that, and the work factor comes from
+BCRYPT_ROUNDS so it can be raised over time: hashes made at another cost
+are transparently rehashed on the next successful login.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from flask_bcrypt import Bcrypt
+
+from metrics import span
+from ratelimit import KeyedLimiter
+
+bcrypt = Bcrypt()
+
+ROUNDS = int(os.environ.get('BCRYPT_ROUNDS', 12))
+WORKERS = int(os.environ.get('HASH_WORKERS', 2))
+QUEUE = int(os.environ.get('HASH_QUEUE', 8))
+QUEUE_TIMEOUT = float(os.environ.get('HASH_QUEUE_TIMEOUT', 2))
+
+_executor = ThreadPoolExecutor(max_workers=WORKERS,
+                               thread_name_prefix='bcrypt')
+_slots = threading.BoundedSemaphore(WORKERS + QUEUE)
+
+# Checked before any hashing, so a credential-stuffing burst is turned
+# away without costing a bcrypt round.
+PER_USER = int(os.environ.get('LOGIN_ATTEMPTS_PER_USER', 5))
+PER_IP = int(os.environ.get('LOGIN_ATTEMPTS_PER_IP', 20))
+user_attempts = KeyedLimiter(capacity=PER_USER, per_minute=PER_USER)
+ip_attempts = KeyedLimiter(capacity=PER_IP, per_minute=PER_IP)
+
+
+class HashingBusy(Exception):
+    """Every hashing slot stayed taken for longer than the queue timeout."""
+
+
+def _run(fn, *args):
+    with span('bcrypt'):
+        if not _slots.acquire(timeout=QUEUE_TIMEOUT):
+            raise HashingBusy()
+        try:
+            return _executor.submit(fn, *args).result()
+        finally:
+            _slots.release()
+
+
+def hash_password(password):
+    return _run(bcrypt.generate_password_hash, password,
+                ROUNDS).decode('UTF-8')
+
+
+def check_password(hashed, password):
+    return _run(bcrypt.check_password_hash, hashed, password)
+
+
+def needs_rehash(hashed):
+    """True if `hashed` was made at a different cost than ROUNDS."""
+
+    try:
+        return int(hashed.split('$')[2]) != ROUNDS
+    except (IndexError, ValueError):
+        return True
+
+
+def allow_login(username, ip):
+    """Spend one login attempt for the username and the client address."""
+
+    user_ok = user_attempts.allow(username.lower())
+    ip_ok = ip_attempts.allow(ip)
+    return user_ok and ip_ok
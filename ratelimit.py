@@ -0,0 +1,76 @@
+"""Token-bucket rate limiting for API calls and login attempts."""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class TokenBucket:
+    """Allow bursts of `capacity` calls, refilled at `rate` calls per second."""
+
+    def __init__(self, capacity, rate, clock=time.monotonic, sleep=time.sleep):
+        self.capacity = capacity
+        self.rate = rate
+        self.clock = clock
+        self.sleep = sleep
+        self.tokens = float(capacity)
+        self.updated = clock()
+        self.lock = threading.Lock()
+
+    def _refill(self):
+        now = self.clock()
+        self.tokens = min(self.capacity,
+                          self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def try_acquire(self):
+        with self.lock:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+    def drain(self):
+        with self.lock:
+            self._refill()
+            self.tokens = 0.0
+
+    def acquire(self):
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            self.sleep(wait)
+
+
+class KeyedLimiter:
+    """One token bucket per key (a username, an IP), for the busiest keys.
+
+    Keys not seen recently are dropped once more than `max_keys` are
+    tracked, which only ever forgives a key, never blocks one.
+    """
+
+    def __init__(self, capacity, per_minute, max_keys=10000,
+                 clock=time.monotonic):
+        self.capacity = capacity
+        self.rate = per_minute / 60
+        self.max_keys = max_keys
+        self.clock = clock
+        self.buckets = OrderedDict()
+        self.lock = threading.Lock()
+
+    def allow(self, key):
+        with self.lock:
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(self.capacity, self.rate, clock=self.clock)
+                self.buckets[key] = bucket
+                if len(self.buckets) > self.max_keys:
+                    self.buckets.popitem(last=False)
+            else:
+                self.buckets.move_to_end(key)
+        return bucket.try_acquire()
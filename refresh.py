@@ -0,0 +1,172 @@
+"""Nightly quote refresh, paced to the Alpha Vantage call budget."""
+
+import datetime
+import os
+import time
+
+from alphavantage import QuoteError, ThrottledError, get_client
+from analytics import PortfolioAnalytics
+from models import (db, Quote, Portfolio, RefreshRun, ChangeEvent,
+                    PriceHistory, PortfolioSnapshot)
+from ratelimit import TokenBucket
+
+
+def api_bucket(calls_per_minute, clock=time.monotonic, sleep=time.sleep):
+    """Pace calls evenly so no 60-second window holds more than the budget.
+
+    A bucket that could fill to `calls_per_minute` would spend a full burst
+    and then keep refilling inside the same minute, so it holds one call.
+    """
+
+    return TokenBucket(1, calls_per_minute / 60, clock=clock, sleep=sleep)
+
+
+class QuoteRefresher:
+    """Refresh every stale symbol once, spending exactly the API budget.
+
+    Progress is checkpointed on a RefreshRun row after each symbol, so a
+    run that is interrupted (or stopped at `max_minutes`) picks up after
+    the last symbol it finished the next time it is started that day.
+    Holders of each refreshed symbol are revalued straight away so the
+    leaderboard moves during the run; every portfolio is revalued,
+    snapshotted for its history and has its risk stats recomputed at
+    the end.
+
+    `stop` is an optional threading.Event, checked between symbols and
+    before each API attempt; once it is set the run stops where it is and
+    skips the final revaluation, as the worker does when it loses the
+    job's lease.
+    """
+
+    def __init__(self, calls_per_minute=None, max_minutes=None, bucket=None,
+                 stop=None):
+        if calls_per_minute is None:
+            calls_per_minute = int(os.environ.get('API_CALLS_PER_MINUTE', 5))
+        if max_minutes is None and os.environ.get('REFRESH_MAX_MINUTES'):
+            max_minutes = float(os.environ.get('REFRESH_MAX_MINUTES'))
+        self.max_minutes = max_minutes
+        self.stop = stop
+        self.bucket = bucket or api_bucket(calls_per_minute)
+
+    @staticmethod
+    def stale_symbols(today, after=None):
+        query = db.session.query(Quote.symbol).filter(db.or_(
+            Quote.update_date != today, Quote.update_date.is_(None)))
+        if after is not None:
+            query = query.filter(Quote.symbol > after)
+        return [symbol for (symbol,) in query.order_by(Quote.symbol)]
+
+    def stopped(self):
+        return self.stop is not None and self.stop.is_set()
+
+    def refresh(self, quote, attempts=3):
+        """Fetch one quote, waiting out upstream throttling.
+
+        Returns None, without fetching, if the run is stopped meanwhile.
+        """
+
+        for _ in range(attempts):
+            self.bucket.acquire()
+            if self.stopped():
+                return None
+            try:
+                quote.fetch()
+                return True
+            except ThrottledError:
+                self.bucket.drain()
+            except QuoteError:
+                return False
+        return False
+
+    def run(self):
+        today = datetime.date.today()
+        run = RefreshRun.unfinished(today)
+        if run is None:
+            run = RefreshRun(run_date=today)
+            db.session.add(run)
+            symbols = self.stale_symbols(today)
+            run.total = len(symbols)
+        else:
+            symbols = self.stale_symbols(today, after=run.last_symbol)
+        db.session.commit()
+
+        deadline = None
+        if self.max_minutes is not None:
+            deadline = time.monotonic() + self.max_minutes * 60
+
+        for symbol in symbols:
+            if self.stopped():
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            refreshed = self.refresh(Quote.query.get(symbol))
+            if refreshed is None:
+                break
+            if refreshed:
+                run.refreshed += 1
+            else:
+                run.failed += 1
+            run.last_symbol = symbol
+            db.session.commit()
+            if refreshed:
+                Portfolio.revalue_holders(symbol)
+        else:
+            run.finished_at = datetime.datetime.now()
+            db.session.commit()
+
+        if self.stopped():
+            print(f"Quote refresh stopped: {run.summary()}")
+            return run
+        revalued = Portfolio.revalue_all()
+        # Snapshots are dated like the closes they are worth at: a run just
+        # after midnight, or on a weekend, values the last trading day.
+        PortfolioSnapshot.take(PriceHistory.latest_day() or today)
+        PortfolioAnalytics().run(today)
+        ChangeEvent.prune(datetime.datetime.now() - datetime.timedelta(days=2))
+        state = "finished" if run.finished_at else "paused"
+        print(f"Quote refresh {state}: {run.summary()}, "
+              f"{revalued} portfolios revalued and snapshotted")
+        return run
+
+
+class HistoryBackfill:
+    """Load each symbol's daily closes into price_history within the API budget."""
+
+    def __init__(self, calls_per_minute=None, full=True, bucket=None):
+        if calls_per_minute is None:
+            calls_per_minute = int(os.environ.get('API_CALLS_PER_MINUTE', 5))
+        self.full = full
+        self.bucket = bucket or api_bucket(calls_per_minute)
+
+    def backfill(self, symbol, attempts=3):
+        for _ in range(attempts):
+            self.bucket.acquire()
+            try:
+                series = get_client().daily_series(symbol, full=self.full)
+            except ThrottledError:
+                self.bucket.drain()
+                continue
+            except QuoteError:
+                return None
+            added = PriceHistory.add_missing(symbol, series)
+            db.session.commit()
+            return added
+        return None
+
+    def run(self, symbols=None):
+        if not symbols:
+            symbols = [symbol for (symbol,) in db.session.query(
+                Quote.symbol).order_by(Quote.symbol)]
+        rows = 0
+        failed = []
+        for symbol in symbols:
+            added = self.backfill(symbol)
+            if added is None:
+                failed.append(symbol)
+            else:
+                rows += added
+        print(f"History backfill finished: {rows} rows added for "
+              f"{len(symbols) - len(failed)}/{len(symbols)} symbols")
+        if failed:
+            print(f"Failed: {', '.join(failed)}")
+        return rows
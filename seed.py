@@ -1,385 +1,208 @@
-from models import db, Stock, Portfolio, User
-from datetime import date, datetime
-from flask import Flask
-import dotenv
+"""Generate synthetic users, portfolios and holdings at any scale.
+
+    python seed.py                                   # small dev dataset
+    python seed.py --users 20000 --portfolios 100000 --holdings 1000000
+
+Drops and recreates every table in DATABASE_URI, then bulk loads the data:
+COPY on Postgres, batched executemany elsewhere.  Symbol popularity
+follows a Zipf distribution, so a few symbols are held by most portfolios
+as in real data.  Every user gets the same password (--password), hashed
+once.  Quotes are dated today so nothing calls Alpha Vantage, and net
+worths are set by one revaluation at the end.
+"""
+
+import argparse
+import csv
+import datetime
+import io
+import itertools
+import math
 import os
+import random
+import string
+import time
 
-dotenv.load_dotenv()
-app = Flask(__name__)
-app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URI')
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-
-# Important: Initialize the Flask application with the configuration
-db.init_app(app)
+import dotenv
+from flask import Flask
 
-# Create an application context
-with app.app_context():
-    try:
-        # Drop all tables (if any)
+from models import (db, connect_db, User, Portfolio, Stock, Quote,
+                    PriceHistory)
+from migrations import upgrade
+
+# Real tickers first, so the most popular symbols look familiar.
+KNOWN = [
+    ("AAPL", 155.81), ("MSFT", 269.50), ("AMZN", 117.31), ("GOOG", 118.78),
+    ("TSLA", 275.61), ("META", 172.19), ("NFLX", 189.27), ("WMT", 133.39),
+    ("IBM", 129.13), ("PEP", 164.85), ("PG", 145.89), ("XOM", 95.59),
+    ("UNH", 517.46), ("CVS", 99.83), ("COKE", 603.00), ("O", 67.36),
+]
+
+CHUNK = 50000
+
+
+def make_symbols(count, rng):
+    """[(symbol, price)] with the known tickers first, then made-up ones."""
+
+    symbols = KNOWN[:count]
+    taken = {symbol for symbol, _ in symbols}
+    for letters in itertools.product(string.ascii_uppercase, repeat=4):
+        if len(symbols) >= count:
+            break
+        symbol = ''.join(letters)
+        if symbol not in taken:
+            symbols.append((symbol, round(math.exp(rng.uniform(1.5, 6)), 2)))
+    return symbols
+
+
+def zipf_weights(count, skew):
+    """Cumulative weights for rank r proportional to 1 / r**skew."""
+
+    return list(itertools.accumulate(1 / rank ** skew
+                                     for rank in range(1, count + 1)))
+
+
+def holding_pairs(holdings, portfolios, symbols, skew, rng):
+    """`holdings` distinct (portfolio index, symbol index) pairs."""
+
+    if holdings > portfolios * symbols:
+        raise SystemExit("More holdings than portfolio/symbol pairs")
+    weights = zipf_weights(symbols, skew)
+    ranks = range(symbols)
+    pairs = set()
+    while len(pairs) < holdings:
+        missing = holdings - len(pairs)
+        pairs.update(zip(
+            (rng.randrange(portfolios) for _ in range(missing)),
+            rng.choices(ranks, cum_weights=weights, k=missing)))
+    return sorted(pairs)
+
+
+def load(table, columns, rows):
+    """Bulk load an iterable of tuples into `table`."""
+
+    connection = db.session.connection()
+    if connection.dialect.name == 'postgresql':
+        cursor = connection.connection.cursor()
+        for chunk in chunked(rows):
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(chunk)
+            buffer.seek(0)
+            cursor.copy_expert(
+                f"COPY {table.name} ({', '.join(columns)}) "
+                "FROM STDIN WITH (FORMAT csv)", buffer)
+    else:
+        insert = table.insert()
+        for chunk in chunked(rows):
+            connection.execute(insert, [dict(zip(columns, row))
+                                        for row in chunk])
+
+
+def chunked(rows):
+    rows = iter(rows)
+    while chunk := list(itertools.islice(rows, CHUNK)):
+        yield chunk
+
+
+def reset_sequences():
+    """Point Postgres id sequences past the ids we loaded explicitly."""
+
+    connection = db.session.connection()
+    if connection.dialect.name != 'postgresql':
+        return
+    for table in ('users', 'portfolios', 'stocks'):
+        connection.exec_driver_sql(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"COALESCE((SELECT max(id) FROM {table}), 1))")
+
+
+def generate(users, portfolios, holdings, symbols, skew, history_days,
+             password, seed):
+    rng = random.Random(seed)
+    today = datetime.date.today()
+    now = datetime.datetime.now()
+    timings = {}
+
+    def step(name, fn):
+        start = time.perf_counter()
+        fn()
+        db.session.commit()
+        timings[name] = round(time.perf_counter() - start, 2)
+        print(f"{name}: {timings[name]}s")
+
+    symbol_rows = make_symbols(symbols, rng)
+    hashed = User.encrypt_password(password)
+
+    step('quotes', lambda: load(Quote.__table__, ['symbol', 'price', 'update_date'], (
+        (symbol, price, today) for symbol, price in symbol_rows)))
+
+    step('users', lambda: load(User.__table__, ['id', 'email', 'username', 'password'], (
+        (i, f"user{i}@example.com", f"user{i}", hashed)
+        for i in range(1, users + 1))))
+
+    step('portfolios', lambda: load(
+        Portfolio.__table__,
+        ['id', 'name', 'created_at', 'cash', 'net_worth', 'user_id'],
+        ((i, f"Portfolio {i}",
+          now - datetime.timedelta(minutes=rng.randrange(525600)),
+          cash, cash, rng.randint(1, users))
+         for i in range(1, portfolios + 1)
+         for cash in [round(rng.uniform(0, 10000), 2)])))
+
+    pairs = holding_pairs(holdings, portfolios, symbols, skew, rng)
+    step('stocks', lambda: load(
+        Stock.__table__, ['id', 'symbol', 'quantity', 'portfolio_id'],
+        ((i, symbol_rows[symbol][0], max(1, int(rng.lognormvariate(2.5, 1))),
+          portfolio + 1)
+         for i, (portfolio, symbol) in enumerate(pairs, 1))))
+
+    if history_days:
+        def history():
+            rows = []
+            for symbol, price in symbol_rows:
+                for day in range(history_days, 0, -1):
+                    rows.append((symbol, today - datetime.timedelta(days=day),
+                                 round(price, 4)))
+                    price *= math.exp(rng.gauss(0, 0.02))
+            load(PriceHistory.__table__, ['symbol', 'day', 'close'], rows)
+        step('price_history', history)
+
+    reset_sequences()
+    step('revalue', Portfolio.revalue_all)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Drop the database and fill it with synthetic data.")
+    parser.add_argument('--users', type=int, default=10)
+    parser.add_argument('--portfolios', type=int, default=20)
+    parser.add_argument('--holdings', type=int, default=100)
+    parser.add_argument('--symbols', type=int, default=100)
+    parser.add_argument('--skew', type=float, default=1.1,
+                        help="Zipf exponent for symbol popularity")
+    parser.add_argument('--history-days', type=int, default=0,
+                        help="Days of synthetic price history per symbol")
+    parser.add_argument('--password', default='password',
+                        help="Password shared by every generated user")
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    dotenv.load_dotenv()
+    app = Flask(__name__)
+    app.config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URI')
+    app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    connect_db(app)
+
+    with app.app_context():
         db.drop_all()
+        upgrade()
+        start = time.perf_counter()
+        generate(args.users, args.portfolios, args.holdings, args.symbols,
+                 args.skew, args.history_days, args.password, args.seed)
+        print(f"Seeded {args.users} users, {args.portfolios} portfolios and "
+              f"{args.holdings} holdings in "
+              f"{time.perf_counter() - start:.1f}s")
 
-        # Create the tables
-        db.create_all()
-
-        # Add your seeding logic here
-        # ...
-
-        # Commit the changes
-        db.session.commit()
 
-    except Exception as e:
-        # Rollback in case of error
-        db.session.rollback()
-        print(f"An error occurred: {e}")
-
-p1 = '654321'
-u1 = User(
-    email='larry@email.com',
-    username='larry',
-    password=User.encrypt_password(p1),
-    image_url='https://encrypted-tbn0.gstatic.com/images?q=tbn:ANd9GcRyBS6Ra1S-o1CTY5XaG8yN6gdMABTDGdnl2w&usqp=CAU',
-    bio='I am an experienced investor trying out some techniques.'
-)
-
-p2 = '390239'
-u2 = User(
-    email='mandie@email.com',
-    username='mandie',
-    password=User.encrypt_password(p2),
-    image_url='data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAoHCBUVFRgVFRIYGRgYGBgYGBoYGBgYGhgaGhoZGhgYGBgcIS4lHB4tIRgYJjgmKy80NTU1GiQ7QDs0Py40NTEBDAwMEA8QHhISHjQrJCs0NDQ0MTQ0NDQ0NDQ2NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NP/AABEIAPsAyQMBIgACEQEDEQH/xAAcAAABBQEBAQAAAAAAAAAAAAADAQIEBQYHAAj/xABDEAACAQIDBAcEBwYGAQUAAAABAgADEQQSIQUxQVEGImFxgZGxEzKh8AcUQlKSwdEjYnKCouEVM1Oy0vEWVFVzk8L/xAAZAQADAQEBAAAAAAAAAAAAAAABAgMABAX/xAAkEQACAgIDAAICAwEAAAAAAAAAAQIRAyESMUEEURNhIjJx8P/aAAwDAQACEQMRAD8A3j420jvtEyI6k8Y5KAjUSsa+KZogVjvvJSUgIjMOUICMEhqdA8oWkskqIGwpAUwvMwgoqI8mNvAEQIOUdlj1WGRILDQNKJh0w3OGRYVRFbHURqURDqgjVhA0A1ChBPFJ7NPZpjDCkQpCB46YwDJFFOHE9aYAD2cdlj2iMZgiWnssS8W8xhbT1p68S8xjGq8MjwCJDoJdnKh+UmOWmI3NPZoBg+cCIakCAYREgDbHgx6xAIogGQZJJSREMOhisKJIaODQKx6iKUCgx4gxHBpghAI7LBh4oaCzDwIt4289eazUPzT2aMiw2CjzGMMdEywWGht568flnssxhl47NFyz2WYxlgk8qxlXE6dW0JhWJXM0tZzUOFOPVIlKqrGwMkBYLGSBhIto4zwEFhobaPVIREhVSByCojUSHRJ5FhVEVsokIojotpS9I+keHwSZqz6/ZQe+x5AQWFIup6cP219KWKrNlwwFFedg79puwt8IfZX0tYlLLXppVHF8uR/ELZTr2CbizaO1iOUTC7P+k/BsF9oTTLG1gGbLqB1yBYb76X43tN3h6iuodGDKwBBBuCDuII3iAYcFjssIFi5Y1CWDyz1oTLPZZqNYPLFUR5WeImo1jGEaWERjK/HlivVaxBiSlQ8Y2WYnpU0cUwFjqd0L9YMH5EHgziadLalOo6lLqHYDzh63TtypAp2PfMY+PDFmI1Yk+cj/AFrWdTOeK0a7Y/SbEGoFtmzMN2lrmdhwKEoC2+cs+jnDI7GowG/LrwsQZ1nDYpHGVSNDbynNLJc+K8Oj8VQ5P08KceqQwSPVI7kTUQapCKkIqQqpFsNALW1OgERXY+6unNuqPAWv8IerRupHl2HgYDEVRTpvUcscgJIAsW5BQNSTuA5wWFIqOkW2fqyFi2Z7XAVfdHAnX5+B4L0n242JqF2QA3NiWzm35TR/SVtZjV9jcZls1W2tnYA5ATwQHL335WmAp02c2UEnzjRV7YW60hobSwHae3+0VFud4HfNLszoySA1TQnhy743aPR4oeqL33R7QOLKZQye8oI5g3lvsnb1XDOtSlVdCutszFGH3XS+q90p6iOhysptyO6NsBqNVPmpgas3R3rod9JAxTCjiKa06p0Uq3UqfwhtVO/Qk7pv0qAz5Nwlb2bKzKHUEGxvYjiLjUeGo3zuXQfpGKyFPaMzU2CqWILtTYBkzfeK3ZCeOW/GTlJxd+DKKktHQ4l4Omd0Ux+WidDs0azRrvaR3rwOQVEITI2Kp6RDiNd0WtUAUknhJyaaKRTTK7ZtPfmve5/tJ2ReUhbMro5axGjcDLTMvOTj0PLs+c/8KSRUwKAm8stZWqMzkT0DiVnR+hWxwcNnQjrlj4jSXfQ/CPTZxUtcseN+O8SR0HwZXB0gv3CT3kkwtChXQs7ootf3STccNJ42XJKORvyz08fGUOLfio0oSEWnKDYO30r3CsCVYqw4gg2IM0KtO1STOaUXEeqR4SNFSeNSOmibsJaUW38RlZBplVXqsCNCUt7NTy65DfyGXIqzE9NccFXE62IoIO64q28ywEWctaGhHZwvatc1KruWzFmLE873Yns3y+6J4NcobLrzmedbm/Z/+R/eanYuLp0aYz1FU8iQD5Sj6Q0e7ZqloiRsdUpIuao6qO0+nOATHl1vTN9NJk8QpL5qt3cmyg6gHkq8TMnY7tIssfUw1cWWoLnQXBW/dffMpi8M9F7cD5MORlvT2k7tlVGIvls2Xfx0tpLDaeAvT6w4eU3TErkjK02G8e79peK9o7JvfosxATEsjH30uvbkYad9mM51qr25aS62Pi2RwVbKykMpHnp6902SPKLQsHTPp+piFVb34Sg2l0vw1EE1K6LbS2YFr8go1nEds9L8dUuj4hlXdZLJw4kanzmcWnc67zx3k+MRQlLt1/gf4x/Z17aP0p0yctCmz66s10FuwbzM1tL6ScVqEVF5HUn4zJ4PD2PhK7HN1zGWKPuwOb8NXT6d41rZqxv+6Ao8ZY4vpDiqqBTVO6xC9XzI3zn2HPXHfNxhqqKglI4ovwnLJJei7NavSJZKjKTv1v8AAyT/AIniP/UP5yHVx3ISP9cMrwj9EucvsT2t5BoL+0MltTyyJhn65iyY0V2d86FUW+qUju/Zrbyk58HWKMGKE62sDA9DWvhKP/xr6S0qVHVWJANrkW4+c4JY4yjbv3oupNPRyzoClq2JNtRiKoP42nTab3nNeh+1USpiA4Ab6xWJ/wDsaaap0uwyg/tBe+msGPtnRl2kaT2ova8dOUYHpa9THkZrUcjWHM5lsfK86Gu3qCgZqiC4vqY7klPi+6snxdWuui0yzmH0k1Sr1RwelT8rsPW83GL6RUFQt7RSAOBnKOmO3kxTZ0BAyKmvHIztf+seUF3JJBjFpWzFqtyBzuPH/q8bSZQCFp5mAuSdT3i/oI+kbBW+6VPreXGysAhdswG87+3WdF0TSstOhyPZ8wtdSQPK/rJ31Cm7WIF9/cZGxG0Pqx6v2hlva9pEwuJrO1smhcHPfW3EnlpNaRStbLyjsumnWtc8+PnK3beIBUi0salUgWJvKLaRvFchkkY/Gpdjbst28IXDEgK3EXH4Tf0vJG0jkKsBzBgMO1xc/e9QRHT0Qkv5E3E0wwDAbxf8iPAwCUSJJ2YwKlT9k38zJrUxKRjaIyk0yDQZr27JT4/3zNGiamZ3aHvmZqjRdg6B1l5hsaCQpMoqO+TcEOuO+GIJUbKrRUJcDW0ofaGX9U/s/CZ60oTDDG34SPhqgzkz1RRbSR6J3yTLRVI6d0e+kOlhqKo6sxRcuUWubbrXly30p4d6ZK0qitY6EL6hpw6spveImIO685XhaTSbpl+cW02jS7N20oZy41d3f8bFrfGU20Lklkva8rWJvJ+GV26oF5aEFFuvRJzckr8Ew20GQgi4YcZLx2NLrmZrta39pGfY1bU5ZXuCpseEdprbRNStUmWB2gxXKCdeEnViBTKDUqbX7RcP/UfhKvZ6gNnYaIC4HMgErfxEsayZFVDvsMx5k3vfxkXFJ6LqTa2RU3W7D6j9PjJ2Gx2V1/eUeY0P5SAvvDukfHGwUjeGNvnwjNWBPjs2mIxKZMzgEDnz4StpbSqt1qYW2trcbdmvxkTAYpaihWFxxHbLOhhHYAZgE5AAekVa7LxaZIwWIrOpeoqgbtDc/pImKe5MsnRUXVtwmcxmIuSBB2wWV+1XzX7I3DL1R/EJKehdD3SPSOgA5/8AGOnolJbsJsxrMf3l9Cf1lg7ynwz2dCN2q+olwlFnJ4CVg30RkovbEpOLmUG0PfM1+G2WTooLMdyqCxPcBvkzDfRpXY+0xdelhaZ1/aMpe38NwB4nwmk67AqfSOfUd8m4VgHE6fgth9HsP/mYsYhhzdnHglEajvvLmh0l2FR/y8Mg7RhH/wBxS8VT/QXGzDXzJZdTbhKz6hV/0z8P1nUl+kTZRNlZF76Dj45If/znZ3+tQ/CP+MP5H9A4I4B9YbcTDU6pBkrH0UIzLAUMOx61tIXrsZbJDrcbpEOHa8v8LgS4voJe4fZNNaZJIvbUmZKxJSowO4y/2DiEU3YTz7EcksBpLTZ2xMym2/t0mUeL5GcuSpLsnvtdCCMo3TC7TANUkbjOg7J6Js72YdtzcCScV0eo0nCuiXsDqAbgnQg8oM+VJff+FPifFc211+2YTAYW+p3Er5XDHzyqO4x20AbDnYf7RN/tbo2yIHVAFuL2I0zbri0yu18BlD/uhPiDf/aJJtPaZTjKOmigZeuJH2gNP5v1kxl3HkbSPi1uwHNtfAkQoVlfRrMjXUzofR3B+2pBqlU082qDKCSu7NqRv1t2a8ZzyoQWPIm3/Uvcfjnz2Q5QgAFvujQD4QuvQxvdM6HU6MYZ1GavV03lSgLeam3hH4fYmBRSi4cPcG7vdn/lJ93wtMl0f28zDI519e6aZMWw45h8Y1KrQjcrpsqtvbBRKeejmNvfViG0+8psDpxEwitZyO31H9p1I1wRvmM2xsKxY0hcs113AKLbr8gbwKNukFypbM0uh7m+fSdQ2N0ZfE00qLZUYA5ibX52485zaohvcix3MOR4HunSugG2HNH2Gb3CSOevAdm/4wW10BpNbNZgtirSXKtVlG4ikBTzfxPq58GEI2BwitmNOhn4s+Rn8WclrznXTfpcylsPQc5t1RwdV5op4HmeEr+j3QQ1k9riHZM2qoLZyD9pi26/LfCoiuR15Kqbken3KyegMWpTY8T4TnA+jXDndXqjvyH8hDU/o+rprQ2m6cgQ6/FX/KZoCkdAo4QNfOoPeL+sd/hND/RT8CfpMPSw+3cP7rUsUo4XAa3ecjX8TJP/AJNtT/2ap+Kp+kA1nIjRcbxLHBuctiOFryUWB4TyheUZq+zJ10OFZ0Fk0hsJWe3WN41CIZEJ4Rlr0V78JrbSfLa0k7Ox7jt1uP0MhJR5wvtAsDSYybRev0mejZlW54gjS3EXBlHtTpY2IcOyAEABQNcoBvvPbI9apm0gEwq8powSdrsLnJqr0aGt01q10FI0wASMzLfM1jppw4SLtVOqxZWGdVK5t9gWBJHC9gfGWPRTZihjXOgTRRbee88r8JC25VzOetfX1OgkpRS6HWRy7MnSXVgf4vW/rK3Htdj2fJ+eyW1fqvfkSPheVmPpHNpxNx3HUQx7A+iAiXPdaWjpdM53knf2HSRsNQ61t4B9JbPhLsNDa1+zS+h/pjd6NHQLDUiLHlrNLgto3UA75W0KOewU3JtusfKWbbKCobHr7xqbC32Y2OEm9C5JxSSZY0XDC5gq1IC9jcHeLyvwFdjdWBBU2IOkkYyra1oW/QJeAK+yVfcLQGG2biMOxekWAKsCwF8txa/hvv2Sx2Ri7sUY8Mw/Menxl2gT7WveT8FE6fxxyxvpnI8ssUmu0ZXoV0VZqjV663VG6gOudxvY8wPie6dCBuZV0qgRhlfqk2ZXzC1/tI5AP8pJB9bRHtvN/WRlBw0xlNT2iZRp6SXRkMYtNBmtJ1ESDZVBqLWaTvaSvIsYXNFY6ZwBVvJNHCkw4pqsX6zbdKWEImGC74Q1gN0hNVJ4wZqQ0YlvXJgWeBzxyiEAZJY7Ow5qOqDidTyUasfKVyTS7Dp5KZcjrPoOYQcR2E3/AAiNFcnQk3xVlxjsUlOnZBZRoqjXj8ST53EymPUrlV/fZs7j7trZV/2/iM0GJ6i+0exKi1NDuLW989g+d8zOOVh1nJLvvPG28nsvr5CRluTKx1FFNj21JH3if6QR6SMykiw38Oy8s6eCdydLZiLdmgF4lPC3zEbg1h266mZppWFNPQzZ+C3aS0TDkkKNSZKwtA6AC5PCXFOgEFhq3E/kJXFhcieXMoL9kPDYNaQ4FzvPLsE8xh6hkdzynoRgoqkcEpuTtlTtfaCUCrHUsCLDfYHQ92plFX6QO/u09PEzRYzZ6O6u4uVBGu7ffd874tbBrbRROLMqkztwu4ozeH28yOjGmNN9iQeIO+/CbfAbRV0DKDqToOFiR1m8JjsfhBr1ZsKFTqjIlhYW4Dwj/Fb2iXyktMJXxL2/yx+PX0gcNtwJdSCLcCNRy8O6Pqu9tQv9XreZ7bNTKPaAWZAdDqCDp4i9j4TozRuLObC6kX2K2wr2CsikG93ax8BNFsbpGjWRic27qjNfuy3nGzj2b3iNeSL+Zj0fk5HmPKec4NnfcUd9balPiWB5FHB8iIv+KUfv/wBLfpOCV8VWtY1HI4jOxB8L/lK/2zfvfGLwY1o0Be+8xM8CGi3jjBGeMvBs0VBAYOghlg0EMiwgJGEwxqOqLvY27hxJ7ALnwm2oUwTexyoAq9oAso79BKfo9h1RGc6u/VHNEHEX5keQl/QcAcgASPTzvfylopqNrtnPKScqfhT7YUhg76sdy8gPdRR8SefcJWnDmq5LDQWHfYa+HzwkzEkvVzncBZewbtPjDIuUE8yB5nWHHgt34bJn4qvQOJpinTLgagHzIsPWVmDw/VVQLk27yTLPbL3yJ2Fz6KPXykvZeEyC594jX9wf8jGnj5T4rpCwycYcn2w+HwoRebfaPL90QVV5IrvfQaASI1p1wioqkcU5uTtgHBMYwhHYQLNCwoa67u+K40jS8e50nBn/ALM9LD/VFLjU3yfgHzU0uzmwykC9tNOzlImLEJsRzZ05HMO46H4j4wfHlU6+wfIjcL+iU6AbiwPeR6Si2zVbKysbhgRm4i+7NzF+O+XtdrTM7ffqnwHxnbk1FnDj3NFAgEkU1HDQyKiSSt+M4UdkhzuRv8/1jfAeU9UOvMQNhzhYY9FqGni8EWnl1kS4VTDoIJEhlmMFQSVhaeZuwak9kipLJ1yLk+0dW7+A8JmzJWwn1pg2ZTltoLbrcrcRLfC7RLo2liMoNt3HcOEzGJchGI5GE6N4vrGm29gbfykkf0n4SmGTtLwnminFv00VO94dxov8Y/OCQQtZrJfkR6z0YqkeXJ2wNCn+1es44haa9ij3zy1J9ZYI+nfx+8ecq3rcOXzaSEqc5oxSNJt9hqryI7Rz1JHd/n5+fhHEoVngHqRHf5+fnzkKtV7YsmVhEm4d7kw9RtJXbMe7N3D1lhU3Tz8ruTPTxqopEHEjSQcLifZ1MxUkEFSBa+u7f2iT68p8RvkVJxaaKSipJpl0doI+gYqfuuLX7BwMzPSJtw5nXwh8awIlHicQWsGN8twDxtwnQ87lFxZyr46jJSTBqp5wqORAgjnCCJEpJfZ6o/xgrGPOptJGQRJPZSENEhYVBBIIdBECFUx4MHHJqYTFlgUyjOf5e/70ZUqXMk/X0CBSq6LxF/hwlfXQk3WwudAt93AkHdA4vsZNdA8eMyFRxt467oLoxhmbEplGiXZuwZSu/wAYDEYq1wdCN83vRvZXsKILj9o9mfs+6ngPiTK4YuUiOeSjH9sIVja5JRgN+U27+ENVFpErPYz0jzPSHTc7wLnix3Dnb9YQVwN7a/Pz86RDTJJDuFUEgAbyO2IRTX3QSeZittFFFMlNU7fj8/Pwj1K3b8/PzyivUkZ6vbEc6HjislVK3bK/EYiMqVCZGYScpt9Fo40i32E9y57F/OWrtKTYNTVx2L+ctnacsns6Y9AazyqxMn1H1kDESTHIeKfqShOpvLfFv1WHZKcQoSQ4COVrRBPRkANh14wntIJd1otorZ0RWierQqmAQQl5iIXNA1HNxYxQY1064PZMZE+hhmZbi+ljbeTrvPrblJmGWs172UC3vIRn5m+hvpI+Bx9mVEGmax4k9w/OaPE1ECG7Dw19I1ujUvsoMDgFqYykG925Zhzyagd150XFnfOUVce1HELUUkgA23g2bQ75ssBtVayZg17aML7v7Tq+O116cfyYybvwsa7i3hIbi9xCB82nEfHtjbWIPgZ2HGtEN6YzEke8AfEaH0EBWEnYlePI38OP5GQ6piyRWLsrqokdkk5kvwkdxaQcTojIB7MSBiawOi7ufOHxLltOHrIlQACTk/EWivWSti1MrkfeU/Ay7Z5l9luTWU9jX7BaaINOWT2Vj0DdtZHrwzjWRsSYgxVYxt47DK0Sbi3kGOhJDgY5RGiFpLM9BgrY+NtHtH+wblEOgkKYpaRAxngTGOeiYtSJiKl17pGK6HXhIe/UmFKzN0XOyySwsbaW7bce6bXB5AgGnL/qYDZ1ezeE0uBxNze/d2QXTCuit6WYFlYOBdd1xwvuvKnZ2Pai+ZTyuDxHETetUVlysAQdCCLgzMbT2CurUjY/dO7+U8PGOtbQso2aLCYxaiioh/iXiJYU6ocflObYLG1MO91uCNGU7j2ETVYPaS1tabBX4oxt+E8Z2Ys16fZxZMNddFy726rbuB/IwTKBwJ5cvOCTaA92oMp7ePjxjiwGqMO4y6kmR4tf9oFVc90r6yyZUrtxpj57pEr10HvAX5Xt6mJKi0L+iDUWVGLq3NhuHxkrH4zN1V0Xja+veTraVVRpyZJrpHXGNK2SqSsjIxtZrEEMraXsQcp0PYdd00lN5jgJosBXzKDx4zmZSJYuJX4xtJMd7CVWLqzIZlTXbWCi1N8QRiT7HCSUGkCg1hiYJFsa9EJ1iZzEJj/bnlFHsVRCKsQQyxiAN9FJ7JXydjPd8fyMgCMhWEa4I52B+EudmYm47RoZRCT9m+8R+7BLoMWavDVb8Y7EvYXldhzDYr3ZkxiuxlFauu5huP5HmJS1UZDY3BG79QZNoufaWvxk7aSA0ySLkXtMmCSsFhduGwWqMw+9xt2jjJLV1tdGuvK+6ZkxwYjcZVZZEuCRePiFO8nzP5QdauAvVsL8haQlN4Cox5wObKJIV3ggIkcJNm7YoEkYauVPZAiKsBRItn2gCJWYiveDeDMyQJMQzwiiejEwtOK5nljWiluo0evPRIWYB//Z',
-    bio='I am a new investor who just graduated from University State.'
-)
-
-p3 = '209320'
-u3 = User(
-    email='ryan@email.com',
-    username='ryan',
-    password=User.encrypt_password(p3),
-    image_url='data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAoHCBYVFRgVFRYZGBgaHBocGBwaHBoYGRgZHBgaGhgYGhgcIS4lHB4rIRgaJjgmKy8xNTU1GiQ7QDs0Py40NTEBDAwMEA8QHxISHzYrJCsxNDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NP/AABEIASwAqAMBIgACEQEDEQH/xAAbAAABBQEBAAAAAAAAAAAAAAAFAAECAwQGB//EAD0QAAIBAgQDBgQEBAUEAwAAAAECAAMRBBIhMQVBUSJhcYGRoQYyscETQtHwFFJi4RUjcoKyM5LC8VOi0v/EABkBAAMBAQEAAAAAAAAAAAAAAAABAgMEBf/EACQRAAICAgIDAAIDAQAAAAAAAAABAhEDEiExBEFRExQiUmEy/9oADAMBAAIRAxEAPwCMe0Vo8zKIxSVo1oCGiiijAVorRma0H43iWTaxPeYAEDYanQd8SsDsQfA3gQ4x2N3tbuNrDqDzMx1ccdhtz74Ux0dMCDsQYrTlTjXvdbL4b+p1k6PEKym+YsNyDYj+0dCOoEe0D0OM3IBUDqSdBCyVFbVSCOoN4gJRR4oANaMY8UBDRR7RGAEbR4ooAWWitHiiKGtGkorQAgY0kYJ47WKqoGma9/Af+40rEZ+JYrtdl9uXKCcS4JJkKtU23lGpMtIGTNUmOLzRhsCzbAw3hODMTtJlOMS445SABQ6byz8W1hbf6Tq/8CNrWmarwUrsLEbaazP80Wafgl6OddyTqLTVw+qabqxbsto32l1bhxW5J1Hf9plUEgqbH29TLUk1wZyg12dRSqKwupuO6WQfweoCLD8oA8N9ISgQQikiI0AIxR4oCGijxQAnFFJRFEYoooAMYC+IhYK1+4C33h4znvic9lPE/SOPYmBKNMubDWH8DwcCxbeU8GphUzcyfpOhw42meXI7pHXhxKrZpwmBUcoWw1IdJnw5hCgk5G2zqSRNl6CR/hgdxNKpeaPwxJoLOaxvCV1IWcJjqeRyMvPv9xPWqlOcV8Z4YABlAvpfrv8A3m2GTUqZjminGwZ8PfK5v+bbppC8D/Dq9h9Ldq3sIYnU+zgYjIyRjRgNFFHgIa0UeKADyUjJRFEYpKKADGAviZLoD0Ye8OmCfiCmDRe/KxHqI49iYL4XWuuXpOmwoJtpOO4a6oxz3vyWxJPlOkwvEat+xTY7fy89jvMssW3wdeGa15OnwgHOE0TpOVp8XqJb8Sg1jzDJf0vCOG+I6J7LPkNtA/Z+uh8pzODOhTj9D9FbzVktznMUviHNcUhnbmE7YHiw7I8zKE4ziXYqyDwD0wfMZjGov2JyXo6msdNJxHxdUJuttrfv0henxGtsaFRh/Qab+wa/oIA+KK2cJURWyubG4tZl3FtwwsbjeXji9kyMklqzL8OjsMbfm+whUwZ8PkZGAGz/AFAhMzpfZwMaNHMaMBRoo8BDRRRQAlJSN4oiiUeNFAB7QP8AEF8mUC99d7bfWGJmx9MFR1B0+8LrkcUpOmcpw5MzO7bkHuscyXt5E+kKUlcnIrZFsLX2JHO8jhF1JsPmLAciCLWv3gnXlD+EKWGdKgPcpb/jeZzm7OrHjSVMGcQw7BFBq5ivQE+99PLpMWGwC4iqlNrkKCzcvmsAPa8PcTxCBOyj6fzAIPPNYzN8MJ2y7fM5ue4DQASdmotlOCckvRt4JgPwfxcMQQQ2dSN2RlUBrnoVIk6fAUzhnLm19QR7zoeIYduxVQDOgIIOgdGtdSeRuAQe7vmR8cPzU6inpYN/xJmTk7tGiiqpo1cBwqpUY5nYFbdog2+/rAvHsGazvkNk/iABoDclEps2vMEe7Q3hXc6pSbUbvZFHeb9q3gDEmEyZKd7tmLM2xLdp3e3LtHyuI1OSJlCLZnp8Fp4egwCgnISWPzMQLX7joIBh7H41moFT86tkc9dSbj/t94BmuK2m2c3kKml8EY0eNNjAaPFHtAQ0UUUAGBkgZASYiHY4jyMlAB5RjaOdCL28JeI4gOLp2c/RGR0UkHs/Q6ees66hiERA7+XUnoJyXGkyFHHUjy8ZpeoarAKdAEOummt/eYZIt02d2Oa5os4pjxUYNsAdv3zl3BOIK1UdlgOunqbHaC8eERkRlcltbiwF+ghjhHDGJ7KP2rW2F9Li/lE4rUpSbZ1dbiyKAqjMeeugsL6x3rU6iXvY7i24MwcN4EwDM4JLXOpAtsDb1lWORkqLRp0wxILOc57A0FzpvvYd0ycWaJoLcO4hbsMb62DDmbXsRyMmrg17c8jeV8oJHfAHD17TEnQOL+QLEeH6zLV4gzVs6aX1DdByH0hGLk6M5tRVhb4gCpkpqLDVj3nYEnmd/WBZbiK7O2Zzc/vkJVOuMdVRwTltJsUYx4rSyRhHiEUBDRR4oAQEkJASQgMlFFHEQEhHkRJCAAn4iQmncD5SCfDb7wJgMWUYXOmq+R1nW16YZSDzE4jFUjTdkPI+0aSkqKjJxdo7RwlZMpsel+XmZt4MtWmBlY6bXs1haw37pzvAMWCcrHwJ+k6dKlxYHznLO4uj0MbUlYaw7VX7LvlXqAATca68ry5qCUkY731J5nz5wZgHLML3IA6y7jeOAQhdgLaa694tIbb4KlwADjlFN7EX7R8209ZhwDlgW5bD9+kxYXCNUdaSfmNz3Kdb+Gtp0GNw4ptkXZVUePZGs3hFRdHJlblGzPFFFebHMKKKKACiiigIUUUUAKhJiQEkDAZMRRgY8AJSQlcleICU57jGGzu1vmFrd+gnQEzNiMHn7SfMOX8w6ePSVq6tDjKKlTOSpo6MM4KjkdtOes6vhHElsMzad/PY+suo0FqLqJGr8PIDcXHSxImEpxlxI6owlH/lm2lxlBqGF7kDyt/aDsRxYv2ady5JtzG9temt5bT+FVb8xIvzv++Q9J0/CeBJTG2vlIuMeuS2pS74Mnw1wY0gXc3dh3aDoDLOL4QMpqKO0jZXt0sCD5X9D3Q5iXCKWOgAg/4afPQLnX8R3bXozGw9LCXhTlJtmWdqMEl9OWihniPBirf5evMKTrbuPO3SCKiMpswKnodJu4tHImmRvEYxMaIZKKKKACiiigBVHkBJXgMkJK8tw+Ed7WFr9f0nQ0+ErSQsRma3PW3hHGLZLkkcyTaTKEW74RwvCw7Gq/aN+yDsPASriAsrHxt9JooE7mWgmYXGtwCD1vqIkYqfCX4amURSBpkX6CWV8rWNt9/sJpVGd2WigLfioOyfnH8rdfA/veFEpB0g/AVkpMUd1C1DYKT84OgIHTXU7bawhhVNNzTY3G6Hqp2nFnx09l0d3j5dlq+0RwwtvCdOqABB+O7OomL+PsSb7Cc1HVdlHxfxGyfhp8z9kDx0hv4do5KKr0AA8h/acZhqT165qkEqpsnediR4TpeCcfos5w4ZgyEqpawVyCb5GB189+U78GNqNnB5GRbUGsVRzAciLFT37Hy1lGRXFnUHqCAR4ibapH76HeZKxyODsGFr/wBQ6+I+k2OcHYng1NtQCh/pOnoYJxHDArhA240J2v0PSdPUXn5n9IFKF66oL9/cBvJ1RWzBT8PqKLlD5dq3kJn8Z3GHsyZhsCR5DSUYjCI63ZAenI+RkuHwexx0UN1OChmYU2IKi5DajXlfeKTqyrQBw9BnNkFzz6AdSeQhHA4IX11I3P5V1sDbc6kCauEUsgItfNvNQwYDZkJW+hB1Ug7g90uMUTKRJXWmwJ26nxGvvC2L1Q99veBeMUSEFtQP36whwqvnw4PMXHmNppRnZUTYDTlb21gSqA7lXva+ttTbnYdZ0lGlyMCYynlrHygMZ+I0C34asAxsApVx3fy295hxLnKfwkOa9ruBYa2PZ5nx9Ju4vwsKKdQfMHGvdzhJMIM56NqP92v3lrWjN7WcLiOEuT+Lcs5NyTrdrbG8NcP4+DkWqlhsGvYq+zDXblodNJ0QwyhgCOy+h7mA09YF4twpKbhmH+XU7L/0t+Rx9PSD1lw0NOUOYs1cRxWXRtNNO/vEF8Jo/i1ghF0uS3+kDn52HnJYiq9Nf4aoM6fkYfMp/KQeY7p0/AeG/gU7uO21i3d0W/d9TOT9fWf+Hb+ynB/SvE0RmSmmii5IGgNrgLYcr8u6c6vAzlBXcsWuNCDmuCDynUUR22J5A/e/uTLKFPQDoPoBOu9ejha2fIKoY+sKZLpnKkrddCbcyNte6bsM5q0CxBW/I6lSNtZoo0wabDqSfeWYJR+GR4yW0WkzNhaudLH5hB/DjarUc/lUzVU/y3U8iQPWZnTJ/EeAA/3GTXI/Rsw7ZcMDzY+tzNHEKwRAegv58plcf5VFf5mH3Mhxc5nRORYeg/vHQjdw+lkQX1Zu03iYpqYhRfyEeTRRzlFcjWO0JZbiDcDilrLkbSou39Q7u+b6BNu8frGkJk0phgUbY/vSYuAUyj1qB5EMvgR/b3hFNSCJCrRyV0cfmBRvH5l+jSl8EzRSGuu4gXiKXqqOv6w9il0LDlrA9L/MxAbklr+MQzdxmldAOkhg+0iHoLHxGk2Y1bsBytMvD1sHXo1xAH2TxNLMrAb7jxEjWRa1GzDRhY+PP3msCZ8OMrunI2dfow/fWAmjneEoXroj6mkWBJ5hRdD9PQzrMQ4A01PMdOsAJTyY4H+dG87C/wBveHsQtxeN80wj1Rlwyds99/e8dD+/T9I+Gft28CPMSG0GCJYY2QjvP1k8MLK4/q/SVodx1+8tp8++xkFGbidLNTbqLEeUy4rXDl/zOVv5Cb8f8lhu1gPOR4jRtQy9MsaJl0UEXakBsik+YQD7yKJnq5vypZR3sZJ2yZztoLear+krw7Hs5RdtcgPf81R+l+Q6e1Ab3fPUyjZRc/YR5UrimMidtzqe882PQRRUFnOHB5hmU2YbEdZt4fxA5slTsv15OO/vjYAgjTzE0YzAioumjD5T0MENm9qRvmXQ8xFiq1wrHQh0B8S2X6NMvBcWW7D6OunjaaOLuEou9r5Rc6dCDfytfyjS5E+i3itUhco3bQShaApU/wCokXPnL6ADt+IdrC3dprKOIPmKL4n0iYze5zBW8jMuG0Lnob+Wt5LDVbWB2I95NadnYcihiAutymfFDKyP0bKfBtPraX0z2R3aH7GRxaZkYc7e42jAH8TpWrYdxyd0Pg6N91hJXmbGrnpq45Mj+jAn2vLA1if3pGIzq1qo7wR5qbfSSrHtH/UPqRKMWbOh/r+ovJ4lrO3j/wCY/wD1BgiQOhPl7zVTHy94mJTfT+o+lptZreQHra8koZVzvfkg9zHxIzU3k6Ysned/GIL2Cvd94CYC4nUJcUx0V3J2AygLpz1Dad0uw9QnsUtT+dzr/wCz3QZj7vWdaepLAMQdsqKtr8toZoKuHQINW595+wlslGyjTWmOpO5O7HvijYekT2335DpFJGAMMlrOhuO7Y9x6GGqRBAYbH2PSc29B0YvSNjzU/KwnQcIrJUQkAqw+dDyPX+8qhWZuI0SjLWTcfN3wq1UEK41VhZh4x2phlK7zJgUIV6Z5bee0QyyowRMi8tvC/wChmZG2vupNvC9/pFUa6qb2Y9j/AHKd7+XtMlGqCzWHyk+igC3t7waBM3gaZTyJt52t/wApowrHS5uRcX7rn9JleoMisNidfAy+kbKdRoWv4C+sKA0on0H0k20v4SGGfMFPnLH3IgBlewpOP5VYf/W4+sb50DjmAR33Fx9ZayXLr/Mo9xaU8DqFaFMG9wiqbaG4UA29IPrga7BvEaoyq19nT6kGbMWhJJFhvy7xB3GTdXYCwLK1hy7Q0mjD4xHQI7hKhDXVjY6nQi+48OkoXs14IXsb7/rebWH79vvMuGBHL+W33mqodh/UL9wJ1MkByvKRfRSdNAe7YS/EUwpFjf67wbxmrlovb5ipVf8AU3ZX3IhHkHwAfhs5aLV3ADO9Rhz3c2N/ACb+Fj8Ry7/Kuv6TBXICpRT5UUD0EI4d1pJ39OpPKOTEkE62KsL20JsOp8opDB4ZiQ77/lHJR+sUkoBVKjqgZ2vyDr2XFtNQdG2lyu1kqLlFQKAbaK6k3ysvny2lOJrqiIjrmDkhQdN23J5DWRXB5D/ltmtplY3t4NuB43mGbJKNUzq8fDGVtotpYooWVr3LXVjpcHYZhzG1tNoTw1Q8+138+68w4bFDNkqLlPQ8x3ciJsFEKcyHQ7jl5dJyrJNStHZLHCUdWidcqyOb21BIP8w099PeAHrBapIZbte+o1uxFj7eUOu+a9tDzHgbzmeLslspHa28D1nfhzKar2ebnwvG79BmgS1NU5jn6j6i/lN+IcFAoFts3S1xfXzFzAlOkiU0WwDPqSNCBoNCJtoUVY5CSwXUBmLZjuWNzrLaTdmVtIJ4KrcC2vh6n3mlmPT3lOGFhb96zSdoAVBjnF+hHprGpra4G12t6n9Y1Q6g9CPfSRD7/vW14ADeK0xkfwv6EE/SCfiKmppUnI6r7Aj6GHsYl6bDqGHqIB4u2bBBv5XQ+R7P/kJa7RMjb8JUR+FY30vrcg+oht1cbNcdGH/kPLe8E/CX/SvDbSX2UuiJc2GgHne053ivGFNRKIPVjYcl2HqQfKP8SceSiMpOvQbnunD8Lxb1MTnZSLhstwR00v4AxJpA02daawU6am/mTCnB6GdyX1ZbeC35eMCIQgLnVgNOgM6Xg9I06AJ+d+0fPYekACL1L6DbaNMj4kILkxRBZirqmIORwGzAgC9rAHcHcHvj0+FNSFhUz9Fa17f6h6azRw3BLRUX1dhrz06DumXGKadVqqrmRkAe2uTKenQ35dDM8sU48qzfDOSlSdF60UcFHG24OhB7jyPfMX4b0SbsXp73/MviOY75pdQ6BkftflbfyPd3cpioY5g5SqMrDUdGHUHnPPl/h6cL9hMsDZ1sRz8Jz3xLSCOtb8pFj0DflP29IRo1vw3IB7Dbf0np4dJZjlV0ZG1RhYj97Ssc3CVkZcW8aOcTiYKi5vpYeEu4ViS1ZW8bdw6Tn8Th/wAF2Q621B6qdj4wtwaoM4npWmrR5bTVpndo+g9feaM+kALjQANR698vbiSDnE2l7Eot9I116lmt1/f1AlSYjtuL9D5FR+hgrFYwv8qkeMoyVCxba4A36X/WRLPCPs0jgnL0F6uIG14DL58O9K2pWw8Q11+gl/8ABE6s15oTCDnMZeX/AFR0R8P+zI8BrtSphGFzztrLsZxCq4ISynqbkjyl2HQDQCbAh6TJ+TNmn6sEc3h+G2OZhdju7fMfM7eAkOL8NuhKGzr2lIvuJ1Kp1lOKUAEWmX5JN2aaxS1RyfDqn45QWtr2x0K/MP31nTYziQuFUXbYATkeF3StXa9tQoF9AdSW9LTouHAIQ5ViP5spt6nYe09SDuKZ5c1rJoL8P4cdHqG7bgcl/vFJVMbpc5lHUKSP+4aRQpk2ila3zuxsP5uiHkB15SFV7oo1S5uArFTvpmYak+0z4hxlFIeLeW/vp5R8UCbAcio8h2vqR6SugHpUzUdlXMmRrMwt2z+bS3lfeXcT4epQ310O/I8iO+EcOgUaDVjdu885XiTdT3kD3v8AaY5IxUXKjbHOeyjfsCUOH6c/UxNgeWvqYW05RZRPM5PU2ArcNTmL+8gMCvJYd/CEiaYhbDgEDAgflAk0wd+UMLTvLRQFo+WLZIFU8FNK4WEQgEaGotmzIMKOcRoDkJqZhKGdomhqx6dMDul2deRvA+Pxy01LOwA/eg6mc/8A45VcnIuRerasfLl5wQ9TssTjEQXJAHfBJqmu1kNl6828BAoUsbsSx6mW/wAKfnptlfQ35Eg3Fx5DWaY5RUv5dEzxy1/j2H8Lw1UF0ABJu19Sx6kzfSTrM3C+ICsgfZhdXXmrDcQigvPTVVweRK757MdWkydtBcbsnJupXo3sfeKbyIpViOPwjEkk7m3q3aaEqXaynxPvaDL5S3cfoAIR4Vqp9vvEOgnnst5RjXsEXuJPntLSLsByB19JRjSC516D0E5/JlUK+nR4sbnfwrWrJJUJlDCxk81p556TRoVpaHExB5aGPKFiaNiNJ/iShFMnksJVsmkOXMV+sg1QCY8TjQo7/eIaV9GxqgEDcR4wBdaYzP1/KviefgJnrO9TQmy9Bz8TILhgOQibNIxS7Bb4V3bO5zN1PLwHIS6nhTCKU5MU4m2VwZEwzdZelNhNdNB1mhQIhNnOYfiX8NiTm0SoLEdH2DfadzhnGXQ3sBecb8S8PzpdRqNYX+EuICpT7V8+z9CV0FumgGnfPR8edx1PO8uFPZHRk6RStTy9Ip0nEcL+J2T1+5hzD9hU9/OcbTxvbAY6DUidRSxQcaeIHO0SZpJBui1yD1ImKrVBYnvP1keHVsysQbZL38lgb+MA3a85PKfSOzwo9sLtUEZX6Qb/AIgvWL+OHKcdM7g6mWWLUAgFcbyEvXEnrBWS6DDV5TXxQAuTa0C4riqpoc3krEDxYCwmROIo+uYN3A7eUvSXbRmnFvhhSpjc2xsJAVFvMyOo1Fv33S4VlPS/tJo0VFgqASDVRLCUPSVPSTp7xUUN+OJJcQsqZE6H1iK0+nvFQGhMUsc49Zj7A5CJqyDkBHQGmtigw6wNwbEGlimymykDMORubXtNL4oXsBfw1mPBa4hzlIGSzXFtQ2038dNSOfyXHRo78VbxTnE4qqaFr26anwinonlUceYawqqaOdHAemhup5W2PUgwFJ0zqPGZRdM0fQawPGCjZihuRYgNofUbQXWpZyWUZQdQLk27tZtpILS9aYluCfYozcXwC1pMO+a1DDTT0mp0Eiu4kPFD4arPP6bcFhSfP68oSwXC8urtmPoPISOA3EKLyjUIrpGbyTl2yIwwJtYWka3CqTasinxAm1JmxdQ3Hj9pZJkPBqWwS3gSLekGYng+dstJmUL87Xv/ALRfnDOIc68vCaqlMIgC6C4iqPwreS9nL8J4W7/iZnPYqOg0HyrbLy7zNL8HqAXDi+ttD+sMcNQBq9v/AJT7ol5vI/flFLHB+gWWa9nHYnC1FcJcHslidtiB94+I4e608+hNxprtcAmGa3/VqdyLbzbWa8cg/B9PrJ/DD4P9jJ9ANHhV3ysdMobpqTJ/4WutxzIHgNocpoM/+wfWVsN/E/WPSK6RP5ZvtgnC4QK205bFP23sd3b/AJGdyBrOAqntHxP1iYInSfKbxSqKTY6P/9k=',
-    bio='Looking to jump start my career.'
-)
-
-p4 = '230923'
-u4 = User(
-    email='master_investor@email.com',
-    username='masterinvestor',
-    password=User.encrypt_password(p4),
-    image_url='data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAoHCBYVFRgVFhUYGBgaGBoaGBwaGRoaGBwcHBoZHBgaGhgcIS4lHB4rHxoaJjgmKy8xNTU1GiQ7QDs0Py40NTEBDAwMEA8QHhISGjQhJCQ0MTQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NP/AABEIAQgAvwMBIgACEQEDEQH/xAAbAAACAwEBAQAAAAAAAAAAAAAEBQIDBgEAB//EAEIQAAIBAQUFBQYFAgQFBQEAAAECEQADBBIhMQVBUWFxIoGRobEGEzLB0fBCYnKC4VKiI5KywkNjs9LxFDNzo+I0/8QAGAEAAwEBAAAAAAAAAAAAAAAAAAECAwT/xAAgEQEBAQEBAQADAQADAAAAAAAAAQIRITEDEkFRIjJC/9oADAMBAAIRAxEAPwD5tXalhqSpQag14LV/u6sSzpdClEogJVqpAmKZW1wwoj6h5jKIIiR51N16chThNXWVnRS2FXWdlnStORXaJCx96VQi+VH26wfChRqfvfSzVWJWQ1oi3uzBVY6NOHuMGqrspLADUmB13VrdsbOm6I65+7Jn9JyPyNK65RM9jGxnVgGZ61FtauCyD3U6TlvZZL0+ZoRkp2l3xJP3qaFe60poXJWUqp0pkbCq3sKr9k8LClVMlMXsaoKVXQEKVwrRbWdVMlMg5WuFauZagwph0CrkWpok0SlhU2gOEq+zs6tWzq6zQUrTQdBhNaY2IN2s/wBX+2kVqnZyrRXI47soH9U90Gsd32NczylguwNWG5Gmd3uk0X7jlU3XBMsxf0jI64QfWlO+n200zaeAHr9RSS0EEVpi9g1ODNkpNso4Et4An5Cvo2x7rju9oraMCAKwGyEjE5MAjCDGuYLeQ8633s5bQp3LoAdetTr/ALHn4+a3u7FHZDqrEV5PpTz2ssIty0fEs94JHoBSm7rn9/fGr74nnp1cLKUy5+s/Oq2up4U29n7tNmTz+X8CjLW6gTWH7L1GUtbqRuoK0QitTa2QpRe7rnlV50mwhtLM1S1nTS2sooO0sjNays7AhSqmWi2sjUfc8avpA2WqsFMHQVSUo6StTR9g9BYausxRRDNLAHQ0YLgOOdL7u1M7F6y11cELsrsEzmBMdM6N9nUmyjgxXw0rt0tTHGrfZYwjD85/01jq2tIY2d1NECxgGaMRRXbynYMawY67qV+Kz9YLauWLr9R8qStZFmCgSSQAOZgCn210JYiDnp0lyPXyoMoLHOZtCI5JO4fm3E7qvF5kanaOs2VXwiMCDBxxRqR1MnvrX+zLIAXxb/hKmY4xw51hdnpJGW+voPs7ZnU8MuQquEV+21wlPeCDEkBQfhOs5ZbvCsTdlzJ5jzBr7Df7tiGm6sXfdjIHLJCsTmPwN/2nyo7yFxZ7LpKH7+9DTO2sTVPspZFVZDkc5B1kRTd7KspFWs/b3c8KDtbsK0N4ThSq8WJoJm74gBNLnFaG83HFvpXeLmRWmamwttKFamFpYGh3Stc1nQTVUxohxVMVcS8qVelnXLOibMiptOJWVnR9jYE1XYoONNLui5Z1lrS5Bez7AyJqXsyvbtV4PHfFF3c5iKG9n/8A+m3H/Nnyasu9XGmSzoi2SEJ6eoq6yTfSvbV+AAQHLNieS5wO+PGp1fFZnaxm378UtDAE6AySB07Ig0qsbjaWq4wVCkxJkk/xUNr2hdia1tzsFW62QkE4AZ0+Ikx4mK1k5mFq9rNrdLYkJZuuOCYMCdAMPHfqae3DZt9tbCzexvLK+J1cF2VCAQFwYddDvoOyuiu0NOZOYMHDpAjz76Z7HumA4SjGyLZKzlgkmMSCey2KDOo3GrlHiL7MtMw1vaMROIpa2mHMK0DMfn3DSlm2rva3bAxtHdWEqzWjnqPi5Vt0ugQEnOTmeMkwSeudQ2pdrN7B7JzAI7OkhtQRwIg9wzppt98Z32Vvzs6lmLZkQSSOmZ00rcXlIGIV8+2Cws2VgZGOAeOcAxzrf2tqDZTxX5VjeS1d/iD2cilt6soypldLUOoP3lVd5ApydRfCG0u9AW1hvNPrSzJ07+HjS693cgwfucxWk/HSuoz18UUpc08vdlS50ApycRb0qtUqn3dGWxzoZnrWJqqzohBVNktGWS1FOLLNTTa5pMUHZoNaZ3B86x1WmTe72cUJsgRe7UfmDeJb60bZPQNwyvzniB6TWcVGtvN5CIc4kEeVYbal87JMzkQOknPv+VP9v3wrhAiQDrnurIWiG0dLJfxtnyBM+AXPuNLOe3tad5B2ydmoyq72ZM5gnQzmIXdqImQfCSb1fcNoqgiPhPCDoR4DpFNbxeVwMoGRWU6aADuFYq2vLEMXBmcjuYKYLD58+taSd9RfGhAAMjfn8vWm+ynyCnPUn76xSVO0qkbwPUE+lN9ljfxB+o+VVEn7iV++IH0rNbVvaG0IdQ6giFO/Kc+QBnuFaiwIgz/SfOD8q+bbVtWN5dZyxTIyhe7pV34nP1oLxdk9yHUNjXOUQRiHaAcyJzEZSRlJmZYWd/D2IGmo8wB5EUxuyL/6YKuElAGjgQcQ886xjn3bMgJiCR0Vjh/trn3nzxvm+tDsC9SxTkT5/wA03vIrI7Dth71c9cvERWvsRLDhl610fhz1l+S8TF3UKC5gZmN50oa93VbRcaTlqp5ZSDRW1sh4R3zP3zpG96K6Eiu7P4/+PXNdeld/swuutIL01Ob6xJmaTXoCubfP2OUttaDcUbaGh2WiGjZmirJqEAyn7+86ss2rO+qg9KZXMxFLbtrTa7LWWl5ppYPNCo2G+dVHooomwoS85XpOaD/VWa5fXNvXklydwEda57MWQxPaHlZoeZguesYR+40t23byxUaAk+OVO7gnurJEg4gVtG6kgN4dle6qz5Ffbwu2jeiqoo1Klc9BmMzyEz3Ul2ntUuhVMrNAAggS27ETrJnTcDRG2LQnEpGYe0XwKA+U+NK7yn+CzaQQD/nA+dbZz4nVa24WwezQjl8/pT25buQHpPyrH+yt7BBQ6gSPT51sLm8R3eQI+tRZzRS9h4XCoWOmFvKSPlXze3XC95JPaxsQeWEMAOWfnWr9otp+6sTBzwkdCezpv491YS4OzpaMxklLUn9tkpHlWnPEd9fQvZFzaIZ0lie+AB5N4ikPtTdyjhhxg+Er5SO6mPsbtEhFVAABkaZ+1Gziys0ZEEgxodfI+RNL9VysXcLxhdG4EV9P2bZT2t1fH7FyDX0vZd8YIpB3Ct8Z4z3rpjtOyZ9AcsqzV/sGTXiR4R9a1D36AGbLXQZmONUbSugtkxgZwT5fwK3/AGsnGPjC3lqU3oU0v6FWINLXrm3LL6qUqdTXAtFWiV6wYKcTCQu7iTkB6nuqLrkOR67WYeydRqvbHcO35HyFCItMNiWoVlneII4kSseY8RVdpdsDsu4HI8Ru8qyzr2xfPErsuYpvYmltiIphdznS0IcXVaD212bexYb0ceGY9aOudR25cHtTZPZBXKFsQxquRAA+IjnUdjTM9Zq6Wavb4nYBE/xH3yFI7IAGZJIHSTup1cbyotED4xZ2jFJdTAL/AAkMZKjFhyaNKVXl0YqUsVRR2GGKS3ElmkTI1gZGKc3PZtg9mWTErQcSwASB8cECHw71ZZHCr+r5xn/aWxKXgociWPiyBf8AUtCWtlN2tR+UN4OhPkDRvtlaqHRgzO6JZhmIicLMU3mWwgScp4VCxSUtE42doB/kfD8q1nxFZy525R1YfYO6t1dNsKEme1BgcwJA8TXz+xEkfehmnaXR3wqv4jh78ao3qKq5lZy8E7Vv3/qCcJOFUOKdCcbw3g5qOxx2bQEQfdXg/wD1AitDsD2eUocX/EFhZ57saNasf8hU0kuJl70YiVtyBwxWTmO6Y7qrz9Sk9Heyd8wET8Op7tfKtfdtr2tusswRWMBRAUIIOFmJ7TtkDGgnISDXzfZjnAQDmRgHV8vST3VvdiFFswAoJZQExAHCgJl8x8THPqSdwpZ+qvxktobPeytShIO9SCCCu7MZTlnzra7BSUVYmAO1J5aR1pgfZ+ztgJnL4ZLmOcFvOAKYXPYoslCjuMxnyGfhO6unOs89Zalcs7APpMCZPGdYq2+2gVCqkDKDrkOgomysyoI0399BXrEq4p7hA7yeAGdVJNVF8jH+0C4mGRyUCSIJ5ms3eFitRtNiSZM6/wAms9ekmsfz+Xh59LwpYgASSYFC3u0ARV3ntnjByUeGffTFm92rOd4KrxzyJHp40itbQkyc5z7tBXJL+1a/IK2a5MZ8x+oQD49k00t1PZMR2Y8CY8opRcE7DQYZYYdNDTf32MdysOMEDGp5hjPeanXlGVK60fdzQos6Lu6GnfiodXBqpvlkS0BVIxEmLTA51gZsABmD3VO7CKD9o72bNVdVDZhWB4ZlT5Hy4VjZ2+NcXhV7MWatfUsnXsutorgmcoMz3x4Vqb/hu6o6ySsK/Fns8QS06kIyNxFpWJ9kL1jv4eMIwvAG4YcuvGtPtW9Yk/efK0P1rovhS9Z/2pQG8OB8OHL9ofD6Cu7HeRZk7wFPdCn0PjQG07fEysdTYqT1wGa9s237A/K09xA+ZNVPhf0msuzkdVYA+at9a22zL0q2audQXYc2/wAJx/ctYzaS4bxbLP8AxHOmUMcQ9RTG6WdsyoEhgS+BQRiJQIXhTr/7inuPCrtZyPol42si2BCxCe801zIsLMjn7kPWL2OS3vnbVhbYurWdtl4pQN498tlighVcK8zIbDiWcoGRnWivZx/8J+av/wBO9fWj+CfVOyRKgcAzd+Ex6Hxr6Tsm7S6jTsoBwACj+T31842OIRm/Kw8ez6VvX2yBZI6CGazRctzHJv8ASaV+qjdXRkUYVjn9TVFrfwuN5BVR4AanvPkBSLYlvMyZ3tn1geEn/wA0Ftzags1Wy/rJDD8uEz5kVpn28RqNeLaVxNAynpS7aNuuEk/AFksM8uHIGaRWd9c3drNDjbBCycLScsyTBIHTSo373gsxZq6FSiqzmQywsN2Rk++JiOdbSzPvUWdC3q0xF1y7LGCNCCAy98EUmvC60e4VVwqI8yTvJPGhbzZlQvFjpwESCeGhNcX5/wAndNM54V7atEkrB7AGR4xkPWTzrO2oOKN+py5AgeBHjTa9WLO7QGIZpkiMm0J60PeYDsE/CMIbeTMu/UnLpFRieFr67ccwpABOanOMmyz5ZkUXdrtBBBIBOQOcHPsnrLjrFKLG1KExMfLUTT3GGQt/WJGWauNe45N3mlrohhYXWedG2N2qGxbQkwxkMMSxz+mYPdxrRJdlrP8AZZallFI/an4I44T3yw+vjWxNgvEVgvaK8BwcJnM+Ux/aEPUmln6qEXslaYb0P0OP7ae3q3zj89p5EmszsdsN5H7h5Gnl6bP97+BVD866L9GfhVe2yHKyUf21HZbfEPyqfAx/uFcvm/8A+OzqGzjn1Q+RB+VX/C/ru1Gi8NzCHxRahdbySwUZqrSuZBVoAJVhoCAs5QcIO6o7fX/EDf8AJQn/ADMvyqjZ1qoMkgCdN8H+Mu+nzwu+mW08cQXkZvh1IJiQzRJ0PhRXs0ewR+S0/wCnbfWl+270HOJQqgCAAI7zzov2deEj8j+dmfrT/wDJf0PdL4VVk3T86bJe+woJyBHqfrWZXInmT9aa3RS5VR+JlHnRSj6JsFsCYyfw4j1YZeUVldrbR95eDn2Vy79TRW3NsLYpgXNtw56DuArNXMzqZJbxJ1pS89Vf8fQNiMfdljvM/fnRNsCY+9/81fcLuiWaKG0UT1iTRPugRNY73eD9YRtZjFnoM26DM/TvpZaWrWjgwShbMDQzovQgAHvFMNp2oxMg+H8bbsviUcYy78qBtrwytIEBBAXWCcgAvESZPI1hLb7TvhftW9gSTOIGY0GKIUdFUjTe1KUAAOImTEqNTlOu6JFFWSF3Z3yVZYznBOeY3n6ULbIXDMSqyREnQcT1iOprpxORlapuUs4IgkbtQ0fh5EjKmN1tcJK/hxQOABPZPKMv8xpPc3ZHy1Bz7sjHnTxwuNTotoAeQYGGjkaWoUpxc7NlwYcjOJejDtKOcgR3U9trwVSd4KzBy1E58CKRXZ5SF1XMDeCAGI7oPWDR+1HBsZG8r4EyfIGuay9a5qy+bYQWZOKCVMcdcJPrWJvltiy+5jPz9Kg97K9k6fM1Qx4aZ1tnHCuvS66vF4Q/nHmYp1aOZg7nP+lBWetWhweBnwNObW1l2PFwfGK24cqi8n4v02Y8iaqubwyfuHipHzqd40b9o8EJoayMMOTr5xTg/ovauTI3GzI/yM7f7hVLXVERSRrbWaHphOLPrNW7WzWy6uPNP5qvbT/4NiAdfeWh/dgK+pqv8idBtpWBs2dOExPX6etH7KaFX9J/6a/WqvaXNw/9aKw6Rg9UNW7NGZHBW9FHyol7JRn6AQ5sOBmnOxLQJitD+AQv6iNe4TSZRDT/AFYh5/zRysEs8TaDMDix08BHhRRAt+t2dyzbsgOFHXJyCCNxnwNJ0YkydSZPU02ubQATxz6UtfC63uyr1iQcpHzA8D5U0e8nBlu0n+oj0AnzrHbHvmA4DodD6fTvrSW7yBGeWXDifIVxblla5vQdqe2IiFkZ/lks56E+JFLxelUQpzObsRnPU7hO7+aNvO+clIAAPAEkk9Y8aT2yFjhAzOZjPIaD75cKM+s9VS6qRh7QT4mjNmE9mTxJz5RSi824YmBhX6ZKPCmt9LjsMcCDNoBDHkxO+PJTSm2UN8K4UBjM9omNSfCurLOvXuzIKuPxDPP8Qybxyb91H2LB1WM8JzHWN3Ufc15rqbWyTD8QfCf0vo0cipU/po68bEezUMjllOTDfxGm7Kouv5T4Y7OwpaOqk6hhJmezp1zmrNs2uCxwDedJzAAbd3+VAXKzIZmMM0ZTOo4gHupZf9pM5OJQDnoCIz059/Come0+ld6JJnpXLB/UV60E9aqQ59D51vPhBLyM55mmQeQDxNnQloslhzyqd2bsDkyDzNP+NP6vtz2X/V/tihVOc8kPgQDV9o3Yb9f0ql9B0YeGY9KcFG7QE2aHg7DxX/8ANB7WeSqblRV9f4ou952Z5OPPL50uvzS7d3oKc+lpdtJ8dlYHfgKf5SP+40XcD236P6/xS4GUsxwcjxIou5NmeasfM0vkGUAmILH9ZHjU9rvJwL8NmsdTIDHxPlXLvaRh44mI67vMg91VWwzccEHqDNB34Gst3OjUeDG6hrqmWI9B86twzpRUWmV3cggeHXh31sdk3kOkbwMumhHd6RWCRiuulN9k7UNmwMSOFY/kz+0PN41V7QtOf9Mc4GniaFtbDAQASGRWd2HGMoO/WPGi7vtCycgK0MdzAjPdB0ND3rEA8zLH03ffCsJLKNEt7GMIhOZJd+Z1+lBWlmLW0IZsKKJYxPADzgd1E3kkGfsVfZ2As0Exi+JsW9joDyVTH6nPCuiXiYD2NewCFbLPPloD4a97ca1qXgAQ0LxmsK4Nm4OoI8QdPmO6tBcbyHQq6yQuTTDx+Ez+LSDPqJpazPpjL9fkVSF1M5jIac9e6sneDiNaW62N2aCSxYkZtocx4cPsSv28i2bEKoBbLpG+jPJeRNI7XLsjXeflUMUZDWvN2RV13stGOpb5TWoU2N3L2mFRJ186jbJgZhqMQI8586Iu1qUdiN6OPU/KqL1oOinyIPmKUaX6rtz2G/WKjeBAbk3qDXbfNG5uPnXLzoTxVT6CqhjdbN+qnzFKHaWJ500s37D/AKJ8INJ0NOFpfYHTk5P9h+dG3UQ0fk+/WgbA/F0pjc//AHG5IPQUUZeuqb+E+ufy8TQ4zdhxUf6RRYYBSOWXzNA2bQ5PL/aKQ0sLECAOlcS1PDPpXS8dx+RryWmnIr5TT4ijggKrulhPLUEeNXG59oAb1n60LYWgMDPIk8tZrQ3Ze2rbgCJrPV4RWp3HUGtVcLX31kpbUZHqMprPXlId40J4n5U12JehZo2I/iJAO/IDwqNZ7Dl9FXy7ohBMDAuNjl8TTgXuCkkcQRWZ2nfpWBkTryAOQJ3n+aP2xe8ZYZhUlm4s7wFB6Dw7VILeN/nVZya4NjGCcgZXiJzy457vrV92YyEc5DQ8J06rMGl6WZ13D7nlRysGPhn4zT0DGxPaAiApgicpbcCMmGeW+CKP9pLrjQuM4OIEbxp4Uos1VO0+SAaAwWOcQOM042fekZDZmZGeZnI8Tu76zvl7Bxk2sZpjYJi5HXlV99s0RjBWfLjmRuoCX1BWOKsY9K0+jgG99m1K8yO4xPrVV5eWP7R51y8PLyeOfl9Ki5knpPzqpDrwPY/etdt/gU8mXwzFVhux+8elW2w7B/K/rIpqW3bMMvFGH9ppYoyplcD2wOIjxFLjl4mnCqSHXmVH340wuTf4jngvllS85EDhmev3l3UbsgkuxO9R4SKL8Eae6bPsrVMLADLIjIjgQd9Zu/XM2NoUYyMoPET9DV1renQ4AYiQPUeRA7qX294Z2GIkmDme6pkqtWVdaoSdKjZpBkiiHvBWMMSc+1EHvPdRiuzrDLoTBgaHdI4fM0Ws+PXa6ls9Bxo+6uyiVOIdMv4pfeHCIQDJIgjhy60HZ3orJn8fz/ip50caNXEy6xxIPyipJax22ACrJQRq05dQNeZoOztsSA8DBB8vn4V1ADL2mIqMgo05DlS+D9QnvQQztmATkdWc5yaX21tiMsd1Mr/brhlVEkdkfhQHcBvJjWk72ZPU5n6VWaOC7rf2UEKAcWTAiQRwmmV3iCCBJ+HMwORPXfnSB3zhCNeBy8KhaWRBEsf3Aiqs6Zte7XGRLqIyiCMP80BYyoyknFwMQNM/OutZwM5njhaOmUVFGwjLjnLEeRiPGlIa283gkyQV6ExHME16zsVyaVXLe0knfkKoBnfHH4ifAtXnUlZOX6QvqDT4HLyykiNAAM9+Z4VFiQhnU+gH8VF1gKeW8R/51qd+yymYGfU5mgK3OSjif4ops1tF6MO7OgrY/DyAPnVzt225r8qYW3ZoZT0+VC22TtyY/Opoch0HpVd6bttzIPlQKriSBx1+dMtnnNz+X6AUI1mVEnU+n36VfcGyf9A9RRRBO0QCEfSeyTwI0PSJ8qGvWznQB8ip3gyKvtGDWUczQd2vToCAZQ/EjZqfmDzFAq1bTsQc1OXQjTy9K5drwDpKHeynI/t3HmK4LMdtBIyxAHMgjMqeJCk+FQBAyyERE6a6gUELcs2bLI6kH9WdVvBcBREEEkAgeGlcdyWC4upxGDv36HTlVwUD+snfnH8EUjEtb4D2TuGoAkkZ+p8qLs725HafAmZjhMZBe6k6L28uzAkSQak4IgsCx0IOfhGnQilwuiw6kycu7snv3V73eAY2ynSdTOpoB7w4+LEO456fSh7e8kgagbtw7qOGjZ2gxHF2efDuogWckQ8fmYEZaZSTOtVu8Qw6H5fTwoi7WiPkwXF+HsgeY31dKOMMEKjluAYSPTKopatmCAOIGR9ZFds7IhsJkeA7pCmuurqxhRpoc5jgQACetI0GtFxyAYjTfPrRS2WIBgpXixOojOJE0CgJYljE5QCB48B31Y97K5HploeHdRwPXhslHCem7Tf41RaGSehJ6mrLUiFIOok8M91RdcKE7zS/oD2hk/tA8qtDThPFT5VB0yDDv+VeUQByxeEZUwuXRegrlsvbB/KK8B2R0FQtzmh5EelAXXgyBUbN8CPOrgKOgMk1WbaBpUEUsZb75dKAM95CAHr41UkL2phtVHA7iahavBz13CuMhjETnIy5UAbYXUBVfEMywPHMYYA7zQyWRYaKo1znvyg0VZggLllINC21rhy3UQqiIBjcDx8tJ4VcbYL8LEzlEeQkGu3axxgEAkngJHDPKi/csAMTooA3nMZ7lWT3UDiAsyyzg14mfnlUWXEYeJHdIHOovahWAV2bTOIHPI51e5mAxCncCNeZO6gw7XhAcl8Mzl61UwEHEDiJnMGI786Z2ezXCh3w2SGCGcGWExNmiguw/NAXiwpQ14M5gE/e6jgUI/8ANSsklgBMceXKrrWyxiAQOAjLx3UMrMrHEIIyjhVEZPYuh7MEbsRB8IGdU2pZhmyBgZyH+4d9CpbFdDHoeo31at6nU+Uj6jupcNYl5xRLYWHHQ/xVpveEgFBB0jtCRwnQVXYEEdNM9BynOuXxMpBAIOeWedHAqt7YuZI+4+ldvL4lHIACqJI6SJ66V6QRnS56BIYKM8xGYob3s4soG4d0elRBkdKgN9URmR2F6ULbaDkavDSoHIUO7xqMgaUN1MO859D8hRKKfwieuVDC9AaKKmu0SNFFHAl7gqZbMmuWjSQOfpVVrtAt+EeNDe8JM0cBs9sMgDVHvwrA4cQLaH1HDWhEepqmMGNREec0cIye+56CAcgDiJPXTy8arvF6ZzgKxnpGcnixzOu81VdFVBLHP+7u4daOQo8Yn91mAXAJIWe0AqiWynTfG6aOGlcNnOrKTGJjhspBzckAZdSBJyEjucLsRW909peFVXCsoSGOIizwFccEqzOCOy0AgNGtQ2VfbAOnu1d3tH92gdwuBGUKrIoBBbFBJcsBBYgk5CXm9O7OLCVBZgbYtLMkkAKxA92mEAYFAyABJEAHhGm27SzWyZ3d2KWynCrE2hNrZ2mNXNqWNkD7pJBxMCpOBQwjOG8i0YlLLAoyAQabzif4mJy1O7IAZV2xutmvYZ2YAzhA7EgRJWdd2ulRtL0IA0A0AEAdADR9MrW8YefL70rlpa4szrXK9VJV4q9ir1eoC0OYGcQIy6zmai+I5mT1r1epGrQmd/rUmRp0MV6vUBYqb/mKi4/LXq9QFq3ojRe8/SqrVy2or1eoCKqeArpjh516vUBDEN6eddxjcK9XqZOop3ipFDwPdXq9SNZYATEGN+efUHdV1hZjHLCUzBxNhMEESrEHMTIyOYFer1AMkvdlYqfcoxdgQz2hDNhIgqgAARSJByxEEiYJBBfaDEySSd2cADgANBXq9QA72+eVUtamvV6mT//Z',
-    bio='I am the best investor and here to prove it.'
-)
-
-p5 = '293932'
-u5 = User(
-    email='jessica@email.com',
-    username='jessica',
-    password=User.encrypt_password(p5),
-    image_url='data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAoHCBYVFRgWFhYZGRgaGhoYGBgYGBgYGBgYGRUZGRgYGBgcIS4lHB4rIRgYJjgmKy8xNTU1GiQ7QDs0Py40NTEBDAwMEA8QHhISGjQrISQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0NDQ0MTQ/NP/AABEIALcBEwMBIgACEQEDEQH/xAAcAAACAgMBAQAAAAAAAAAAAAAEBQMGAAECBwj/xAA7EAABAwIEAwUHAQYHAQAAAAABAAIRAyEEBRIxQVFhInGBkaEGEzJCscHw4QdSYnLR8RQVI4KSssKi/8QAGQEAAwEBAQAAAAAAAAAAAAAAAQIDAAQF/8QAIhEAAgICAgIDAQEAAAAAAAAAAAECESExAxIiQTJRcWET/9oADAMBAAIRAxEAPwC40b3RVJqFfWDLIqhUmCqpoSjnHMEKrY/CvMmLG0K5GmHdUqzcaGGAkmvYYlAe8NeRpMeqs2V5wxoDZM8JVTxFYuedI2N0VgD2m6rbjwUWzJ0z0vDY2WzKX4nFBzvGEpwuKnU1smEc2QBsOKLk2iiQxqvaRIEQqdj8K97y6OzPmrhhKRfui6mWthN1clYkq0ebPre6Eju/OSHbiy5sKye0OUNcDpsZlV8ZcWAST5KMsCNOzbSAOCjfiJ2WqtJRUiAbqNvYyj6Jmlw2Ct+TYHWASPPdIcPpJE7J5gswaz5oATwlYeqix1XydhbJaJ7kq/y5rHSyxHqiX+0DTMH9UE/NGm5IHeVVtegonOKLHW47qWnnYJ02k80nxeLDriTyjggANTpBgjwvut2Yaf0WSviC6RA6LdCk1zYcNklp4qD2nH19U0wr9fwukfnFZM3VgmaZOHthpvuP7qtYjInMBkwfNXutTc0bJNm+Ja1t0W2K4xeWecYvW0kckOXEi6LzOrqeSBuhAeq1kqOSyVDpgog2Kic6SsaqJHUhEoZxhTvshKoKwUY4KJ7F2NlySshldEYplRvZdGssEJXddExHoWLJWI0HB9EZlS4yuMMCAIBUuIpFxnkoSIM+iZrIyGmGfa61jcKHiDslrq5B4IjDZgCLprTVMFFczLKWsktCWvwpEA77hXDHNa5snZIiwPcbWGwUZLI3WxPQe5u7oPTinWDeXASb7QgMbRaDqAg8lNllU3H4EEGi5ZcLBF46uGtSzLn6WiZMo7FQ4QrxfiI1kqtbFa3OB5+iDx2nQQj8flrdeoEpTiN4PBc0hndC9tEuPa2XdTLgWkjh5ogG8rZxAA+yXFCgDDAhQlrnuAE9b2UwpF7uRK3mGPZhKeo9pxs1vFzvsBxKSKd2PGLl+BgaWN2g+JPl/VAve8kjT4kie6BKq7s+rV3WcTOzWNEetynWByrFPExpHM2PiIurfHZaMV6Qxfi9LdMw7hw/RQsxr2mHAHaSTB8zv+qY4D2fcO1UIcRcDhMW+6GxTdMtIuPXwQUkxurJPeE3b4tNj4HitYfGupuDmGObfs5qW0a87GI4HbuRL26hrAhw3G4cO/ijoFHo+UY1mJpyI1D4m8QVW/avLYEtSjJ8a+k/U02EGP3mnn1VuzXEsqMlvESn7Jr+kZwr8PKcZSg7IB7FYcfhHaiT/ZJ61OLFTa9nPVMELbLljUV7srRplMgXkEqhRaVNUEKIrWMkQvYtNFlM8LkhEagdyjLZUpbK1ssEh0La7WLWKfRrVy6kCVjV20q+xhfj8MHCAq5Wxjqbw07cOCuj2AhKMVlYedREwllEZHDK2pondDe9DNRhGPwhERsk+MpubqmYMqcsDC3H1NZMGI5Iv2dwzpcTPig8kw5e6COz9VbGUgwA8EiRkryEhxDYG+6FOZgGHmPou6uKESEkx1DWZ9E0pVo1B+LzFl4uq3i8VLrcVPjDDTa4SUPJJJKi3bElL0Mmv4krmqQdkvr1bWKlwDyXCT1QqhVnAa94pMLjufQcSqFXc/H4lrW8TpaODWjim/tTmUy0G0R4KwfssyHsnEPF3fDP7oO6ovGNnVGOkWn2Z9l6OGYBpBdF3GJlWI0WngFjjC6YovOzo/CCrREWSTNcnD2mBePGeKsRCicUNBPJM1wdWjsSW8L/AJfvXOS5tLtD7cnG1+RnbxV09rQ33ZJA6+S8gbitNUcpj1VovtEjLxZ6LiGhhB2EwegJ/qm2Aq20Hw/PzdIQ81KNj2wPPTt6WROUYrU0Hw7j1+nghdZNKNoZ5jhOw42VPxNO/wCbq2Y7Fywgqr1Hgusms4p7IGUrKKrAT6nhCRy6FIMzplryERetbA6rJWUmQVPpsh6soZQUjiveyic0BbO66ddPeB/QO5sbKB6PYwAidlFj2R9jzWrAKBNK0uJKxYx9GhdhRtUrVZMdI21SLkLYTWajDSBSrNqA0kJu50BVj2jxZaLJORpIKQFlrgw8oXWZ5p2YBlVhuPMm++6yviS4SubsG8DfB5iXGCbBMXVxEk7KrYZ53RVbFcEkpGtpE2Lrap6pYWAbqapVUDnSgiUokdaIgLunU0Mc7ieyEPXUWZv0U44gf/R4J6yPwxzZXMSDWrNYD8Tw0eJiV6pR9of8I1lA0dLGgMDmmRAESV5DTcRVZp+IObHfqEK5YnCYl7A7UPeF5lrgI03iHRMz1TyV7OmL2esUcQHtDgbET5qs577WvoPLKdMvI43j0TL2XwtRuEb76NfasDIiez+dUhznL3uJcLjlIaT4nZQSqVMtVoLy3PcXUMuLGDq2fSVYaeJcQNek/wATLebV5rmWExDdHuCx0g65AbpM2gky7vB4FNfZ+rjAQx7NTTs8HYdYCeUcWhU81RZM6wXvKb28SLLwrMqTqdVzSLtd9CvoEMOm68f/AGiYYNxBcPmEnyW4XmheaOLDspx/wD+X1H6I7AVPd1nsNmuOpvnPpKqWBrkPb/tVmzVpDmvG4LT5i/0TNZAmO8RgdbtzfyUuE9ntMl1wdlPltYFoJ5D1TlmJbp0yjHRGcEpAFfChjIGyqebUxq63VozvFhjN/JUt+J1m5RJS+gOoS1QPEozEtQlN0PugwJUQ1GEbhRF5CY4lstKWlqdoNHdWrafRL31iTco2sOygW05KNmJliz3SxawH0OwrsFQNKkDlQeiYFdAqEOXQcmGolJlIc6woLTPJPAUDmDZBU+T4jRR5ZiaGh8KZjJsjc0w51EoKgbrjcjKKTDKdMBqFqm6NBshqgSRechkiBpUrNlA5pCwuKck0TsaN+PCeaSZ+/wCWdu0e87JxSMkKtZxUN+rj6J47LwjUSf2CwAr41odswOfHMtgD1K9pblzCQdInu+68b/Z9iRSxrS4xra9g7zBH0Xq2IxbyT7u5AmOnJDkb7IvxRwPHANEWsPogyxj5BgqqDP8AEh8aA9vzNkhw6RF/NOqb3v7YZoEDsnc+SmyqiFOyemDOgd8IukxrRb0UIxRgGFDVxAKWzUS4mqIheRftAYXV+mlp8JI+y9MqvJ4rz/2vY19ZjeMHx5DzVOLZPkXjRXspwuqo0cAZPcIVozhp0GN9DSOhH91FlmE0Hbi36yfRFZoJIbadAt10qreSajgmyWpqY5vGLeK0zFvkCbBdZTT0x1AB/wCO/oh8UIc6DBBgpU/InzRwmNK9DW0Fx3HoqtVoaHkcE/o48FkE3AhJcVUl6c5pOyJ7JKGrUOIRbnwoqtQQs2AHcXEQdkA8EFMnFBVWyUUxjbmS1QOAARQfDUDpL3QPBM0Zo498to7/ACOp+76hYjTMe2ioF22oFVX5wBxUmFzhrjErdiqiWvXCw1QkVTMwBug6ubjcFbuN1LS3EBB43ECN1XWZxPFDYrNibBTnyYCqRmavBKT02S5d1q5duuKJXPJg2yd9kPqRDtkJUCVDM7Nwh6tlK0qGq0myosEnENy+nqE8lWM5pHWW9SVdMpYG03RvN/JJ8bgZeeZK0ZZOqMfFFUNM0xrBgggt7xsV67k2Z6sO2sGF5ewGBcgxf1leU588awxuzd+9XH9m+PlrsM7cS5ncfiA8VSauNmi6lRZW5oQ6Thn9Tpdf0RR9oKcH/TqNMfD7t58oChxGWvB7LyRylG4TDPapNxOl9awQUcRrALZAImHCHDoQbrZYSZlFPpQZKGrVQ3cpBSOs8MaTKoNT/VxLnn4aYnxPwj7+Sa53m5edFO5Ji3Hu6ddkLhcNoEbkkknm7ae4fVViuqJS8mF4dl2jrJ7z/f1CCxz5ru8W+Q/smOG+Mng0R6aifOPMJMSS/qS8+sT5BqZbAxxgjeORBHdCFzGxJ5i/eLKfCv7fgB9x+dENmDu102PnISrYvKvEUvff+ijK6e2CuS8bKhwvDOHvUcqZzAte72QCjioLJeCZTKqICWR2lRBCnCy3kxaKzdW0rmo6Gpe2oQ4OnZNZj0qW9FiqNPMXkD+qxNaBYSZcJlZReWmQbqy4fJmhg7kmx+ALHGNlBM6EmjRxD32lTMolc4Wn0RpkcFGc84KRWAQt0qPWpq08ihHNdPwlJbZKWyU3WStU2u/dKmbQceCNBOGvXYErmpQc28KJlVajEz6cLTGArdPEG4NxxBU9Ck0mRMcv1RseMe2hll7A1hPDcd/BJc3xQpNJmXmfCdymeLxulgAAaBsOapmbOc4y7itFWzpa6xpCdzpdJ4o/KswNCsyoPkcCerZ7Q8pQD2rTzIldPo52e5YbNWPAex4LSARB4f1U1TM2NG4Xg+Hxb2fA9zeekkeis3s+99djw97nFpsSeBUXx+7KR5E8UXTNPammzYyeQuqq/M62LeWtOhg+N54Dl39FgyqSdVmjcrrEYsMYGsGlos0Dh3c3HmsklrZsveidpZT7DBv8Tjd5Ei5PDcQFPQmC5wuRPn8LB0Aj1SbL5e9g3lxc472bMCe9WCo2+gfETfpN/QArSxg0ckdQ6WNaPicRJ6Tc+f0SZj5xDj8rdLe4b+aa13buixkMH8LbavH/ANJVgBdxjd1uf5cpo6M9jqgILTxMfRR41suJReDEkd9vG4+yDxNUSe8pFsHIsCvEC35yS2q9M8ZsY6n0SR1S6qjjkib36nZVQIClYskJQTWEtS1jLpoR2UvbunGZxjX2QcojG3UDWIgOxUW1FCxAx7UHtAhBYnDh11o1Z4qalfqufsdlENHBDkphghyRTHhSe8ag6GUQQYBvJY7AN5I5tQKUFY3VCn/CNHBc+5E7IvF1g1KX5iJQM6RNisOCNlV8TR0u2srM7GAhKMWA4yshJJC1mmfiLT1H3CLoVgNyD3ArpmWl14W34JzNhCNAi2vQBicVqeJ22HJA5zQgBw23XNcOgHjJhTOrFrNLwCOR4eKZHS8qhFUZdQvFkdVcHA6BEdZQLt1REZAjeKuXsDSJNTlAkqqMpkuhoJJMW6r0LK6Iw9EMHxG7iPmcdz3DYdyHI6X6DjjciXNanys8Sq9WpEm1zz38k9bhzUcR58vHqpjl9NphzgSRcC1vC4CnFpFpRsEyTDBjNZ6hvU3t3XPkpS+7ry4/GZjS3iJ4E/Qc0S+vTixkNt2bMaBwBHDuQFVzXtOmGsG7zZht8oHxHxWWXZqSVEFfF6i6IEdkRwEWCXYbEQ5wneCPuO9FOpAgtZe51PdsOYH8X0UGGygPduQ0G5jf+X6fhimEhNscZRjNc90/n5yUNRtzbmfujcNhA0dkaeEgTHfH1XdfC6hJGki3Ejad0mEwyTaEda/Z6fqk1Zl07dTLXieYnbnvy/ul2JYL96otHJNAbGqVgUZKxhRRILrO7KBZui6hshjsnGBazpK4Nlp+8rl7kBWdStrlYsY9HDiEZha/VCELqmuKzvoYVMTHBTUHakufsicBXAsUrdsdLA3psUzagC4o1gQt1KUiyomLYrzasIKrT6t08zLAvO2yrWJpPY6CFlklJsPbVsoXPkonD5bUc0ENsuzk1SRO3Ra0LljjLWAgInGYdoaTGwSnDtdRMPdA4SEHn2fS0MpyeJIHJbei0Iv2D4mg0MmwdcqsY+vwHFWnEZU5tDXUedREho2HJVdlAhpJuN7qkKKSf0L8M6HdFmJpwPEhZRb2pHE7Jo/BF7tI4XKrWSDeDPZvDdrWdhfy5Jy/EucZiAPAAKTKcK0ENjcEbbxc/RM6uVjSATAN3fy3sk5WlLI3Em44ENLFVKkhh0MA7T4iAdgD15b9VlCmXzctptnWT8TyBbUd5MlEVnh7wxg002GT/ERv38BPVFVy2kwM4NGt55uNxPcIQGB8PS1uhw7Ivo4NbwLhxd02CW5hiX1KjabLSQ0cmNJ/7Jrlb9THvA7WmfOT9gleWDQ8E3dIJPf+FFexXkc18MGMDGAACALcbNHqT5I+nhgxgHACe87D86ofFVRraBvIJ7hc/UeaLxhdp7Ik6tuYECD6+alJ3RWKo3l5JftIEjbvnfx8k/8A8va5tvhN78O4D8uhsNQY9gcw6TEcLEcCFMx9RtjBvuJb/VCwMq+eZU+mZnszZ/Cd4dGxVUfuV6xo1tLHtBYbOBO/Phv14brzrPsuOHrOY67T2mHiWEwJjiDbwVuORzcsRDXbBXVESsxLZ2XOGcqkAnECyCebI3EukJfiHWRYGCPeuFpwuugsA3qWLiVtajHpYKkpqBptKnpGQuBo70yVy6pLglSMCmUTCabyNijKOMI3S4WUjHplIzQ8pYhj1DisrY+LJYBxBhE0cc5u6axHEY4VgpiCjW1GG9kCMU17bpY+mWusTCSTdDRQ+qvpNEu0+KQZxXoEDRB3ENHA9VxXxbWjtDVHMpRisyaR2Q0eZWgmx0kAZnjqlQNYfhaISjGzAY1pJPL7ol+ZEvhjdbuEiAPAJrTw7nC8NPEgX8F1Ri/onOcVixPluXlnacAXcBy700y7J3l8Mlz3dPOeQ6ph/hhTawNEueXdpxFo07k7bpnh6NSkCW1mMneDJ9G7Jv8ARRb+xOjklWgqlToYYObIfW09s7hg5dJ5blV7O8WQCJMmLcWgtB4bboqu6O0ztfvOI0je7hvq3Pj3pJnXZeG/PpAJ4SBpB87jvU/nK2Ol1VIGp1AxpPHjzsRMeP0RuJwpexztwRrng5gJMjwNwhMDgw9pbeYIIkGbgg242jxTbJaxZ2XjUyQOrC75h0iJHVM3WQbIPZ57RPIdhw6C33WsThRRLuM/B4/D9fRGYjCto1CW2HAcOoC1XeHkEg9kSPE8Qlbt2MkLsNUtLpD5iD9uY3TnJMa0ksfY7idjPJQ4XLXVjLxDZtwsOSnxGQNF2Eg983WdM1jQAtMsju4OHJEU64eORG4O4SKiHgwXlp6xfuKIfTqG5dcfMCAY8klAHtCoJISv2tyz3+HLmiX0wXs5kW1tHeAPFoROVUCxpJJJN79yZNKeLoSaPFRcKEWKaZ5hfc4mrTiAHam/yvAc2O4OjwS1zZXUjjeGdvfZL6r7onEGyXucswMwrFrUs1LANaVi3rW0THoGGq2hFUnJbRej2Cy5eWNM6oStBLnKekUHKKp7Lnki6YSFpwXLCpRdJoazlr4kqZrhaVC5m62NwjYSdtLiDCIYyULTfwRjWuAmbI7BoAx2GBsUizPDwQxjRJ3PIK2U6MkvdsBICrj62t7nxYn04QujghbJ8k6RHl+CYzYX5kXJRzQ5xDWiSbADmhjVjp3qw+z2Et71wEmzO7ifG4811yairOZXJ0cYthwzWa2e9ZBDwGh2kkg/CeG3keag/wAxwUamtbbgWbeBsFYzdUD21eNbWMid4AE+J5LkrszpTSRznebF7i1nZbxcYuOQ5DZCZy9riWtI1hre8dhoJHMyEnw9dofDxcEQHWEj687qXE4V4qPqm4JMO1Ai+31TqKRnI7yAvpuc53Ez39VbBTa4Oe34Xtv0cPz0VdwrI4b7+P6orKsw0ucxxnl9j6oTV5Ro4wM6w1hh4xfrFvpCIpUhrcYB0tDf90z90PSaXOa0Wgb8pM26wmbmBoa0cTJ6xeSkC2GtIa0AcNl2y+6ga7iuH4kCwQoFk1VjTaFzSwrReFHSJNzsiWuWNZM0LtjlE1y2HIoVlC/aPQ01qTx8zC097HW9Hqr0Xyrz+0igTQY8fJUg/wAr2kf9g1UDCldMHg5p4kSYzZL2tCLx5S3XZOIbeVGXLCVosWFZ1KxcLFgFydUKc5bV1NWLFPlSotB5JHm6Kwz1ixcjOqISFI1yxYpsZEgK09u3RYsShNA3KY4OqXQ3z7lixMtgZD7TYz3VB0cRCq9J3ZHcFixehw6Ofk2E4Smaj2M/eMdw3PpKvdMAANAgAAAcgLBYsQ5vRuMX55mXuKbn7ngBxnYKq5fgDerVvUfcncDk0dAsWKS0VWzvFZax5kgT3JTj8vLTI24josWIxMR02QN9tuPgVyaIafeOPGABu7x4BYsWYUWbLb9riblTPqS/+UfU/osWJVsVm34k7BS4ahJkrSxYKD2tstFy2sSBNhy2XLFiJhT7WUw/B1Qflbq/4ODv/K81w7QsWLo4tHLy7IscAljisWKhM5WnArFiYDINSxYsSin/2Q==',
-    bio='Just hoping to learn more about investing.'
-)
-
-p6 = '209323'
-u6 = User(
-    email='todd@email.com',
-    username='todd',
-    password=User.encrypt_password(p6),
-    image_url='data:image/jpeg;base64,/9j/4AAQSkZJRgABAQAAAQABAAD/2wCEAAkGBxAQEA8QDxAPFRAQEBAQFRUWFRUVDw8VFRUXFhYVFhUYHSggGBolHRYVITEhJSkrLi4uGB8zODUsNygtLisBCgoKDg0OGxAQGy0dHh8uLSstKy0tKystLSstLS0tLS0tLS0tLS0tLSstLS0tKystLS0tLS0tLS0tLSstLS0tLf/AABEIAOEA4QMBIgACEQEDEQH/xAAbAAEAAgMBAQAAAAAAAAAAAAAAAQQDBQYCB//EADoQAAIBAgMGAgkCBQUBAQAAAAABAgMRBCExBRJBUWFxgZEGEyIyobHB0fAzQlJicrLhFCNzgvFDB//EABkBAQADAQEAAAAAAAAAAAAAAAABAgMEBf/EACERAQEAAgICAwADAAAAAAAAAAABAhEDIRIxBCJBEzJR/9oADAMBAAIRAxEAPwDoQAVSgEgCASQBAJAEAkAQCSAAAAgEkAAABAJIAEEgCASQBAJAEAACASSBlBIAgEgCASQBAJAEAkhsACo9o0rpXld55Rk/HJFmE01dPICWCtXxUIvNrJ2S4uXRccvmc9tjbdTf3act1LVpO7t1It0mY2uqBxmF2vXX7py/OuRt8L6SUnlUUoNZXenwI8om41vCDHQrwmt6EoyXNO5lLKoAAEAkAQAABBIAggkAQSABmAJAgEgCASQBAJIAhmt2zjPV08m96TUVpx458DPtLHwopOfHRLVs5bE4mWIqJNq100tVlna71/yVyy0vhjtMpualF1d215KyupS6Z5d3dmTBY2dNuLlOUNba3ffVeZVxW0m3Jz3bpWSSsopcEuRrobQ31ZN3vZLu3Yz8q28Z+ujniI0qcqjbdWaaWWVPeze6ufHxRylWvm92lU7yuvuXK9DflLez3Es8st7l/M7GsxLlFNRzklvbi0iuF+Y7pqRNerdJzb6Jzm+/EryxFNP2ZVPCbXwbZilKTjJyTb/27pq6TldZLVWdiu8Km3K3gn06k6U23+B2v6tp78n4qM8v5kjr9jekVOraE5WnwvbPlmsvHI+cU9xKzipW4XvFeL49i/hJclFJ6JL7diZ0i9vqxBqNgY9yiqVVNVIrJv8A+kVldPi1xNwXZVAJIJAAAQCSABBJAAAAZwCQIBJAAAAQQ2eitjq6hBsDjdq13VrT3pZRk4pcrPPLkMbTtBODtJaPwK0p3cpZ5tvPQxRxSacb/wCDGunHqaamtiJTct7Xjb4v85FXZ9aVPNrOE1vdm2vsbl4O7vZ6t3WjvrkeZ4K+kc7WeWqI8pFvG1hw20XGE1a8pT3311bfS2S8EUqW1VTnZU1J3Sct28nbLevzNgtlO992WZbpbAvmspW8V1HnD+PKstP1c7Wm4Sa92cbJ+KXzKGPwGqas+DTy8tPLIsYnZ9aC/Uk7dfunZFamqkb+sbu9Msn5PMiX/C4/6006Uoys8o8+L7Hqpj3FqEFHLvd83cv4qG/dfvSv/lfY0c8JUjK7k7+Fn1TNJdsspp2eydqVXCMZzglF70bq84tcYu6+fwOz2VjvWxzcXJZ+zpJXsnbVdj5ThJyyjJ/f4Hc+h9KC3mm9/XXNpcGuWfwJlUyjrAAXUQCSABBIAgAAQAALAAAAAAQSQAOf9LKqVNK+b0SWcv8AH3OgOY9MI2SlfNpQXjm/zsRfScfbnqCtB3yWvG5gpYNSkt1tttWtkjPhKO9G11xel5S6K5tNi0Pb3mtNEtEvziYZXUdeE3WwwmzFGKTte2bLCpRjlFItsx+rOW212SSKlW/Q80vaumWakLIrqNndELKGKg8yhUw110NxXje5WSyLSqXHbn54Z05qVrrRroVtqUrq+b624cG+p0GIgiu6ClbmuPE1xyrnzwjmMPBXzZ1Ho5G9RWc1bRx4d+n3NHj8J6uo00rN3XI6b0Vw7lNS/bFWyejya/Opvi5sunYokA1YhBJAAAAQAAIAAFgAAAAAAAEGk9K8M50t6Ku4O/hmvqbsxYqN4TVr3jJW55Aj5ps9tTkl43+C6nU7N1Xll8jm8HFuo3yXhc6XZNB2u37PDmcvI7uKbbZEWsTE8zqJatIw1t1b0r1uWdvIrzmZMZj6UElKau9OLKTxsJaXz0HhUecrKvauYpUrXMlGOj6kY7ERi1mhota6Z6owzMMsZTbftx80W8NKMtGrmkjDKytR6Rxzv0+RvvQOH+zN8d+3wT+pp/SGl7MH13TrPRzCKlh4ZZzSqPu0jowcvI2YANWIQSQAAAEABgQCSALAAAAAAAAB4qzSV3/6eyptL3I/8kP7kVzusbWnFh55zG/rgqsJU6slJNe15pttHWbKd6SsNqbPjVTtG0lpfi7HjYUWoOL1Umjkyy8o75h43paxG9b2bX+hoNqb2blUatq+Gl7d7Z5HU1IZO2prJ4Kym1rJWu1fjf55jDqmc3OvbjlKKlnTnNa33nvWXFRcUdDszDU6kYuF0tUaipgZQlJrJylOWSt7UrXeuuXA6PY6ah7ts73ta5OevynHLr7Tt52pH1ME+CyOP2vtiF9J72nA6/bbco56HDbSwbvdK+d+xXD2ctumv9XSnLebqJt/tzz0ze7Yv4KDUl6qpO/W2dsuBiweHe8pWldZeG9vbva7ZuaGE3pqpa0r3fU2tn45pL+xb29+nS3nd3u+rSOx2XXVSjTkk0t1K3K2X0OW2nFP1LlayctdNFY6XYatQp/9/wC+RbC96U5J9drwANmAQSQAAAEAAAQSQBYAAAAAAAAMWJdot8s/IynmcbprmRlNyxbC+OUrSYCo61Xf3naKatfj2LdONpT/AKr/AAMKwUqbdSj7184vRlyq05ZaM4NPXyst3PT0s7leuZ4sw1cyVZGvnSTd2XYq0THOJ6qVEo3lKMYrVt2RCyltRXpy5nOtZO502M3JQUlLK1+hy1XERlvqMleD/EXxZ8rHCNndGzw1RGpUnqWKFXMmVlYtbdhvUFn7st/vbL6m89D6jlhs+E2vNJmjxM4y3Kcnlu7z6q+h1ex8IqVGEUrNrefd/bJeBpxz7bY8tn8el0AHQ5QgkgAyCSAAAAgAAWAAAAAAAACCSAMdSF9MvqUY1lKU4pZ02ovxSf1Nia2GDcKtaa92o4S67yTT+G6Y8uE1t08PJlvxvpYiQ4ko9HLp3SqtaJXqNO10nndcl1MmIrRUkpNJ9SriNo0433c2teRaRG7fTW7SxM6s3h07Xg5JpcuBzlCKhJp3u3fubzF7Qgp+tpxTqJOOV8l1yNDiNoRu9+2bztdNF4pyY2dthCKeh5pRzKuArXzz14qxch7zI0ytdTsbZlOUYVpJuVrJP3VZtJ2+5vCpsmG7QpL+RPzz+paOrGajjyttAAWVCCSABBJAAgkgAAALAAAAAAAQBJAAEHioezxV08SvJ/Wr8X94rrlxFxVjxWpjjU8zj9vR1phq4aLm5SSeXHNeRhqwhTTcYpc0tH4F6WdytiIp5DuLY1zzxmct2GTko8vE1Naluzblnmze4ygk38uqNNKe8s82nqTuq53rtjjHNtFvZuHdWpGC/c8+i4vyMNLPJZ3ySzu2ddsDZXqYuc/1JK1v4Fy7muGO65OTLUbdK2S0QAOhzBBJAAAAQAABAAAAAZwAAAAAEAAAYcXiY0oSnN+zHzfJLqSMpXq1U5KK4a9zU0PSKNW8YrdembV+6Raw6z1Obnz19XX8bi396uyKdeF+nbUuyK9U5462vlipQ1Ta0uu5gqbWg+Ky6l9Qzs9PkYq+zKMrtwV+drl5WeU16aKptGMm23rfr2OfrYr2rJfmh11fY1FO/q4+V18TUY/CwU47sYrPgi0kZ5W2Lnovhb1abedrz7Jf5aOzNH6N0bOcuSjBfN/Q3h0YenJnewAguoAAAQAAIJIAEEkAALgCwQAAAIAkgGs2vtP1a3IW9Y/KC5vr0Jkt6iLdM20toworPObWUVq+/JHI7X2tOu7OyUXfd/asuL4PuVq+LvK8pNyk3m3dt9CtTkk5J+67+F9e9zoxwkZ3LbxCondXtJcOKNvsfbTpyUar9l5b33OfxUXBp2vblrb+Xn28j3RrRmlmtPBlOTjx5JqtOPly47uPp0J3Sad014MxSWpxWydt1MM913nS5cY9n9DrcHjqdaO9TktM1+5eB5/JxZYe3o8fNjn6eauR73m1kyK0GVKdVqVjJrWxwa3rqSOYrUG6sr6KbNs8RKDdnqjX4WLtKUs222WxrPPWl7Ym1qClOg3u1Izzb92TaWj+GfFM358XwOMlKUqj19bUjL+ZSk5R8m38Drdi+kcqPszvOn39qPZv5HfMOunm3Lt3YK+DxlOtHepyTXxXRrgZyqUkAAACAABAAAgASQALABAAEXNFtba1706L/qmtF0T+pbHG2ot0zbV2woXhSs56OXCHbmzk8ZiteLb8Xfi2Zaztks3yKE3rzOnHGYxlbtUqt3zzeWnBHv1i7r4+J5qy8yrKbvf8RFouzqKUd2XC3HyNdVpuLcovN68E+r5Prx4mVVc+mRO/ndEJTQxKet7rVPVFmjVcPahJprlw6Grqwzyuvp2fD5Exq9+K5S8ufa499UnXp0+B9LGm4Vr5fuSuvFam1ji41fbpyjK3J6dz57JyTe7Z8/8AJRlOcZb0XOMuabT+By5/Hxvrp1YfJynV7fTqlVyby6alH0gxv+mw/s51J3slwS1fxOJjtHEuydWr55+Zhq16l7ylJ922/iUx+Pq91OXyNzUjPstL1bs87q/Vt2uXYtrP8ua7CVFaVrZtPtu5/O3mbFaO3c6o5at4HHypyUqcnFrk/wAuddsz0sTtGuv+8V84/Y4GqrK6Ip4jLXTzQslRLp9joV4VEpQkpRfFM9nyzAbUqUmpU5uL+D6NcUdnsT0lhWtCpaNR5J/sl9mZ3HS8yldAAQVWSQCAJIAAAgkDOYsTiIU4702kvi3yS4sqbV2tToLPOb0ivm+SOUxGNnWlv1HZZ2X0S5GmHHclcstNjtHasqt1dxp/wr3pf1Pguhoq2LbvGOSXIVqt8lwZ4sdMxknTK3bHSbtmzzVf5xMnP8uVK83fIUJR3sl4FTFQaMrq27nitmnf8uUqym619f8A09KoVarMcaxUbBzvkYqkORhjVf5wMyrdQMc6sua/7K/Hg9fiY51Hq4PpuNNeUlf4mSWfHqYJpgYKteTeTn4xX0kYHvO+cvK31LLj5Hhrn+cSmlnrCZcvr5m1w8vZNVAvYedvgWVrNG7TXLyKTklK2Vi7FWl3KuOotO/C4Q9RrJNGaNdx0fUoYpezGS7eRNOrdLsDT6f6Hbe/1EPVVH/uQWT/AI19zpT4psTGypVouDs28n14fGx9e2RtCOIowqx/cs1/DJaoyymmmNXSACqwQAAAAHEbf/Xq/wBb+h4qfT6EA7cfUYX2qrVdzNH6gFlWB8fzkVqgBWpirU18THivd8V/cwClWUquvmUeXYkFEvVPR+JYenh9QCUvXLuvmTW0/ORACFeer7/Q8/w9gCElPVFmnowAisnFd18zNtH3PAAIjXT/AEF/UvkYMPqiAR+p/GTDfrU/+SPzR9N//O/0K3/O/wC1AFcvS2Pt1ZBIM10AAAAAP//Z',
-    bio='Looking to prove myself.'
-)
-
-db.session.add_all([u1, u2, u3, u4, u5, u6])
-db.session.commit()
-
-port1 = Portfolio(
-    name="rabbit",
-    user_id=1,
-    cash=79.36,
-    created_at=datetime(2022, 5, 6, 8, 10, 10, 10)
-)
-
-port2 = Portfolio(
-    name="tortoise",
-    user_id=1,
-    cash=42.22,
-    created_at=datetime(2022, 6, 12, 8, 10, 10, 10)
-)
-
-port3 = Portfolio(
-    name="my_first",
-    user_id=2,
-    cash=78.87,
-    created_at=datetime.strptime("2022-07-07", "%Y-%m-%d")
-)
-
-port4 = Portfolio(
-    name="professional",
-    user_id=3,
-    cash=273.14,
-    created_at=datetime(2022, 7, 9, 8, 10, 10, 10)
-)
-
-port5 = Portfolio(
-    name="ultimate",
-    user_id=4,
-    cash=78.04,
-    created_at=datetime.strptime("2022-09-01", "%Y-%m-%d")
-)
-
-port6 = Portfolio(
-    name="unnamed",
-    user_id=5,
-    created_at=datetime.strptime("2022-09-04", "%Y-%m-%d")
-)
-
-port7 = Portfolio(
-    name="business",
-    user_id=6,
-    cash=8.32,
-    created_at=datetime.strptime("2022-09-06", "%Y-%m-%d")
-)
-
-port8 = Portfolio(
-    name="dragon_fire",
-    user_id=4,
-    cash=441,
-    created_at=datetime(2022, 9, 17, 8, 10, 10, 10)
-)
-
-port9 = Portfolio(
-    name="my_second",
-    user_id=2,
-    cash=381.11,
-    created_at=datetime(2022, 9, 23, 8, 10, 10, 10)
-
-)
-
-port10 = Portfolio(
-    name="personal",
-    user_id=6,
-    cash=119.80,
-    created_at=datetime(2022, 11, 13, 8, 10, 10, 10)
-)
-
-db.session.add_all([port1, port2, port3, port4, port5,
-                    port6, port7, port8, port9, port10])
-db.session.commit()
-
-s1 = Stock(
-    symbol="AMZN",
-    price=159.00,
-    quantity=10,
-    portfolio_id=1
-)
-
-s2 = Stock(
-    symbol="IBM",
-    price=129.13,
-    quantity=10,
-    portfolio_id=1
-)
-
-s3 = Stock(
-    symbol="AAPL",
-    price=154.51,
-    quantity=10,
-    portfolio_id=1
-)
-
-s4 = Stock(
-    symbol="MSFT",
-    price=269.50,
-    quantity=10,
-    portfolio_id=1
-)
-
-s5 = Stock(
-    symbol="GOOG",
-    price=114.58,
-    quantity=10,
-    portfolio_id=1
-)
-
-s6 = Stock(
-    symbol="PEP",
-    price=164.85,
-    quantity=9,
-    portfolio_id=2
-)
-
-s7 = Stock(
-    symbol="COKE",
-    price=603,
-    quantity=9,
-    portfolio_id=2
-)
-
-s8 = Stock(
-    symbol="PG",
-    price=145.89,
-    quantity=9,
-    portfolio_id=2
-)
-
-s9 = Stock(
-    symbol="O",
-    price=67.36,
-    quantity=9,
-    portfolio_id=2
-)
-
-s10 = Stock(
-    symbol="WMT",
-    price=125.32,
-    quantity=9,
-    portfolio_id=2
-)
-
-s11 = Stock(
-    symbol="TSLA",
-    price=244.54,
-    quantity=12,
-    portfolio_id=3
-)
-
-s12 = Stock(
-    symbol="NFLX",
-    price=189.27,
-    quantity=12,
-    portfolio_id=3
-)
-
-s13 = Stock(
-    symbol="AMZN",
-    price=116.33,
-    quantity=12,
-    portfolio_id=3
-)
-
-s14 = Stock(
-    symbol="GOOG",
-    price=118.78,
-    quantity=12,
-    portfolio_id=3
-)
-
-s15 = Stock(
-    symbol="META",
-    price=172.19,
-    quantity=11,
-    portfolio_id=3
-)
-
-s16 = Stock(
-    symbol="XON",
-    price=88.95,
-    quantity=11,
-    portfolio_id=4
-)
-
-s17 = Stock(
-    symbol="WMT",
-    price=125.4,
-    quantity=11,
-    portfolio_id=4
-)
-
-s18 = Stock(
-    symbol="AMZN",
-    price=116.33,
-    quantity=11,
-    portfolio_id=4
-)
-
-s19 = Stock(
-    symbol="GOOG",
-    price=118.78,
-    quantity=11,
-    portfolio_id=4
-)
-
-s20 = Stock(
-    symbol="INR",
-    price=2391.4,
-    quantity=2,
-    portfolio_id=4
-)
-
-s21 = Stock(
-    symbol="TSLA",
-    price=275.61,
-    quantity=36,
-    portfolio_id=5
-)
-
-s22 = Stock(
-    symbol="WMT",
-    price=133,
-    quantity=24,
-    portfolio_id=7
-)
-
-s23 = Stock(
-    symbol="AMZN",
-    price=127.51,
-    quantity=24,
-    portfolio_id=7
-)
-
-s24 = Stock(
-    symbol="AAPL",
-    price=155.81,
-    quantity=24,
-    portfolio_id=7
-)
-
-s25 = Stock(
-    symbol="XOM",
-    price=95.59,
-    quantity=100,
-    portfolio_id=8
-)
-
-s26 = Stock(
-    symbol="WMT",
-    price=133.39,
-    quantity=15,
-    portfolio_id=9
-)
-
-s27 = Stock(
-    symbol="AMZN",
-    price=117.31,
-    quantity=15,
-    portfolio_id=9
-)
-
-s28 = Stock(
-    symbol="APPL",
-    price=152.74,
-    quantity=15,
-    portfolio_id=9
-)
-
-s29 = Stock(
-    symbol="CVS",
-    price=99.83,
-    quantity=15,
-    portfolio_id=9
-)
-
-s30 = Stock(
-    symbol="UNH",
-    price=517.46,
-    quantity=4,
-    portfolio_id=9
-)
-
-s31 = Stock(
-    symbol="APPL",
-    price=149.7,
-    quantity=66,
-    portfolio_id=10
-)
-
-db.session.add_all([s1, s2, s3, s4, s5, s6, s7, s8, s9, s10, s11, s12, s13, s14, s15,
-                    s16, s17, s18, s19, s20, s21, s22, s23, s24, s25, s26, s27, s28, s29, s30, s31])
-db.session.commit()
+if __name__ == '__main__':
+    main()
@@ -27,3 +27,91 @@ function stockMath(quantity, price) {
   
   return total;
 }
+
+$("#search input[name=query]").on("input", async function (event) {
+  let query = event.target.value.trim();
+  if (!query) {
+    return $("#username-options").empty();
+  }
+  let res = await axios.get("/search/autocomplete", { params: { q: query } });
+  let options = res.data.map((user) => $("<option>").val(user.username));
+  $("#username-options").empty().append(options);
+});
+
+async function drawHistory(canvas) {
+  let id = $(canvas).data("portfolio");
+  let res = await axios.get(`/portfolios/${id}/history`);
+  let values = res.data.net_worth;
+  if (values.length < 2) {
+    return $(canvas).hide();
+  }
+  let ctx = canvas.getContext("2d");
+  let low = Math.min(...values);
+  let high = Math.max(...values);
+  let span = high - low || 1;
+  let x = (i) => (i / (values.length - 1)) * (canvas.width - 20) + 10;
+  let y = (v) => canvas.height - 10 - ((v - low) / span) * (canvas.height - 20);
+  ctx.strokeStyle = "#73f59b";
+  ctx.lineWidth = 2;
+  ctx.beginPath();
+  values.forEach((v, i) => (i ? ctx.lineTo(x(i), y(v)) : ctx.moveTo(x(i), y(v))));
+  ctx.stroke();
+}
+
+$("#history-chart").each(function () {
+  drawHistory(this);
+});
+
+function liveUpdates() {
+  let symbols = new Set();
+  let portfolios = new Set();
+  $("[data-live-price]").each(function () {
+    symbols.add($(this).data("live-price"));
+  });
+  $("[data-live-net-worth]").each(function () {
+    portfolios.add($(this).data("live-net-worth"));
+  });
+  // Streams are only opened where a stream process is deployed (STREAM_URL).
+  let url = $("body").data("stream-url");
+  if (!url || !window.EventSource || (!symbols.size && !portfolios.size)) {
+    return;
+  }
+  let params = new URLSearchParams({
+    symbols: [...symbols].join(","),
+    portfolios: [...portfolios].join(","),
+  });
+  let source = new EventSource(`${url}?${params}`);
+
+  // A refused stream (503 at the stream limit) closes for good; the page
+  // simply keeps the prices it was rendered with.
+
+  source.addEventListener("quote", function (event) {
+    let quote = JSON.parse(event.data);
+    let symbol = quote.symbol;
+    $(`[data-live-price="${symbol}"]`).text(`$${quote.price.toFixed(2)}`);
+    $(`[data-live-total="${symbol}"]`).each(function () {
+      let total = stockMath($(this).data("quantity"), quote.price);
+      $(this).text(`$${total.toFixed(2)}`);
+    });
+    // Keep the edit page's hidden inputs current so cash math uses the new price.
+    let price = $(`#${symbol}-price`);
+    if (price.length) {
+      price.val(quote.price);
+      let total = stockMath($(`#${symbol}`).val(), quote.price);
+      $(`#${symbol}-hiddenTotal`).val(total);
+      $(`#${symbol}-total`).text(`$${total}`);
+    }
+  });
+
+  source.addEventListener("net_worth", function (event) {
+    let change = JSON.parse(event.data);
+    if (change.net_worth === null) {
+      return;
+    }
+    $(`[data-live-net-worth="${change.portfolio}"]`).text(
+      `$${change.net_worth.toFixed(2)}`
+    );
+  });
+}
+
+liveUpdates();
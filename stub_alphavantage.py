@@ -0,0 +1,201 @@
+"""Local stand-in for the Alpha Vantage API.
+
+Serves GLOBAL_QUOTE and TIME_SERIES_DAILY with deterministic prices so
+the quote client, the refresh job and the routes can be exercised
+offline.  Latency, server errors, hung responses and the per-minute call
+budget are configurable:
+
+    python stub_alphavantage.py --port 8099 --latency 0.2 --error-rate 0.05
+
+and point the app at it with API_BASE_URL=http://127.0.0.1:8099/query.
+"""
+
+import argparse
+import datetime
+import json
+import random
+import threading
+import time
+import zlib
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+
+class StubState:
+    """Behaviour knobs and call counters shared by the handler threads."""
+
+    def __init__(self, latency=0.0, error_rate=0.0, hang_rate=0.0,
+                 hang_seconds=30.0, calls_per_minute=None, seed=None):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.hang_rate = hang_rate
+        self.hang_seconds = hang_seconds
+        self.calls_per_minute = calls_per_minute
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.recent = deque()
+        self.calls = 0
+        self.throttled = 0
+        self.errors = 0
+
+    def throttle(self):
+        """Record a call and report whether it is over the minute budget."""
+
+        now = time.monotonic()
+        with self.lock:
+            self.calls += 1
+            while self.recent and now - self.recent[0] >= 60:
+                self.recent.popleft()
+            if (self.calls_per_minute is not None
+                    and len(self.recent) >= self.calls_per_minute):
+                self.throttled += 1
+                return True
+            self.recent.append(now)
+            return False
+
+    def roll(self, rate):
+        with self.lock:
+            return self.random.random() < rate
+
+    def stats(self):
+        with self.lock:
+            return {'calls': self.calls, 'throttled': self.throttled,
+                    'errors': self.errors}
+
+
+def stub_price(symbol, day=None):
+    """Deterministic price for `symbol`, drifting a little each day."""
+
+    day = day or time.strftime('%Y-%m-%d')
+    base = 20 + zlib.crc32(symbol.encode()) % 480
+    drift = (zlib.crc32(f"{symbol}{day}".encode()) % 1000 - 500) / 10000
+    return round(base * (1 + drift), 4)
+
+
+def last_trading_day(today=None):
+    day = today or datetime.date.today()
+    while day.weekday() >= 5:
+        day -= datetime.timedelta(days=1)
+    return day
+
+
+def global_quote(symbol):
+    if not symbol.isalpha() or len(symbol) > 5:
+        return {"Global Quote": {}}
+    day = last_trading_day().isoformat()
+    price = stub_price(symbol, day)
+    return {"Global Quote": {
+        "01. symbol": symbol,
+        "05. price": f"{price:.4f}",
+        "07. latest trading day": day,
+    }}
+
+
+def daily_series(symbol, outputsize='compact'):
+    if not symbol.isalpha() or len(symbol) > 5:
+        return {"Error Message": "Invalid API call."}
+    days = 100 if outputsize == 'compact' else 2500
+    today = datetime.date.today()
+    series = {}
+    day = today
+    while len(series) < days:
+        if day.weekday() < 5:
+            close = stub_price(symbol, day.isoformat())
+            series[day.isoformat()] = {"4. close": f"{close:.4f}"}
+        day -= datetime.timedelta(days=1)
+    return {"Meta Data": {"2. Symbol": symbol},
+            "Time Series (Daily)": series}
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    state = None
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        state = self.state
+        url = urlparse(self.path)
+        if url.path == '/stats':
+            return self._send(200, state.stats())
+
+        params = {k: v[0] for k, v in parse_qs(url.query).items()}
+        if state.latency:
+            time.sleep(state.latency)
+        if state.throttle():
+            return self._send(200, {"Note": (
+                "Thank you for using Alpha Vantage! Our standard API call "
+                "frequency is 5 calls per minute.")})
+        if state.roll(state.hang_rate):
+            time.sleep(state.hang_seconds)
+        if state.roll(state.error_rate):
+            with state.lock:
+                state.errors += 1
+            return self._send(503, {"error": "stub failure"})
+
+        function = params.get('function')
+        if function == 'GLOBAL_QUOTE':
+            return self._send(200, global_quote(params.get('symbol', '')))
+        if function == 'TIME_SERIES_DAILY':
+            return self._send(200, daily_series(params.get('symbol', ''),
+                                                params.get('outputsize')))
+        return self._send(200, {"Error Message":
+                                f"Invalid API call: {function}"})
+
+
+def serve(host='127.0.0.1', port=0, **options):
+    """Start a stub server on a background thread.
+
+    Returns the server and its state; the base URL for the quote client
+    is f"http://{host}:{server.server_port}/query".
+    """
+
+    state = StubState(**options)
+    handler = type('Handler', (StubHandler,), {'state': state})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, state
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8099)
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help="seconds to wait before every response")
+    parser.add_argument('--error-rate', type=float, default=0.0,
+                        help="fraction of calls answered with HTTP 503")
+    parser.add_argument('--hang-rate', type=float, default=0.0,
+                        help="fraction of calls that stall for --hang-seconds")
+    parser.add_argument('--hang-seconds', type=float, default=30.0)
+    parser.add_argument('--calls-per-minute', type=int, default=None,
+                        help="answer with a throttle Note past this budget")
+    args = parser.parse_args()
+
+    server, state = serve(args.host, args.port, latency=args.latency,
+                          error_rate=args.error_rate, hang_rate=args.hang_rate,
+                          hang_seconds=args.hang_seconds,
+                          calls_per_minute=args.calls_per_minute)
+    print(f"Stub Alpha Vantage on "
+          f"http://{args.host}:{server.server_port}/query")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
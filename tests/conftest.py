@@ -0,0 +1,13 @@
+import os
+import sys
+import tempfile
+
+# The app reads its configuration at import time, so point it at a
+# throwaway SQLite database before any test module imports it.
+os.environ['DATABASE_URI'] = (
+    f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'test.db')}")
+os.environ.setdefault('SECRET_KEY', 'test')
+os.environ.setdefault('API_KEY', 'test')
+os.environ.setdefault('BCRYPT_ROUNDS', '4')
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,81 @@
+"""Profile and portfolio pages run a fixed number of SQL statements,
+however many portfolios or holdings they show."""
+
+import datetime
+
+import pytest
+from sqlalchemy import event
+
+from app import app, CURR_USER_KEY
+from models import db, User, Portfolio, Stock, Quote
+
+SIZES = (1, 5, 25)
+WARM_UP = 2
+
+
+@pytest.fixture(scope='module')
+def data():
+    """{size: (user_id, portfolio_id)}: a user with `size` portfolios of
+    `size` holdings each."""
+
+    today = datetime.date.today()
+    out = {}
+    with app.app_context():
+        db.session.add_all(Quote(symbol=f"S{i}", price=10.0 + i,
+                                 update_date=today)
+                           for i in range(max(SIZES)))
+        for size in (WARM_UP,) + SIZES:
+            user = User(email=f"n{size}@example.com", username=f"n{size}",
+                        password='unused')
+            db.session.add(user)
+            db.session.flush()
+            for p in range(size):
+                portfolio = Portfolio(name=f"n{size}-{p}", user_id=user.id)
+                portfolio.stocks = [Stock(symbol=f"S{i}", quantity=i + 1)
+                                    for i in range(size)]
+                db.session.add(portfolio)
+            db.session.flush()
+            out[size] = (user.id, portfolio.id)
+        db.session.commit()
+    return out
+
+
+@pytest.fixture
+def client():
+    client = app.test_client()
+    with app.app_context():
+        user = User.query.first()
+    with client.session_transaction() as session:
+        session[CURR_USER_KEY] = user.id
+    return client
+
+
+def statements(client, url):
+    """Number of SQL statements run while serving GET `url`."""
+
+    executed = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        executed.append(statement)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', record)
+    try:
+        response = client.get(url)
+    finally:
+        event.remove(engine, 'before_cursor_execute', record)
+    assert response.status_code == 200, url
+    return len(executed)
+
+
+@pytest.mark.parametrize('page', [
+    lambda user_id, port_id: f"/user/{user_id}",
+    lambda user_id, port_id: f"/portfolios/{port_id}",
+    lambda user_id, port_id: f"/portfolios/{port_id}/edit",
+], ids=['profile', 'portfolio', 'edit'])
+def test_statements_do_not_grow_with_rows(data, client, page):
+    # Warm per-process state (leaderboard, caches) before counting.
+    statements(client, page(*data[WARM_UP]))
+    counts = {size: statements(client, page(*data[size])) for size in SIZES}
+    assert len(set(counts.values())) == 1, counts
@@ -0,0 +1,28 @@
+from refresh import api_bucket
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+def test_api_bucket_stays_within_budget_in_every_minute():
+    clock = FakeClock()
+    bucket = api_bucket(5, clock=clock, sleep=clock.sleep)
+    calls = []
+    for _ in range(30):
+        bucket.acquire()
+        calls.append(clock.now)
+
+    # Every window (t - 60, t] ending at a call holds at most 5 calls.
+    for end in calls:
+        in_window = [t for t in calls if end - 60 < t <= end]
+        assert len(in_window) <= 5
+    assert calls[-1] < 30 * 12
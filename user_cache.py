@@ -0,0 +1,52 @@
+"""Short-lived cache of usernames by user id, for the current-user layer.
+
+Every request needs the logged-in user's name, so it is read with one
+narrow primary-key lookup and kept for USER_CACHE_TTL seconds.  Editing or
+deleting a user evicts its entry in the acting process; other processes
+pick the change up when their entry expires, so a renamed or deleted user
+is never shown stale for longer than the TTL.
+"""
+
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from models import db, User
+
+
+class UserCache:
+
+    def __init__(self, maxsize=4096, ttl=30, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def username(self, user_id):
+        """Current username for `user_id`, or None if the user is gone."""
+
+        now = self.clock()
+        with self.lock:
+            entry = self.entries.get(user_id)
+        if entry is not None and now - entry[1] < self.ttl:
+            return entry[0]
+        username = db.session.execute(
+            db.select(User.username).where(User.id == user_id)).scalar()
+        with self.lock:
+            self.entries[user_id] = (username, now)
+            self.entries.move_to_end(user_id)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        return username
+
+    def evict(self, user_id):
+        with self.lock:
+            self.entries.pop(user_id, None)
+
+
+user_cache = UserCache(
+    maxsize=int(os.environ.get('USER_CACHE_SIZE', 4096)),
+    ttl=float(os.environ.get('USER_CACHE_TTL', 30)),
+)
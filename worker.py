@@ -0,0 +1,127 @@
+"""Background job scheduler, run as its own process instead of in web workers.
+
+    python worker.py        # or: flask worker
+
+Runs the nightly quote refresh at 00:01.  Any number of workers may run:
+before a job starts its worker takes the job's row in job_leases, renews
+it every third of WORKER_LEASE_SECONDS while the job runs and releases it
+at the end, so one copy runs cluster-wide.  A worker that cannot renew
+its lease stops the refresh between symbols.  If a worker dies its lease
+expires and the next worker to start resumes today's unfinished refresh
+from its checkpoint.
+
+Job durations and failures are recorded in this process; set
+WORKER_METRICS_PORT to serve them in the /metrics format.
+"""
+
+import datetime
+import os
+import socket
+import threading
+import time
+import uuid
+
+from apscheduler.schedulers.blocking import BlockingScheduler
+from flask_apscheduler import APScheduler
+from werkzeug.serving import make_server
+
+import metrics
+from app import app
+from models import JobLease, RefreshRun
+from refresh import QuoteRefresher
+
+LEASE_SECONDS = int(os.environ.get('WORKER_LEASE_SECONDS', 300))
+# A lease not renewed for this long is given up before it can expire, so
+# the job stops while no other worker can have taken it yet.
+LOST_AFTER = LEASE_SECONDS * 2 / 3
+METRICS_PORT = os.environ.get('WORKER_METRICS_PORT')
+
+HOST = f"{socket.gethostname()}:{os.getpid()}"
+
+scheduler = APScheduler(BlockingScheduler())
+
+
+def run_exclusive(name, fn):
+    """Run fn(lost) under the `name` lease; skip it if another worker holds it.
+
+    `lost` is a threading.Event set once the lease can no longer be
+    relied on: another worker took it, or renewals kept failing for
+    LOST_AFTER, a third of the lease short of expiry; fn must check it and
+    stop writing.
+    """
+
+    owner = f"{HOST}:{uuid.uuid4().hex[:8]}"
+    with app.app_context():
+        if not JobLease.acquire(name, owner, LEASE_SECONDS):
+            app.logger.info("%s is running on another worker", name)
+            return False
+
+    stop = threading.Event()
+    lost = threading.Event()
+
+    def renew():
+        renewed = time.monotonic()
+        while not stop.wait(LEASE_SECONDS / 3):
+            try:
+                with app.app_context():
+                    if JobLease.acquire(name, owner, LEASE_SECONDS):
+                        renewed = time.monotonic()
+                        continue
+                app.logger.error("Lost the %s lease to another worker", name)
+            except Exception as e:
+                app.logger.warning("Could not renew the %s lease: %s", name, e)
+                if time.monotonic() - renewed < LOST_AFTER:
+                    continue
+                app.logger.error("Giving up the %s lease, unrenewed for %ds",
+                                 name, time.monotonic() - renewed)
+            lost.set()
+            return
+
+    heartbeat = threading.Thread(target=renew, daemon=True,
+                                 name=f'{name}-lease')
+    heartbeat.start()
+    try:
+        with app.app_context(), metrics.job(name):
+            fn(lost)
+    finally:
+        stop.set()
+        heartbeat.join()
+        with app.app_context():
+            JobLease.release(name, owner)
+    return True
+
+
+@scheduler.task('cron', id='refresh_quotes', hour=0, minute=1,
+                misfire_grace_time=3600, coalesce=True)
+def refresh_quotes():
+    app.logger.info("Refreshing quotes")
+    run_exclusive('refresh_quotes',
+                  lambda lost: QuoteRefresher(stop=lost).run())
+
+
+def serve_metrics(port):
+    def metrics_app(environ, start_response):
+        start_response('200 OK',
+                       [('Content-Type', 'text/plain; version=0.0.4')])
+        return [metrics.registry.render().encode()]
+
+    server = make_server('0.0.0.0', port, metrics_app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True,
+                     name='worker-metrics').start()
+
+
+def main():
+    app.logger.setLevel('INFO')
+    if METRICS_PORT:
+        serve_metrics(int(METRICS_PORT))
+    with app.app_context():
+        unfinished = RefreshRun.unfinished(datetime.date.today())
+    if unfinished is not None:
+        scheduler.add_job('resume_refresh_quotes', refresh_quotes,
+                          trigger='date')
+    scheduler.init_app(app)
+    scheduler.start()
+
+
+if __name__ == '__main__':
+    main()